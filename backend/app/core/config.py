@@ -7,6 +7,36 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     DATABASE_URL: str = "sqlite+aiosqlite:///./backend_db.sqlite"
+    SQLITE_PROFILE: str = "wal"
+    SQLITE_BUSY_TIMEOUT_MS: int | None = None
+    SQLITE_WAL_CHECKPOINT_INTERVAL_SECONDS: int = 60
+    LOG_FORMAT: str = "text"
+    LOG_SAMPLE_RATES: dict[str, float] = {}
+    SQL_QUERY_BUDGET: int = 0
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+    SQL_STRICT_MODE: bool = False
+    IMPORT_CHUNK_SIZE: int = 500
+    IMPORT_MAX_REPORTED_ERRORS: int = 1000
+    DASHBOARD_RECOMPUTE_INTERVAL_SECONDS: int = 900
+    EVENT_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+    METRICS_TOKEN: str | None = None
+    USER_CACHE_MAX_ENTRIES: int = 1024
+    USER_CACHE_TTL_SECONDS: int = 60
+    REPORT_CACHE_MAX_ENTRIES: int = 256
+    REPORT_CACHE_TTL_SECONDS: int = 300
+    REPORT_CACHE_MAX_STALE_SECONDS: int = 30
+    SYNC_PAGE_SIZE: int = 500
+    SYNC_SETTLE_SECONDS: float = 5.0
+    EVENT_STREAM_MAX_PENDING: int = 100
+    EVENT_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    EVENT_STREAM_DASHBOARD_DEBOUNCE_SECONDS: float = 0.5
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    AUDIT_BATCH_SIZE: int = 200
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_QUEUE_MAX_SIZE: int = 10000
+    ACTIVITY_LOG_RETENTION_DAYS: int = 90
+    ACTIVITY_LOG_ARCHIVE_DIR: str = "./archive/activity_logs"
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,37 @@
+from typing import Callable
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.session import get_db
+from app.services.data_versions import get_data_versions
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def etag_for(versions: tuple[int, ...]) -> str:
+    return '"' + "-".join(str(version) for version in versions) + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match uses the weak comparison, so a W/ prefix does not prevent a match.
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == etag
+        for candidate in (value.strip() for value in if_none_match.split(","))
+    )
+
+
+def versioned_etag(*tables: str) -> Callable:
+    # Declare after the auth dependency (route-level dependencies run before the endpoint's
+    # parameters, so list auth first there too): the 304 is raised before the endpoint runs,
+    # so neither its query nor the serialization happens for an unchanged resource. The
+    # headers are returned for endpoints that build their own Response.
+    async def check_etag(request: Request, response: Response, db: AsyncSession = Depends(get_db)) -> dict[str, str]:
+        etag = etag_for(await get_data_versions(db, tables))
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+        return headers
+
+    return check_etag
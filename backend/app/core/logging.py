@@ -1,6 +1,67 @@
+import atexit
+import copy
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from app.core.config import settings
+
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+_exception_formatter = logging.Formatter()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        entry.update((key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    # Keeps a fixed fraction of the records at each configured level, spread evenly
+    # rather than randomly so low rates still let the first record through.
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = {logging.getLevelName(level.upper()): rate for level, rate in rates.items()}
+        self.credit = {level: 1.0 - rate for level, rate in self.rates.items()}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelno)
+        if rate is None or rate >= 1:
+            return True
+        credit = self.credit[record.levelno] + rate
+        if credit >= 1:
+            self.credit[record.levelno] = credit - 1
+            return True
+        self.credit[record.levelno] = credit
+        return False
+
+
+class _QueueHandler(QueueHandler):
+    # Only the message arguments and traceback are resolved on the calling thread, since
+    # they may reference objects that change later; timestamps, formatting and file I/O
+    # happen on the listener thread.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 
 def setup_logging():
@@ -12,9 +73,12 @@ def setup_logging():
     logger = logging.getLogger("app")
     logger.setLevel(logging.INFO)
     
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    if settings.LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
     
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -28,10 +92,34 @@ def setup_logging():
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
     
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    queue_handler = _QueueHandler(queue.SimpleQueue())
+    if settings.LOG_SAMPLE_RATES:
+        queue_handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_RATES))
+    
+    listener = QueueListener(queue_handler.queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
     
-    return logger
+    logger.addHandler(queue_handler)
+    
+    return logger, queue_handler, listener
+
+
+logger, _queue_handler, _listener = setup_logging()
+
+
+def stop_logging():
+    # Drains the queue, then attaches the handlers directly so anything logged later in
+    # the process is still written.
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    logger.removeHandler(_queue_handler)
+    for log_filter in _queue_handler.filters:
+        logger.addFilter(log_filter)
+    for handler in _listener.handlers:
+        logger.addHandler(handler)
+    _listener = None
 
 
-logger = setup_logging()
+atexit.register(stop_logging)
@@ -0,0 +1,307 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Iterable
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.cache import get_cache_stats
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+
+class HistogramChild:
+    __slots__ = ("upper_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, upper_bounds: tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.bucket_counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: list = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            metric.render(lines)
+        lines.append("")
+        return "\n".join(lines)
+
+
+registry = MetricsRegistry()
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), metrics: MetricsRegistry = registry):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        metrics.register(self)
+
+    @abstractmethod
+    def render(self, lines: list[str]):
+        ...
+
+
+class LabeledMetric(Metric):
+    # Values are held in one child per label set.
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), metrics: MetricsRegistry = registry):
+        super().__init__(name, documentation, labelnames, metrics)
+        self.children: dict[tuple, object] = {}
+
+    @abstractmethod
+    def new_child(self):
+        ...
+
+    def labels(self, *values):
+        # Meant to be called once per label set while wiring things up; hot paths keep the child.
+        child = self.children.get(values)
+        if child is None:
+            child = self.children[values] = self.new_child()
+        return child
+
+    def render(self, lines: list[str]):
+        for values, child in self.children.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}")
+
+
+class Counter(LabeledMetric):
+    kind = "counter"
+
+    def new_child(self) -> CounterChild:
+        return CounterChild()
+
+
+class Gauge(LabeledMetric):
+    kind = "gauge"
+
+    def new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+
+class Histogram(LabeledMetric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = LATENCY_BUCKETS, metrics: MetricsRegistry = registry):
+        super().__init__(name, documentation, labelnames, metrics)
+        self.buckets = tuple(sorted(buckets))
+
+    def new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def render(self, lines: list[str]):
+        names = (*self.labelnames, "le")
+        for values, child in self.children.items():
+            cumulative = 0
+            for upper_bound, count in zip((*child.upper_bounds, float("inf")), child.bucket_counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(names, (*values, _format_value(upper_bound)))} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+
+
+class CallbackMetric(Metric):
+    # Values owned elsewhere (cache counters, queue sizes) are read at scrape time.
+    def __init__(self, name: str, documentation: str, kind: str, labelnames: tuple[str, ...], collect: Callable[[], Iterable[tuple[tuple, float]]], metrics: MetricsRegistry = registry):
+        super().__init__(name, documentation, labelnames, metrics)
+        self.kind = kind
+        self.collect = collect
+
+    def render(self, lines: list[str]):
+        for values, value in self.collect():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}")
+
+
+def _cache_samples(key: str):
+    def collect():
+        return [((name,), stats[key]) for name, stats in get_cache_stats().items() if stats[key] is not None]
+    return collect
+
+
+http_requests_total = Counter("http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status"))
+http_request_duration_seconds = Histogram("http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route"))
+http_requests_in_flight = Gauge("http_requests_in_flight", "HTTP requests currently being served.").labels()
+db_pool_checkout_seconds = Histogram("db_pool_checkout_seconds", "Time spent waiting for a database connection.", buckets=WAIT_BUCKETS).labels()
+db_pool_checked_out = Gauge("db_pool_checked_out", "Database connections currently checked out.").labels()
+event_loop_lag_seconds = Histogram("event_loop_lag_seconds", "Delay of a scheduled event loop wake-up.", buckets=WAIT_BUCKETS).labels()
+CallbackMetric("cache_hits_total", "In-process cache hits.", "counter", ("cache",), _cache_samples("hits"))
+CallbackMetric("cache_misses_total", "In-process cache misses.", "counter", ("cache",), _cache_samples("misses"))
+CallbackMetric("cache_hit_ratio", "In-process cache hit ratio since startup.", "gauge", ("cache",), _cache_samples("hit_ratio"))
+CallbackMetric("cache_entries", "Entries held by in-process caches.", "gauge", ("cache",), _cache_samples("entries"))
+
+
+class RouteMetrics:
+    __slots__ = ("method", "route", "duration", "responses")
+
+    def __init__(self, method: str, route: str, expected_status: int = 200):
+        self.method = method
+        self.route = route
+        self.duration = http_request_duration_seconds.labels(method, route)
+        self.responses: dict[int, CounterChild] = {}
+        self.response_counter(expected_status)
+
+    def response_counter(self, status_code: int) -> CounterChild:
+        counter = self.responses.get(status_code)
+        if counter is None:
+            counter = self.responses[status_code] = http_requests_total.labels(self.method, self.route, str(status_code))
+        return counter
+
+
+class HttpMetrics:
+    # Children are looked up by the route's own path and method strings, so a request
+    # never builds a label tuple; Starlette routes define __eq__ and are not hashable.
+    def __init__(self):
+        self.routes: dict[str, dict[str, RouteMetrics]] = {}
+
+    def register_routes(self, routes: Iterable):
+        for route in routes:
+            methods = getattr(route, "methods", None)
+            if not methods:
+                continue
+            by_method = self.routes.setdefault(route.path, {})
+            for method in methods:
+                if method not in by_method:
+                    by_method[method] = RouteMetrics(method, route.path, getattr(route, "status_code", None) or 200)
+
+    def for_request(self, path: str, method: str) -> RouteMetrics:
+        by_method = self.routes.get(path)
+        if by_method is None:
+            by_method = self.routes[path] = {}
+        route_metrics = by_method.get(method)
+        if route_metrics is None:
+            route_metrics = by_method[method] = RouteMetrics(method, path)
+        return route_metrics
+
+
+http_metrics = HttpMetrics()
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            # The router stores the matched route in the scope; requests that match nothing
+            # share one child so unknown paths cannot grow the label set.
+            route = scope.get("route")
+            route_metrics = http_metrics.for_request(route.path if route is not None else "unmatched", scope["method"])
+            route_metrics.response_counter(status_code).inc()
+            route_metrics.duration.observe(time.perf_counter() - started_at)
+
+
+def instrument_pool(engine: AsyncEngine):
+    # Pool events only fire once a connection has been handed out, so the wait is timed
+    # around Pool.connect. Engine.dispose() recreates the pool through its class, which
+    # keeps the timing subclass in place.
+    pool = engine.sync_engine.pool
+    base_class = type(pool)
+
+    class TimedPool(base_class):
+        def connect(self):
+            started_at = time.perf_counter()
+            try:
+                return super().connect()
+            finally:
+                db_pool_checkout_seconds.observe(time.perf_counter() - started_at)
+
+    TimedPool.__name__ = f"Timed{base_class.__name__}"
+    pool.__class__ = TimedPool
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        db_pool_checked_out.inc()
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        db_pool_checked_out.dec()
+
+
+async def run_event_loop_lag_monitor(interval_seconds: float):
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled_at = loop.time() + interval_seconds
+        await asyncio.sleep(interval_seconds)
+        event_loop_lag_seconds.observe(max(loop.time() - scheduled_at, 0.0))
+
+
+def render_metrics() -> str:
+    return registry.render()
@@ -0,0 +1,103 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import settings
+from app.core.logging import logger
+
+_IN_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_current_stats: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def fingerprint(statement: str) -> str:
+    # selectinload batches render a variable number of placeholders; fold them so the
+    # same query for a different page of parents still counts as a repeat.
+    return _IN_LIST.sub("(?...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.total_seconds += elapsed
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [(statement, count) for statement, count in self.fingerprints.most_common() if count >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_seconds * 1000:.1f};desc="queries={self.count}"'
+
+
+def instrument_engine(engine: AsyncEngine):
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def record_query(conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info["query_started_at"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - started_at)
+
+
+class QueryStatsMiddleware:
+    # Pure ASGI so the stats object lives in the request's own context; handlers and
+    # SQLAlchemy's greenlets see the same instance through the context variable.
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start":
+                check_query_stats(scope, stats, message["status"])
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (b"server-timing", stats.server_timing().encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+
+
+def check_query_stats(scope: dict, stats: QueryStats, status_code: int):
+    request = f"{scope['method']} {scope['path']}"
+    repeated = stats.repeated_statements(settings.SQL_N_PLUS_ONE_THRESHOLD)
+    over_budget = settings.SQL_QUERY_BUDGET > 0 and stats.count > settings.SQL_QUERY_BUDGET
+    db_ms = round(stats.total_seconds * 1000, 1)
+    logger.info(
+        f"{request} {status_code} queries={stats.count} db={db_ms}ms",
+        extra={"method": scope["method"], "path": scope["path"], "status": status_code, "queries": stats.count, "db_ms": db_ms}
+    )
+
+    problems = []
+    if over_budget:
+        problems.append(f"{stats.count} queries exceed the budget of {settings.SQL_QUERY_BUDGET}")
+    for statement, count in repeated:
+        problems.append(f"possible N+1, {count}x: {statement[:200]}")
+    for problem in problems:
+        logger.warning(f"{request}: {problem}")
+    if problems and settings.SQL_STRICT_MODE:
+        raise QueryBudgetExceeded(f"{request}: {'; '.join(problems)}")
@@ -1,19 +1,46 @@
+import asyncio
+import hmac
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.database.session import get_db
+from app.database.session import AsyncSessionLocal, get_db
 from app.models.user import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event loop
+# and caps how many CPU-bound hashes run at once during a burst of logins.
+password_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
 security = HTTPBearer()
 
 
+@dataclass(frozen=True)
+class CurrentUser:
+    id: int
+    username: str
+    full_name: str
+    is_active: bool
+
+
+# Keyed by the raw access token, so a hit skips both the JWT decode and the users lookup.
+# Entries never outlive the token and are dropped whenever update_user changes the user;
+# with several worker processes the TTL bounds the staleness.
+user_cache = TTLCache("current_user", settings.USER_CACHE_MAX_ENTRIES, settings.USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_cached_user(user_id: int):
+    user_cache.discard_where(lambda cached: cached.id == user_id)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -22,6 +49,16 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, pwd_context.hash, password)
+
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, pwd_context.verify_and_update, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     if expires_delta:
@@ -44,14 +81,48 @@ def create_refresh_token(data: dict) -> str:
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> CurrentUser:
+    token = credentials.credentials
+    current_user = user_cache.get(token)
+    if current_user is None:
+        current_user = await _load_current_user(token, db)
+
+    if not current_user.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is disabled")
+    return current_user
+
+
+async def require_monitoring_access(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+):
+    # Scrapers cannot log in, so a configured METRICS_TOKEN is accepted besides user access tokens.
+    if settings.METRICS_TOKEN and hmac.compare_digest(credentials.credentials, settings.METRICS_TOKEN):
+        return
+    await get_current_user(credentials, db)
+
+
+async def get_stream_user(token: str = Query(...)) -> CurrentUser:
+    # EventSource cannot send headers, so streams pass the access token as a query
+    # parameter. The lookup uses its own short session so a long-lived stream does not
+    # hold a database connection.
+    current_user = user_cache.get(token)
+    if current_user is None:
+        async with AsyncSessionLocal() as db:
+            current_user = await _load_current_user(token, db)
+
+    if not current_user.is_active:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is disabled")
+    return current_user
+
+
+async def _load_current_user(token: str, db: AsyncSession) -> CurrentUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         username: str = payload.get("sub")
         token_type: str = payload.get("type")
@@ -60,13 +131,17 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    result = await db.execute(select(User).where(User.username == username))
-    user = result.scalar_one_or_none()
-    if user is None:
+    result = await db.execute(
+        select(User.id, User.username, User.full_name, User.is_active).where(User.username == username)
+    )
+    row = result.one_or_none()
+    if row is None:
         raise credentials_exception
-    if not user.is_active:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is disabled")
-    return user
+
+    current_user = CurrentUser(id=row.id, username=row.username, full_name=row.full_name, is_active=row.is_active)
+    expires_in = payload["exp"] - time.time() if "exp" in payload else None
+    user_cache.set(token, current_user, ttl_seconds=expires_in)
+    return current_user
 
 
 def verify_refresh_token(token: str) -> Optional[str]:
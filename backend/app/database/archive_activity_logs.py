@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from app.core.config import settings
+from app.database.session import engine, AsyncSessionLocal
+from app.models.user import User
+from app.models.customer import Customer
+from app.models.order import Order
+from app.models.payment import Payment
+from app.models.activity_log_archive import ActivityLogArchive
+from app.services.activity_log_archive import archive_activity_logs, dispose_archive_engines
+
+
+async def main(older_than_days: int, vacuum: bool):
+    async with engine.begin() as conn:
+        await conn.run_sync(ActivityLogArchive.__table__.create, checkfirst=True)
+    
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    async with AsyncSessionLocal() as session:
+        moved = await archive_activity_logs(session, cutoff)
+    await dispose_archive_engines()
+    
+    if not moved:
+        print(f"No activity log entries older than {cutoff:%Y-%m-%d}")
+    else:
+        print(f"Archive files are in {settings.ACTIVITY_LOG_ARCHIVE_DIR}")
+    for month, count in moved.items():
+        print(f"Archived {count} entries from {month}")
+    
+    if vacuum and moved:
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.execute(text("VACUUM"))
+        print("Vacuumed the main database")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move old activity log entries into monthly archive files")
+    parser.add_argument(
+        "--older-than-days",
+        type=int,
+        default=settings.ACTIVITY_LOG_RETENTION_DAYS,
+        help="Archive entries older than this many days (default: ACTIVITY_LOG_RETENTION_DAYS)"
+    )
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM the main database after archiving")
+    args = parser.parse_args()
+    asyncio.run(main(args.older_than_days, args.vacuum))
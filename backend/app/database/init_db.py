@@ -7,10 +7,23 @@ from app.models.product import Product
 from app.models.order import Order, OrderItem, OrderNote
 from app.models.payment import Payment
 from app.models.stock_movement import StockMovement
+from app.models.stock_balance import ProductStockBalance
 from app.models.activity_log import ActivityLog
+from app.models.activity_log_archive import ActivityLogArchive
+from app.models.dashboard_metrics import DashboardMetrics
+from app.models.customer_revenue import CustomerRevenueRollup
+from app.models.daily_sales import DailySales
+from app.models.schema_migration import SchemaMigration
+from app.models.data_version import DataVersion
+from app.models.sync_tombstone import SyncTombstone
+import app.models.search_index
 from app.core.config import settings
 from app.core.security import get_password_hash
 from app.database.session import AsyncSessionLocal
+from app.database.migrate import stamp_migrations
+from app.services.stock_service import rebuild_stock_balances
+from app.services.customer_revenue import rebuild_customer_revenue_rollup
+from app.services.daily_sales import rebuild_daily_sales
 
 
 async def init_database():
@@ -19,6 +32,7 @@ async def init_database():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+        await stamp_migrations(conn)
     
     async with AsyncSessionLocal() as session:
         admin_user = User(
@@ -74,7 +88,10 @@ async def init_database():
         
         sample_order = Order(
             customer_id=sample_customer.id,
-            created_by=admin_user.id
+            created_by=admin_user.id,
+            total_amount=75.0,
+            paid_amount=50.0,
+            item_count=1
         )
         session.add(sample_order)
         await session.flush()
@@ -113,6 +130,11 @@ async def init_database():
         )
         session.add(activity_log)
         
+        await session.flush()
+        await rebuild_stock_balances(session)
+        await rebuild_customer_revenue_rollup(session)
+        await rebuild_daily_sales(session)
+        
         await session.commit()
     
     print("Database initialized successfully with sample data!")
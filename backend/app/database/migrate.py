@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable
+from sqlalchemy import event, insert, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from app.core.config import settings
+from app.database.sqlite_profile import apply_sqlite_profile, get_sqlite_pragmas
+from app.models.schema_migration import SchemaMigration
+
+MIGRATIONS_PACKAGE = "app.database.migrations"
+
+HOT_QUERIES = {
+    "order items of a page": "SELECT * FROM order_items WHERE order_id IN (1, 2, 3)",
+    "payments of a page": "SELECT * FROM payments WHERE order_id IN (1, 2, 3)",
+    "notes of a page": "SELECT * FROM order_notes WHERE order_id IN (1, 2, 3)",
+    "orders page": "SELECT * FROM orders ORDER BY created_at DESC, id DESC LIMIT 51",
+    "customer orders page": "SELECT * FROM orders WHERE customer_id = 1 ORDER BY created_at DESC, id DESC LIMIT 51",
+    "open orders page": (
+        "SELECT * FROM orders WHERE delivered_at IS NULL AND is_cancelled = 0 "
+        "ORDER BY created_at DESC, id DESC LIMIT 51"
+    ),
+    "deliveries in range": (
+        "SELECT * FROM orders WHERE delivered_at >= '2024-01-01 00:00:00.000000' "
+        "AND delivered_at < '2024-02-01 00:00:00.000000'"
+    ),
+    "dashboard recompute": (
+        "SELECT count(id) FILTER (WHERE delivered_at IS NULL), count(id) FILTER (WHERE total_amount > paid_amount), "
+        "coalesce(sum(paid_amount), 0.0) FROM orders WHERE is_cancelled = 0"
+    ),
+    "customer statuses": "SELECT * FROM customer_statuses WHERE customer_id = 1",
+    "customer notes": "SELECT * FROM customer_notes WHERE customer_id = 1",
+    "product movements": "SELECT * FROM stock_movements WHERE product_id = 1 ORDER BY created_at DESC",
+}
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: str
+    name: str
+    upgrade: Callable[[AsyncConnection], Awaitable[None]]
+
+
+def load_migrations() -> list[Migration]:
+    package = importlib.import_module(MIGRATIONS_PACKAGE)
+    migrations = []
+    for module_info in pkgutil.iter_modules(package.__path__):
+        version, _, name = module_info.name.partition("_")
+        if not version.isdigit():
+            continue
+        module = importlib.import_module(f"{MIGRATIONS_PACKAGE}.{module_info.name}")
+        migrations.append(Migration(version=version, name=name, upgrade=module.upgrade))
+    return sorted(migrations, key=lambda migration: migration.version)
+
+
+def create_migration_engine(database_url: str | None = None) -> AsyncEngine:
+    # pysqlite only opens a transaction before DML, which would leave the DDL of a
+    # migration outside it; issuing BEGIN ourselves makes every migration atomic.
+    engine = create_async_engine(database_url or settings.DATABASE_URL)
+    apply_sqlite_profile(engine, get_sqlite_pragmas(settings.SQLITE_PROFILE, settings.SQLITE_BUSY_TIMEOUT_MS))
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def begin_transaction(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+async def applied_versions(conn: AsyncConnection) -> set[str]:
+    await conn.run_sync(SchemaMigration.__table__.create, checkfirst=True)
+    result = await conn.execute(select(SchemaMigration.version))
+    return set(result.scalars().all())
+
+
+async def stamp_migrations(conn: AsyncConnection):
+    # For databases built by create_all from the current models.
+    applied = await applied_versions(conn)
+    rows = [
+        {"version": migration.version, "name": migration.name, "applied_at": datetime.utcnow()}
+        for migration in load_migrations()
+        if migration.version not in applied
+    ]
+    if rows:
+        await conn.execute(insert(SchemaMigration), rows)
+
+
+async def upgrade(engine: AsyncEngine, target: str | None = None) -> list[Migration]:
+    async with engine.begin() as conn:
+        applied = await applied_versions(conn)
+    
+    upgraded = []
+    for migration in load_migrations():
+        if migration.version in applied:
+            continue
+        if target is not None and migration.version > target:
+            break
+        async with engine.begin() as conn:
+            await migration.upgrade(conn)
+            await conn.execute(
+                insert(SchemaMigration).values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=datetime.utcnow()
+                )
+            )
+        print(f"Applied {migration.version}_{migration.name}")
+        upgraded.append(migration)
+    return upgraded
+
+
+async def print_status(engine: AsyncEngine):
+    async with engine.begin() as conn:
+        applied = await applied_versions(conn)
+    for migration in load_migrations():
+        state = "applied" if migration.version in applied else "pending"
+        print(f"{migration.version}_{migration.name}: {state}")
+
+
+async def print_query_plans(engine: AsyncEngine):
+    async with engine.connect() as conn:
+        for label, sql in HOT_QUERIES.items():
+            print(f"{label}:")
+            try:
+                result = await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+            except OperationalError as exc:
+                print(f"  unavailable: {exc.orig}")
+                continue
+            for row in result:
+                print(f"  {row[-1]}")
+
+
+async def main(command: str, target: str | None):
+    engine = create_migration_engine()
+    if command == "upgrade":
+        if not await upgrade(engine, target):
+            print("Database is up to date")
+    elif command == "status":
+        await print_status(engine)
+    else:
+        await print_query_plans(engine)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply and inspect schema migrations")
+    parser.add_argument("command", choices=["upgrade", "status", "plan"])
+    parser.add_argument("--to", dest="target", help="Stop after this migration version")
+    args = parser.parse_args()
+    asyncio.run(main(args.command, args.target))
@@ -0,0 +1,75 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from app.database.base import Base
+from app.models.user import User
+from app.models.customer import Customer, CustomerStatus, CustomerNote
+from app.models.product import Product
+from app.models.order import Order, OrderItem, OrderNote
+from app.models.payment import Payment
+from app.models.stock_movement import StockMovement
+from app.models.stock_balance import ProductStockBalance
+from app.models.activity_log import ActivityLog
+from app.models.activity_log_archive import ActivityLogArchive
+from app.models.dashboard_metrics import DashboardMetrics
+from app.models.customer_revenue import CustomerRevenueRollup
+from app.models.daily_sales import DailySales
+from app.services.order_totals import reconcile_order_totals
+from app.services.stock_service import rebuild_stock_balances
+from app.services.customer_revenue import rebuild_customer_revenue_rollup
+
+# Brings a database created by an older init_db up to the schema that existed when
+# migrations were introduced: missing tables are created, the denormalized order
+# totals are added and backfilled, and new rollup tables are built from the source rows.
+# daily_sales is created empty here and built by 0006, whose cancellation date it reads.
+BASELINE_TABLES = [
+    "users", "customers", "customer_statuses", "customer_notes", "products", "orders", "order_items",
+    "order_notes", "payments", "stock_movements", "activity_logs", "product_stock_balance",
+    "dashboard_metrics", "customer_revenue_rollup", "daily_sales", "activity_log_archives",
+]
+
+ORDER_TOTAL_COLUMNS = {
+    "total_amount": "FLOAT NOT NULL DEFAULT 0",
+    "paid_amount": "FLOAT NOT NULL DEFAULT 0",
+    "item_count": "INTEGER NOT NULL DEFAULT 0",
+}
+
+ACTIVITY_LOG_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_activity_logs_table_record_created ON activity_logs (table_name, record_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_activity_logs_user_created ON activity_logs (user_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_activity_logs_created_at ON activity_logs (created_at)",
+]
+
+ROLLUP_REBUILDS = {
+    "product_stock_balance": rebuild_stock_balances,
+    "customer_revenue_rollup": rebuild_customer_revenue_rollup,
+}
+
+
+async def upgrade(conn: AsyncConnection):
+    existing_tables = await conn.run_sync(lambda sync_conn: set(inspect(sync_conn).get_table_names()))
+    missing_tables = [name for name in BASELINE_TABLES if name not in existing_tables]
+    await conn.run_sync(
+        lambda sync_conn: Base.metadata.create_all(
+            sync_conn, tables=[Base.metadata.tables[name] for name in missing_tables]
+        )
+    )
+
+    order_columns = await conn.run_sync(
+        lambda sync_conn: {column["name"] for column in inspect(sync_conn).get_columns("orders")}
+    )
+    added_order_totals = False
+    for name, ddl in ORDER_TOTAL_COLUMNS.items():
+        if name not in order_columns:
+            await conn.execute(text(f"ALTER TABLE orders ADD COLUMN {name} {ddl}"))
+            added_order_totals = True
+
+    for statement in ACTIVITY_LOG_INDEXES:
+        await conn.execute(text(statement))
+
+    async with AsyncSession(bind=conn) as session:
+        if added_order_totals:
+            await reconcile_order_totals(session)
+        for table_name, rebuild in ROLLUP_REBUILDS.items():
+            if table_name in missing_tables:
+                await rebuild(session)
+        await session.flush()
@@ -0,0 +1,27 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# Foreign keys used by selectinload and the report joins, the orders list filters and
+# keyset order, a partial index for open orders and a covering index for the
+# dashboard recompute. SQLite appends the rowid to every index, so (created_at)
+# also serves ORDER BY created_at DESC, id DESC. No other index has a usable prefix
+# for "delivered_at IS NULL AND is_cancelled = 0", which keeps the planner on the
+# open-orders index instead of collecting every open order and sorting it.
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_order_items_order_id ON order_items (order_id)",
+    "CREATE INDEX IF NOT EXISTS ix_payments_order_id ON payments (order_id)",
+    "CREATE INDEX IF NOT EXISTS ix_order_notes_order_id ON order_notes (order_id)",
+    "CREATE INDEX IF NOT EXISTS ix_stock_movements_product_created ON stock_movements (product_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_customer_statuses_customer_id ON customer_statuses (customer_id)",
+    "CREATE INDEX IF NOT EXISTS ix_customer_notes_customer_id ON customer_notes (customer_id)",
+    "CREATE INDEX IF NOT EXISTS ix_orders_customer_created ON orders (customer_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_orders_created_at ON orders (created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_orders_delivered_at ON orders (delivered_at) WHERE delivered_at IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS ix_orders_open_created_at ON orders (created_at) WHERE delivered_at IS NULL AND is_cancelled = 0",
+    "CREATE INDEX IF NOT EXISTS ix_orders_totals_covering ON orders (total_amount, paid_amount, delivered_at, is_cancelled)",
+]
+
+
+async def upgrade(conn: AsyncConnection):
+    for statement in INDEXES:
+        await conn.execute(text(statement))
@@ -0,0 +1,9 @@
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.models.data_version import DataVersion
+
+# Per-table write counters, bumped in the same transaction as the write; caches stamp
+# their entries with the versions they were computed from.
+
+
+async def upgrade(conn: AsyncConnection):
+    await conn.run_sync(lambda sync_conn: DataVersion.__table__.create(sync_conn, checkfirst=True))
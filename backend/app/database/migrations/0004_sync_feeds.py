@@ -0,0 +1,19 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.models.sync_tombstone import SyncTombstone
+
+# /sync reads each entity in (updated_at, id) order, or (created_at, id) for the
+# append-only stock movements; SQLite appends the rowid to every index, so a single
+# column index serves the keyset. Deleted rows are recorded in sync_tombstones.
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_orders_updated_at ON orders (updated_at)",
+    "CREATE INDEX IF NOT EXISTS ix_customers_updated_at ON customers (updated_at)",
+    "CREATE INDEX IF NOT EXISTS ix_products_updated_at ON products (updated_at)",
+    "CREATE INDEX IF NOT EXISTS ix_stock_movements_created_at ON stock_movements (created_at)",
+]
+
+
+async def upgrade(conn: AsyncConnection):
+    for statement in INDEXES:
+        await conn.execute(text(statement))
+    await conn.run_sync(lambda sync_conn: SyncTombstone.__table__.create(sync_conn, checkfirst=True))
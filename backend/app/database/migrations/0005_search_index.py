@@ -0,0 +1,12 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from app.models.search_index import create_search_index, search_backfill
+
+# FTS5 tables for /search over customers (name, and phone digits through a trigram
+# table), products and both note tables, filled from the existing rows and kept in
+# sync by triggers from then on.
+
+
+async def upgrade(conn: AsyncConnection):
+    for statement in [*create_search_index(), *search_backfill()]:
+        await conn.execute(text(statement))
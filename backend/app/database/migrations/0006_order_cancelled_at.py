@@ -0,0 +1,34 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from app.services.daily_sales import rebuild_daily_sales
+
+# The daily sales rollup counts a cancellation on the day it happened; updated_at moves
+# with later writes (notes, payments, sync touches), so the time gets its own column.
+# Existing cancellations take the time of their "cancelled" activity log entry, or
+# updated_at when that entry is gone (archived or never written). daily_sales is then
+# rebuilt, so cancellations move to the day they happened.
+BACKFILL = """
+UPDATE orders SET cancelled_at = coalesce(
+    (
+        SELECT min(activity_logs.created_at) FROM activity_logs
+        WHERE activity_logs.table_name = 'orders'
+        AND activity_logs.record_id = orders.id
+        AND activity_logs.action = 'cancelled'
+    ),
+    updated_at
+)
+WHERE is_cancelled = 1 AND cancelled_at IS NULL
+"""
+
+
+async def upgrade(conn: AsyncConnection):
+    order_columns = await conn.run_sync(
+        lambda sync_conn: {column["name"] for column in inspect(sync_conn).get_columns("orders")}
+    )
+    if "cancelled_at" not in order_columns:
+        await conn.execute(text("ALTER TABLE orders ADD COLUMN cancelled_at DATETIME"))
+    await conn.execute(text(BACKFILL))
+
+    async with AsyncSession(bind=conn) as session:
+        await rebuild_daily_sales(session)
+        await session.flush()
@@ -0,0 +1,15 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# GET /activity-logs filters by table_name alone or by action and pages by
+# (created_at, id). (table_name, record_id, created_at) only orders rows within a
+# record, and action had no index at all, so both cases sorted every match.
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_activity_logs_table_created ON activity_logs (table_name, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_activity_logs_action_created ON activity_logs (action, created_at)",
+]
+
+
+async def upgrade(conn: AsyncConnection):
+    for statement in INDEXES:
+        await conn.execute(text(statement))
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+from app.database.session import engine, AsyncSessionLocal
+from app.models.stock_balance import ProductStockBalance
+from app.models.customer_revenue import CustomerRevenueRollup
+from app.models.daily_sales import DailySales
+from app.services.stock_service import find_stock_balance_mismatches, rebuild_stock_balances
+from app.services.customer_revenue import find_customer_revenue_mismatches, rebuild_customer_revenue_rollup
+from app.services.daily_sales import find_daily_sales_mismatches, rebuild_daily_sales
+
+ROLLUPS = {
+    "stock_balance": (ProductStockBalance, rebuild_stock_balances, find_stock_balance_mismatches),
+    "customer_revenue": (CustomerRevenueRollup, rebuild_customer_revenue_rollup, find_customer_revenue_mismatches),
+    "daily_sales": (DailySales, rebuild_daily_sales, find_daily_sales_mismatches),
+}
+
+
+async def main(names: list[str], verify_only: bool) -> int:
+    async with engine.begin() as conn:
+        for name in names:
+            model = ROLLUPS[name][0]
+            await conn.run_sync(model.__table__.create, checkfirst=True)
+    
+    exit_code = 0
+    async with AsyncSessionLocal() as session:
+        for name in names:
+            _, rebuild, find_mismatches = ROLLUPS[name]
+            if verify_only:
+                mismatched_ids = await find_mismatches(session)
+                if mismatched_ids:
+                    print(f"{name}: {len(mismatched_ids)} stale rows: {mismatched_ids[:50]}")
+                    exit_code = 1
+                else:
+                    print(f"{name}: consistent")
+            else:
+                count = await rebuild(session)
+                await session.commit()
+                print(f"{name}: rebuilt {count} rows")
+    
+    await engine.dispose()
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild or verify rollup tables from the source tables")
+    parser.add_argument("names", nargs="*", help=f"Rollups to process: {', '.join(ROLLUPS)} (default: all)")
+    parser.add_argument("--verify", action="store_true", help="Only report mismatches, do not rebuild")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in ROLLUPS]
+    if unknown:
+        parser.error(f"unknown rollups: {', '.join(unknown)}")
+    raise SystemExit(asyncio.run(main(args.names or list(ROLLUPS), args.verify)))
@@ -0,0 +1,50 @@
+import argparse
+import asyncio
+from sqlalchemy import inspect, text
+from app.database.session import engine, AsyncSessionLocal
+from app.services.order_totals import find_order_total_mismatches, reconcile_order_totals
+
+ORDER_TOTAL_COLUMNS = {
+    "total_amount": "FLOAT NOT NULL DEFAULT 0",
+    "paid_amount": "FLOAT NOT NULL DEFAULT 0",
+    "item_count": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+async def ensure_order_total_columns():
+    async with engine.begin() as conn:
+        existing = await conn.run_sync(
+            lambda sync_conn: {column["name"] for column in inspect(sync_conn).get_columns("orders")}
+        )
+        for name, ddl in ORDER_TOTAL_COLUMNS.items():
+            if name not in existing:
+                await conn.execute(text(f"ALTER TABLE orders ADD COLUMN {name} {ddl}"))
+                print(f"Added orders.{name}")
+
+
+async def main(verify_only: bool) -> int:
+    await ensure_order_total_columns()
+    
+    async with AsyncSessionLocal() as session:
+        if verify_only:
+            mismatched_ids = await find_order_total_mismatches(session)
+        else:
+            mismatched_ids = await reconcile_order_totals(session)
+            await session.commit()
+    
+    await engine.dispose()
+    
+    if not mismatched_ids:
+        print("All order totals are consistent")
+        return 0
+    
+    action = "Found" if verify_only else "Reconciled"
+    print(f"{action} {len(mismatched_ids)} orders with stale totals: {mismatched_ids[:50]}")
+    return 1 if verify_only else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill and verify denormalized order totals")
+    parser.add_argument("--verify", action="store_true", help="Only report mismatches, do not fix them")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(main(args.verify)))
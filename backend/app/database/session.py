@@ -1,8 +1,26 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.core.metrics import instrument_pool
+from app.core.query_stats import instrument_engine
+from app.database.sqlite_profile import apply_sqlite_profile, get_sqlite_pragmas
+from app.services.data_versions import track_data_versions
+from app.services.sync import track_sync_changes
 
 engine = create_async_engine(settings.DATABASE_URL, echo=False)
-AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+apply_sqlite_profile(engine, get_sqlite_pragmas(settings.SQLITE_PROFILE, settings.SQLITE_BUSY_TIMEOUT_MS))
+instrument_engine(engine)
+instrument_pool(engine)
+
+
+class VersionedSession(Session):
+    pass
+
+
+# Registration order is call order: parent timestamps are touched before the version bump.
+track_sync_changes(VersionedSession)
+track_data_versions(VersionedSession)
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, sync_session_class=VersionedSession, expire_on_commit=False)
 
 
 async def get_db():
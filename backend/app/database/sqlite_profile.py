@@ -0,0 +1,73 @@
+import asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.logging import logger
+
+# Applied to every new connection. "rollback" keeps SQLite's own journal and sync defaults
+# and only adds a busy timeout; "wal" lets readers run alongside the single writer and
+# syncs on checkpoints instead of on every commit.
+SQLITE_PROFILES = {
+    "rollback": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "wal_autocheckpoint": 10000,
+    },
+    "wal_durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "wal_autocheckpoint": 10000,
+    },
+}
+
+
+def get_sqlite_pragmas(profile: str, busy_timeout_ms: int | None = None) -> dict:
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile {profile!r}, expected one of {', '.join(SQLITE_PROFILES)}")
+    pragmas = dict(SQLITE_PROFILES[profile])
+    if busy_timeout_ms is not None:
+        pragmas["busy_timeout"] = busy_timeout_ms
+    return pragmas
+
+
+def apply_sqlite_profile(engine: AsyncEngine, pragmas: dict):
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+async def checkpoint_wal(engine: AsyncEngine, mode: str = "PASSIVE") -> tuple[int, int, int]:
+    async with engine.connect() as conn:
+        busy, wal_pages, checkpointed_pages = (await conn.execute(text(f"PRAGMA wal_checkpoint({mode})"))).one()
+    return busy, wal_pages, checkpointed_pages
+
+
+async def run_wal_checkpoint_loop(engine: AsyncEngine, interval_seconds: int):
+    # PASSIVE checkpoints never wait on readers or writers; the periodic pass keeps the
+    # WAL short so request commits rarely hit the autocheckpoint themselves.
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            busy, wal_pages, checkpointed_pages = await checkpoint_wal(engine)
+            if wal_pages > checkpointed_pages:
+                logger.info(f"WAL checkpoint incomplete: {checkpointed_pages}/{wal_pages} pages (busy={busy})")
+        except Exception:
+            logger.exception("WAL checkpoint failed")
@@ -1,7 +1,16 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.logging import logger
-from app.routers import auth, users, customers, products, orders, stock_movements, reports, health
+from app.core.config import settings
+from app.core.logging import logger, stop_logging
+from app.core.metrics import MetricsMiddleware, http_metrics, run_event_loop_lag_monitor
+from app.core.query_stats import QueryStatsMiddleware
+from app.routers import auth, users, customers, products, orders, stock_movements, reports, activity_logs, health, sync, events, search
+from app.database.session import engine
+from app.database.sqlite_profile import SQLITE_PROFILES, checkpoint_wal, run_wal_checkpoint_loop
+from app.services.activity_log import activity_log_writer
+from app.services.activity_log_archive import dispose_archive_engines
+from app.services.dashboard_metrics import run_dashboard_recompute_loop
 
 app = FastAPI(
     title="Backend API",
@@ -9,13 +18,16 @@ app = FastAPI(
     version="1.0.0"
 )
 
+app.add_middleware(QueryStatsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(health.router)
 app.include_router(auth.router)
@@ -25,13 +37,42 @@ app.include_router(products.router)
 app.include_router(orders.router)
 app.include_router(stock_movements.router)
 app.include_router(reports.router)
+app.include_router(activity_logs.router)
+app.include_router(sync.router)
+app.include_router(events.router)
+app.include_router(search.router)
+
+
+def uses_wal() -> bool:
+    return engine.dialect.name == "sqlite" and SQLITE_PROFILES[settings.SQLITE_PROFILE]["journal_mode"] == "WAL"
 
 
 @app.on_event("startup")
 async def startup_event():
+    http_metrics.register_routes(app.routes)
+    activity_log_writer.start()
+    app.state.background_tasks = [
+        asyncio.create_task(run_dashboard_recompute_loop(settings.DASHBOARD_RECOMPUTE_INTERVAL_SECONDS)),
+        asyncio.create_task(run_event_loop_lag_monitor(settings.EVENT_LOOP_LAG_INTERVAL_SECONDS))
+    ]
+    if uses_wal():
+        app.state.background_tasks.append(
+            asyncio.create_task(run_wal_checkpoint_loop(engine, settings.SQLITE_WAL_CHECKPOINT_INTERVAL_SECONDS))
+        )
     logger.info("Application startup complete")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    for task in app.state.background_tasks:
+        task.cancel()
+    await asyncio.gather(*app.state.background_tasks, return_exceptions=True)
+    await activity_log_writer.stop()
+    await dispose_archive_engines()
+    if uses_wal():
+        try:
+            await checkpoint_wal(engine, "TRUNCATE")
+        except Exception:
+            logger.exception("Final WAL checkpoint failed")
     logger.info("Application shutdown complete")
+    stop_logging()
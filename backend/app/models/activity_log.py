@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import String, DateTime, ForeignKey, Integer, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from app.database.base import Base
@@ -6,6 +6,13 @@ from app.database.base import Base
 
 class ActivityLog(Base):
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        Index("ix_activity_logs_table_record_created", "table_name", "record_id", "created_at"),
+        Index("ix_activity_logs_table_created", "table_name", "created_at"),
+        Index("ix_activity_logs_user_created", "user_id", "created_at"),
+        Index("ix_activity_logs_action_created", "action", "created_at"),
+        Index("ix_activity_logs_created_at", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     table_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -0,0 +1,15 @@
+from sqlalchemy import String, DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from app.database.base import Base
+
+
+class ActivityLogArchive(Base):
+    __tablename__ = "activity_log_archives"
+
+    month: Mapped[str] = mapped_column(String(7), primary_key=True)
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    row_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    first_created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey, Text, Integer
+from sqlalchemy import String, DateTime, ForeignKey, Text, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import List
@@ -7,6 +7,7 @@ from app.database.base import Base
 
 class Customer(Base):
     __tablename__ = "customers"
+    __table_args__ = (Index("ix_customers_updated_at", "updated_at"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -21,6 +22,7 @@ class Customer(Base):
 
 class CustomerStatus(Base):
     __tablename__ = "customer_statuses"
+    __table_args__ = (Index("ix_customer_statuses_customer_id", "customer_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"), nullable=False)
@@ -33,6 +35,7 @@ class CustomerStatus(Base):
 
 class CustomerNote(Base):
     __tablename__ = "customer_notes"
+    __table_args__ = (Index("ix_customer_notes_customer_id", "customer_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"), nullable=False)
@@ -0,0 +1,17 @@
+from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from typing import Optional
+from app.database.base import Base
+
+
+class CustomerRevenueRollup(Base):
+    __tablename__ = "customer_revenue_rollup"
+
+    customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"), primary_key=True)
+    total_revenue: Mapped[float] = mapped_column(Float, default=0.0, nullable=False, index=True)
+    billed_total: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    outstanding_balance: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    order_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    last_order_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
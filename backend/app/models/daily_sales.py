@@ -0,0 +1,17 @@
+from sqlalchemy import Date, DateTime, Float, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import date, datetime
+from app.database.base import Base
+
+
+class DailySales(Base):
+    __tablename__ = "daily_sales"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    billed_total: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    collected_total: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    items_sold: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    orders_created: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    orders_delivered: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    orders_cancelled: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,15 @@
+from sqlalchemy import DateTime, Float, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from app.database.base import Base
+
+
+class DashboardMetrics(Base):
+    __tablename__ = "dashboard_metrics"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    pending_deliveries_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    pending_payments_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_revenue: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    recomputed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
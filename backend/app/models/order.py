@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey, Float, Boolean, Text, Integer
+from sqlalchemy import String, DateTime, ForeignKey, Float, Boolean, Text, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import List, Optional
@@ -7,6 +7,14 @@ from app.database.base import Base
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_customer_created", "customer_id", "created_at"),
+        Index("ix_orders_created_at", "created_at"),
+        Index("ix_orders_delivered_at", "delivered_at", sqlite_where=text("delivered_at IS NOT NULL")),
+        Index("ix_orders_open_created_at", "created_at", sqlite_where=text("delivered_at IS NULL AND is_cancelled = 0")),
+        Index("ix_orders_totals_covering", "total_amount", "paid_amount", "delivered_at", "is_cancelled"),
+        Index("ix_orders_updated_at", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     customer_id: Mapped[int] = mapped_column(ForeignKey("customers.id"), nullable=False)
@@ -14,9 +22,13 @@ class Order(Base):
     updated_by: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
     cancelled_by: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
     cancellation_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    cancelled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     delivered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     delivered_by: Mapped[Optional[int]] = mapped_column(ForeignKey("users.id"), nullable=True)
     is_cancelled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    total_amount: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    paid_amount: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    item_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -27,6 +39,7 @@ class Order(Base):
 
 class OrderItem(Base):
     __tablename__ = "order_items"
+    __table_args__ = (Index("ix_order_items_order_id", "order_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False)
@@ -41,6 +54,7 @@ class OrderItem(Base):
 
 class OrderNote(Base):
     __tablename__ = "order_notes"
+    __table_args__ = (Index("ix_order_notes_order_id", "order_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey, Float, Enum
+from sqlalchemy import String, DateTime, ForeignKey, Float, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 import enum
@@ -12,6 +12,7 @@ class PaymentType(str, enum.Enum):
 
 class Payment(Base):
     __tablename__ = "payments"
+    __table_args__ = (Index("ix_payments_order_id", "order_id"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     order_id: Mapped[int] = mapped_column(ForeignKey("orders.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, DateTime, Float, Text
+from sqlalchemy import String, Boolean, DateTime, Float, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from app.database.base import Base
@@ -6,6 +6,7 @@ from app.database.base import Base
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (Index("ix_products_updated_at", "updated_at"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -0,0 +1,91 @@
+from sqlalchemy import DDL, event
+from app.database.base import Base
+
+# FTS5 tables are not mapped: they are created and dropped alongside the metadata and
+# kept in step with their source tables by triggers, so every write path (ORM, Core
+# inserts, manual SQL) updates them. Each row's rowid is the source row's id, and
+# results are read back from the source tables, so indexed text can be normalized.
+TEXT_TOKENIZER = "unicode61 remove_diacritics 2"
+
+
+def _fold(expression: str) -> str:
+    # unicode61 strips diacritics but has no mapping for the Turkish dotless i.
+    return f"replace({expression}, 'ı', 'i')"
+
+
+def _digits(expression: str) -> str:
+    for separator in (" ", "-", "(", ")", ".", "+"):
+        expression = f"replace({expression}, '{separator}', '')"
+    return expression
+
+
+def _phones(row: str) -> str:
+    # Digits only, one number per comma-separated entry, for substring matching.
+    return _digits(f"{row}.primary_phone || ',' || coalesce({row}.additional_phones, '')")
+
+
+SEARCH_TABLES = {
+    "customers_fts": f"CREATE VIRTUAL TABLE IF NOT EXISTS customers_fts USING fts5(name, tokenize='{TEXT_TOKENIZER}', prefix='2 3')",
+    "customer_phones_fts": "CREATE VIRTUAL TABLE IF NOT EXISTS customer_phones_fts USING fts5(phones, tokenize='trigram')",
+    "products_fts": f"CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(name, category, tokenize='{TEXT_TOKENIZER}', prefix='2 3')",
+    "order_notes_fts": f"CREATE VIRTUAL TABLE IF NOT EXISTS order_notes_fts USING fts5(note, tokenize='{TEXT_TOKENIZER}', prefix='2 3')",
+    "customer_notes_fts": f"CREATE VIRTUAL TABLE IF NOT EXISTS customer_notes_fts USING fts5(note, tokenize='{TEXT_TOKENIZER}', prefix='2 3')",
+}
+
+# source table -> (columns whose updates reindex a row, [(fts table, {fts column: SQL over the row})])
+SEARCH_SOURCES = {
+    "customers": (
+        ("name", "primary_phone", "additional_phones"),
+        [
+            ("customers_fts", {"name": _fold("{row}.name")}),
+            ("customer_phones_fts", {"phones": _phones("{row}")}),
+        ]
+    ),
+    "products": (("name", "category"), [("products_fts", {"name": _fold("{row}.name"), "category": _fold("{row}.category")})]),
+    "order_notes": (("note",), [("order_notes_fts", {"note": _fold("{row}.note")})]),
+    "customer_notes": (("note",), [("customer_notes_fts", {"note": _fold("{row}.note")})]),
+}
+
+
+def _insert(fts_table: str, columns: dict[str, str], row: str) -> str:
+    values = ", ".join(expression.format(row=row) for expression in columns.values())
+    return f"INSERT INTO {fts_table} (rowid, {', '.join(columns)}) VALUES ({row}.id, {values});"
+
+
+def _delete(fts_table: str) -> str:
+    return f"DELETE FROM {fts_table} WHERE rowid = old.id;"
+
+
+def search_triggers() -> list[str]:
+    statements = []
+    for source, (watched_columns, targets) in SEARCH_SOURCES.items():
+        inserts = " ".join(_insert(fts_table, columns, "new") for fts_table, columns in targets)
+        deletes = " ".join(_delete(fts_table) for fts_table, _ in targets)
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {source}_search_insert AFTER INSERT ON {source} BEGIN {inserts} END",
+            f"CREATE TRIGGER IF NOT EXISTS {source}_search_delete AFTER DELETE ON {source} BEGIN {deletes} END",
+            f"CREATE TRIGGER IF NOT EXISTS {source}_search_update AFTER UPDATE OF {', '.join(watched_columns)} ON {source} BEGIN {deletes} {inserts} END",
+        ]
+    return statements
+
+
+def search_backfill() -> list[str]:
+    statements = []
+    for source, (_, targets) in SEARCH_SOURCES.items():
+        for fts_table, columns in targets:
+            expressions = ", ".join(expression.format(row=source) for expression in columns.values())
+            statements += [
+                f"DELETE FROM {fts_table}",
+                f"INSERT INTO {fts_table} (rowid, {', '.join(columns)}) SELECT {source}.id, {expressions} FROM {source}",
+            ]
+    return statements
+
+
+def create_search_index() -> list[str]:
+    return [*SEARCH_TABLES.values(), *search_triggers()]
+
+
+for _statement in create_search_index():
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _table in SEARCH_TABLES:
+    event.listen(Base.metadata, "before_drop", DDL(f"DROP TABLE IF EXISTS {_table}").execute_if(dialect="sqlite"))
@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey, Float, Integer, Text, Enum
+from sqlalchemy import String, DateTime, ForeignKey, Float, Integer, Text, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from typing import Optional
@@ -17,6 +17,10 @@ class MovementType(str, enum.Enum):
 
 class StockMovement(Base):
     __tablename__ = "stock_movements"
+    __table_args__ = (
+        Index("ix_stock_movements_product_created", "product_id", "created_at"),
+        Index("ix_stock_movements_created_at", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), nullable=False)
@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, or_, and_
+from datetime import datetime
+from app.database.session import get_db
+from app.models.activity_log import ActivityLog
+from app.schemas.activity_log import ActivityLogPage
+from app.core.security import CurrentUser, get_current_user
+from app.services.activity_log_archive import merge_archived_activity_logs
+from app.utils.pagination import encode_cursor, decode_cursor
+
+router = APIRouter(prefix="/activity-logs", tags=["Activity Logs"])
+
+
+@router.get("/", response_model=ActivityLogPage)
+async def list_activity_logs(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    table_name: str | None = None,
+    record_id: int | None = None,
+    user_id: int | None = None,
+    action: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    # table_name (with or without record_id), user_id and action each have an index
+    # ending in (created_at, rowid), so a page is read in index order without a sort.
+    # Combined filters walk one of those indexes and check the other columns per row.
+    # Pages continue into the monthly archive files once the hot table runs out of older rows.
+    if record_id is not None and table_name is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="record_id requires table_name")
+    
+    conditions = []
+    if table_name is not None:
+        conditions.append(ActivityLog.table_name == table_name)
+    if record_id is not None:
+        conditions.append(ActivityLog.record_id == record_id)
+    if user_id is not None:
+        conditions.append(ActivityLog.user_id == user_id)
+    if action is not None:
+        conditions.append(ActivityLog.action == action)
+    if created_from is not None:
+        conditions.append(ActivityLog.created_at >= created_from)
+    if created_to is not None:
+        conditions.append(ActivityLog.created_at < created_to)
+    
+    if cursor is not None:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        conditions.append(
+            or_(
+                ActivityLog.created_at < cursor_created_at,
+                and_(ActivityLog.created_at == cursor_created_at, ActivityLog.id < cursor_id)
+            )
+        )
+    
+    result = await db.execute(
+        select(ActivityLog)
+        .where(*conditions)
+        .order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
+        .limit(limit + 1)
+    )
+    logs = await merge_archived_activity_logs(
+        db, conditions, list(result.scalars().all()), limit + 1, created_from, created_to
+    )
+    
+    next_cursor = None
+    if len(logs) > limit:
+        logs = logs[:limit]
+        next_cursor = encode_cursor(logs[-1].created_at, logs[-1].id)
+    
+    return {"items": logs, "next_cursor": next_cursor}
@@ -5,7 +5,7 @@ from sqlalchemy import select
 from app.database.session import get_db
 from app.models.user import User
 from app.schemas.user import Token, TokenRefresh
-from app.core.security import verify_password, create_access_token, create_refresh_token, verify_refresh_token
+from app.core.security import verify_and_update_password, create_access_token, create_refresh_token, verify_refresh_token
 from pydantic import BaseModel
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -24,7 +24,10 @@ async def login(
     result = await db.execute(select(User).where(User.username == credentials.username))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await verify_and_update_password(credentials.password, user.hashed_password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -37,6 +40,10 @@ async def login(
             detail="User is disabled"
         )
     
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+    
     access_token = create_access_token(data={"sub": user.username})
     refresh_token = create_refresh_token(data={"sub": user.username})
     
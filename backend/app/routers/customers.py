@@ -3,25 +3,26 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from app.database.session import get_db
-from app.models.user import User
 from app.models.customer import Customer, CustomerStatus, CustomerNote
 from app.schemas.customer import CustomerCreate, CustomerUpdate, CustomerResponse, CustomerStatusCreate, CustomerNoteCreate
-from app.core.security import get_current_user
+from app.core.security import CurrentUser, get_current_user
+from app.core.etag import versioned_etag
 from app.services.activity_log import log_activity
 
 router = APIRouter(prefix="/customers", tags=["Customers"])
 
+customers_etag = versioned_etag("customers", "customer_statuses", "customer_notes")
+
 
 @router.post("/", response_model=CustomerResponse, status_code=status.HTTP_201_CREATED)
 async def create_customer(
     customer_data: CustomerCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     customer = Customer(**customer_data.model_dump())
     db.add(customer)
     await db.commit()
-    await db.refresh(customer)
     await log_activity(db, "customers", customer.id, "created", current_user.id)
     
     # Eagerly load relationships
@@ -35,10 +36,9 @@ async def create_customer(
     return customer
 
 
-@router.get("/", response_model=list[CustomerResponse])
+@router.get("/", response_model=list[CustomerResponse], dependencies=[Depends(get_current_user), Depends(customers_etag)])
 async def list_customers(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
         select(Customer).options(
@@ -50,11 +50,10 @@ async def list_customers(
     return customers
 
 
-@router.get("/{customer_id}", response_model=CustomerResponse)
+@router.get("/{customer_id}", response_model=CustomerResponse, dependencies=[Depends(get_current_user), Depends(customers_etag)])
 async def get_customer(
     customer_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(
         select(Customer).where(Customer.id == customer_id).options(
@@ -73,7 +72,7 @@ async def update_customer(
     customer_id: int,
     customer_data: CustomerUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(Customer).where(Customer.id == customer_id))
     customer = result.scalar_one_or_none()
@@ -85,7 +84,6 @@ async def update_customer(
         setattr(customer, field, value)
     
     await db.commit()
-    await db.refresh(customer)
     await log_activity(db, "customers", customer.id, "updated", current_user.id)
     
     # Eagerly load relationships
@@ -104,7 +102,7 @@ async def add_customer_status(
     customer_id: int,
     status_data: CustomerStatusCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(Customer).where(Customer.id == customer_id))
     customer = result.scalar_one_or_none()
@@ -137,7 +135,7 @@ async def remove_customer_status(
     customer_id: int,
     status_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(
         select(CustomerStatus).where(
@@ -149,7 +147,7 @@ async def remove_customer_status(
     if not customer_status:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Status not found")
     
-    await log_activity(db, "customer_statuses", status_id, "status_removed", current_user.id, f"Status: {customer_status.status}")
+    await log_activity(db, "customer_statuses", status_id, "status_removed", current_user.id, f"Status: {customer_status.status}", same_transaction=True)
     await db.delete(customer_status)
     await db.commit()
 
@@ -159,7 +157,7 @@ async def add_customer_note(
     customer_id: int,
     note_data: CustomerNoteCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(Customer).where(Customer.id == customer_id))
     customer = result.scalar_one_or_none()
@@ -182,7 +180,7 @@ async def delete_customer_note(
     customer_id: int,
     note_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(
         select(CustomerNote).where(
@@ -194,6 +192,6 @@ async def delete_customer_note(
     if not note:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
     
-    await log_activity(db, "customer_notes", note_id, "note_deleted", current_user.id)
+    await log_activity(db, "customer_notes", note_id, "note_deleted", current_user.id, same_transaction=True)
     await db.delete(note)
     await db.commit()
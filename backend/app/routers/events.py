@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.security import CurrentUser, get_stream_user
+from app.services.event_bus import event_bus, HEARTBEAT_FRAME
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+
+@router.get("/stream")
+async def stream_events(
+    current_user: CurrentUser = Depends(get_stream_user)
+):
+    async def frames():
+        # Starlette cancels the stream when the client disconnects, which runs the finally.
+        subscription = event_bus.subscribe()
+        try:
+            yield await event_bus.current_dashboard_frame()
+            while True:
+                frame = await subscription.next_frame(settings.EVENT_STREAM_HEARTBEAT_SECONDS)
+                yield frame if frame is not None else HEARTBEAT_FRAME
+        finally:
+            event_bus.unsubscribe(subscription)
+    
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
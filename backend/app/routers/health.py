@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Response
+from app.core.cache import get_cache_stats
+from app.core.metrics import CONTENT_TYPE, render_metrics
+from app.core.security import require_monitoring_access
 
 router = APIRouter(tags=["Health"])
 
@@ -6,3 +9,13 @@ router = APIRouter(tags=["Health"])
 @router.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@router.get("/health/caches", dependencies=[Depends(require_monitoring_access)])
+async def cache_stats():
+    return get_cache_stats()
+
+
+@router.get("/metrics", dependencies=[Depends(require_monitoring_access)])
+async def metrics():
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE)
@@ -1,49 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, or_, and_
 from sqlalchemy.orm import selectinload
 from datetime import datetime
 from app.database.session import get_db
-from app.models.user import User
 from app.models.order import Order, OrderItem, OrderNote
-from app.models.product import Product
 from app.models.payment import Payment
-from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse, OrderNoteCreate, PaymentCreate, OrderCancelRequest
-from app.core.security import get_current_user
-from app.services.activity_log import log_activity
-from app.services.stock_service import create_delivery_stock_movement
+from app.schemas.order import OrderCreate, OrderUpdate, OrderResponse, OrderItemResponse, PaymentResponse, OrderNoteResponse, OrderPage, OrderNoteCreate, PaymentCreate, OrderCancelRequest, OrderImportReport, OrderDeliverBatchRequest, OrderDeliverBatchResponse
+from app.core.config import settings
+from app.core.security import CurrentUser, get_current_user
+from app.core.etag import versioned_etag
+from app.services.activity_log import log_activity, log_activities
+from app.services.event_bus import event_bus
+from app.services.stock_service import create_delivery_stock_movements, adjust_stock_balances, quantities_by_product
+from app.services.order_rollups import apply_order_changes, order_state, with_changes
+from app.services.order_service import resolve_products, find_missing_product_id, create_order_items, apply_order_item_diff
+from app.services.order_import import OrderImporter, ImportFormatError, iter_lines
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.serialization import TrustedJSONResponse, attribute_values, response_fields
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
+orders_etag = versioned_etag("orders", "order_items", "payments", "order_notes")
+ORDER_FIELDS = response_fields(OrderResponse)
+ORDER_ITEM_FIELDS = response_fields(OrderItemResponse)
+PAYMENT_FIELDS = response_fields(PaymentResponse)
+ORDER_NOTE_FIELDS = response_fields(OrderNoteResponse)
 
-async def enrich_order_response(order: Order) -> dict:
-    total_amount = sum(item.total_price for item in order.items)
-    paid_amount = sum(payment.amount for payment in order.payments)
+
+def order_response(order: Order) -> dict:
+    total_amount = order.total_amount
+    paid_amount = order.paid_amount
     remaining_amount = total_amount - paid_amount
     is_fully_paid = remaining_amount <= 0
     is_delivered = order.delivered_at is not None
     is_fully_completed = is_delivered and is_fully_paid
     
-    return {
-        **{k: v for k, v in order.__dict__.items() if not k.startswith('_')},
-        "items": order.items,
-        "payments": order.payments,
-        "notes": order.notes,
-        "total_amount": total_amount,
-        "paid_amount": paid_amount,
-        "remaining_amount": remaining_amount,
-        "is_fully_paid": is_fully_paid,
-        "is_delivered": is_delivered,
-        "is_fully_completed": is_fully_completed
-    }
+    return attribute_values(
+        order,
+        ORDER_FIELDS,
+        items=[attribute_values(item, ORDER_ITEM_FIELDS) for item in order.items],
+        payments=[attribute_values(payment, PAYMENT_FIELDS) for payment in order.payments],
+        notes=[attribute_values(note, ORDER_NOTE_FIELDS) for note in order.notes],
+        total_amount=total_amount,
+        paid_amount=paid_amount,
+        remaining_amount=remaining_amount,
+        is_fully_paid=is_fully_paid,
+        is_delivered=is_delivered,
+        is_fully_completed=is_fully_completed
+    )
 
 
 @router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
 async def create_order(
     order_data: OrderCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
+    products = await resolve_products(db, [item.product_id for item in order_data.items])
+    missing_product_id = find_missing_product_id(order_data.items, products)
+    if missing_product_id is not None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Product {missing_product_id} not found")
+    
     order = Order(
         customer_id=order_data.customer_id,
         created_by=current_user.id
@@ -51,24 +69,17 @@ async def create_order(
     db.add(order)
     await db.flush()
     
-    for item_data in order_data.items:
-        result = await db.execute(select(Product).where(Product.id == item_data.product_id))
-        product = result.scalar_one_or_none()
-        if not product:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Product {item_data.product_id} not found")
-        
-        order_item = OrderItem(
-            order_id=order.id,
-            product_id=item_data.product_id,
-            product_name_snapshot=product.name,
-            quantity=item_data.quantity,
-            unit_price=item_data.unit_price,
-            total_price=item_data.quantity * item_data.unit_price
-        )
-        db.add(order_item)
-    
+    diff = await create_order_items(db, order, order_data.items, products)
+    order.total_amount = diff.total_amount
+    order.item_count = diff.item_count
+    await adjust_stock_balances(
+        db,
+        reserved_deltas=quantities_by_product((item.product_id, item.quantity) for item in order_data.items)
+    )
+    await apply_order_changes(db, [(None, order_state(order))])
     await db.commit()
     await log_activity(db, "orders", order.id, "created", current_user.id)
+    event_bus.publish_change("orders", "created", [order.id])
     
     # Eagerly load all relationships
     result = await db.execute(
@@ -80,30 +91,108 @@ async def create_order(
     )
     order = result.scalar_one()
     
-    return await enrich_order_response(order)
+    return TrustedJSONResponse(order_response(order), status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/", response_model=list[OrderResponse])
+@router.post("/import", response_model=OrderImportReport)
+async def import_orders(
+    request: Request,
+    file_format: str | None = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+    chunk_size: int = Query(settings.IMPORT_CHUNK_SIZE, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    if file_format is None:
+        file_format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    
+    importer = OrderImporter(db, current_user.id, chunk_size, settings.IMPORT_MAX_REPORTED_ERRORS)
+    lines = iter_lines(request.stream())
+    try:
+        if file_format == "csv":
+            await importer.import_csv(lines)
+        else:
+            await importer.import_ndjson(lines)
+    except ImportFormatError as exc:
+        await importer.flush()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"message": str(exc), "report": importer.report()}
+        )
+    
+    return importer.report()
+
+
+@router.get("/", response_model=OrderPage)
 async def list_orders(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    customer_id: int | None = None,
+    is_delivered: bool | None = None,
+    is_paid: bool | None = None,
+    is_cancelled: bool | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user),
+    cache_headers: dict = Depends(orders_etag)
 ):
+    query = select(Order)
+    
+    if customer_id is not None:
+        query = query.where(Order.customer_id == customer_id)
+    if is_delivered is not None:
+        query = query.where(Order.delivered_at.is_not(None) if is_delivered else Order.delivered_at.is_(None))
+    if is_cancelled is not None:
+        query = query.where(Order.is_cancelled == is_cancelled)
+    if created_from is not None:
+        query = query.where(Order.created_at >= created_from)
+    if created_to is not None:
+        query = query.where(Order.created_at < created_to)
+    if is_paid is not None:
+        query = query.where(
+            Order.paid_amount >= Order.total_amount if is_paid else Order.paid_amount < Order.total_amount
+        )
+    
+    if cursor is not None:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        query = query.where(
+            or_(
+                Order.created_at < cursor_created_at,
+                and_(Order.created_at == cursor_created_at, Order.id < cursor_id)
+            )
+        )
+    
     result = await db.execute(
-        select(Order).options(
+        query.order_by(Order.created_at.desc(), Order.id.desc())
+        .limit(limit + 1)
+        .options(
             selectinload(Order.items),
             selectinload(Order.payments),
             selectinload(Order.notes)
         )
     )
     orders = result.scalars().all()
-    return [await enrich_order_response(order) for order in orders]
+    
+    next_cursor = None
+    if len(orders) > limit:
+        orders = orders[:limit]
+        next_cursor = encode_cursor(orders[-1].created_at, orders[-1].id)
+    
+    return TrustedJSONResponse({
+        "items": [order_response(order) for order in orders],
+        "next_cursor": next_cursor
+    }, headers=cache_headers)
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
 async def get_order(
     order_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user),
+    cache_headers: dict = Depends(orders_etag)
 ):
     result = await db.execute(
         select(Order).where(Order.id == order_id).options(
@@ -116,7 +205,7 @@ async def get_order(
     if not order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
     
-    return await enrich_order_response(order)
+    return TrustedJSONResponse(order_response(order), headers=cache_headers)
 
 
 @router.patch("/{order_id}", response_model=OrderResponse)
@@ -124,7 +213,7 @@ async def update_order(
     order_id: int,
     order_data: OrderUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(
         select(Order).where(Order.id == order_id).options(selectinload(Order.items))
@@ -139,40 +228,42 @@ async def update_order(
     if order.delivered_at:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot update delivered order")
     
+    state_before = order_state(order)
     if order_data.items is not None:
-        for item in order.items:
-            await db.delete(item)
-        await db.flush()
+        products = await resolve_products(db, [item.product_id for item in order_data.items])
+        missing_product_id = find_missing_product_id(order_data.items, products)
+        if missing_product_id is not None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Product {missing_product_id} not found")
         
-        for item_data in order_data.items:
-            result = await db.execute(select(Product).where(Product.id == item_data.product_id))
-            product = result.scalar_one_or_none()
-            if not product:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Product {item_data.product_id} not found")
-            
-            order_item = OrderItem(
-                order_id=order.id,
-                product_id=item_data.product_id,
-                product_name_snapshot=product.name,
-                quantity=item_data.quantity,
-                unit_price=item_data.unit_price,
-                total_price=item_data.quantity * item_data.unit_price
-            )
-            db.add(order_item)
+        reserved_before = quantities_by_product((item.product_id, item.quantity) for item in order.items)
+        reserved_after = quantities_by_product((item.product_id, item.quantity) for item in order_data.items)
+        
+        diff = await apply_order_item_diff(db, order, order_data.items, products)
+        order.total_amount = diff.total_amount
+        order.item_count = diff.item_count
+        await adjust_stock_balances(
+            db,
+            reserved_deltas={
+                product_id: reserved_after.get(product_id, 0) - reserved_before.get(product_id, 0)
+                for product_id in set(reserved_before) | set(reserved_after)
+            }
+        )
     
     order.updated_by = current_user.id
+    await apply_order_changes(db, [(state_before, order_state(order))])
     await db.commit()
     await db.refresh(order, ["items", "payments", "notes"])
     await log_activity(db, "orders", order.id, "updated", current_user.id)
+    event_bus.publish_change("orders", "updated", [order.id])
     
-    return await enrich_order_response(order)
+    return TrustedJSONResponse(order_response(order))
 
 
 @router.post("/{order_id}/deliver", response_model=OrderResponse)
 async def deliver_order(
     order_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(
         select(Order).where(Order.id == order_id).options(selectinload(Order.items))
@@ -187,17 +278,101 @@ async def deliver_order(
     if order.delivered_at:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Order already delivered")
     
+    state_before = order_state(order)
     order.delivered_at = datetime.utcnow()
     order.delivered_by = current_user.id
     
-    for item in order.items:
-        await create_delivery_stock_movement(db, item.product_id, item.quantity, order.id, current_user.id)
+    movement_ids = await create_delivery_stock_movements(
+        db,
+        [(order.id, item.product_id, item.quantity) for item in order.items],
+        current_user.id
+    )
+    await apply_order_changes(db, [(state_before, order_state(order))])
     
     await db.commit()
     await db.refresh(order, ["items", "payments", "notes"])
     await log_activity(db, "orders", order.id, "delivered", current_user.id)
+    event_bus.publish_change("orders", "delivered", [order.id])
+    event_bus.publish_change("stock_movements", "created", movement_ids)
     
-    return await enrich_order_response(order)
+    return TrustedJSONResponse(order_response(order))
+
+
+@router.post("/deliver-batch", response_model=OrderDeliverBatchResponse)
+async def deliver_orders_batch(
+    batch_data: OrderDeliverBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    order_ids = list(dict.fromkeys(batch_data.order_ids))
+    result = await db.execute(
+        select(
+            Order.id,
+            Order.customer_id,
+            Order.created_at,
+            Order.total_amount,
+            Order.paid_amount,
+            Order.is_cancelled,
+            Order.delivered_at
+        ).where(Order.id.in_(order_ids))
+    )
+    found = {row.id: row for row in result.all()}
+    
+    outcomes = {}
+    deliverable_ids = []
+    for order_id in order_ids:
+        row = found.get(order_id)
+        if row is None:
+            outcomes[order_id] = "not_found"
+        elif row.is_cancelled:
+            outcomes[order_id] = "cancelled"
+        elif row.delivered_at is not None:
+            outcomes[order_id] = "already_delivered"
+        else:
+            deliverable_ids.append(order_id)
+    
+    if deliverable_ids:
+        update_result = await db.execute(
+            update(Order)
+            .where(
+                Order.id.in_(deliverable_ids),
+                Order.delivered_at.is_(None),
+                Order.is_cancelled == False
+            )
+            .values(delivered_at=datetime.utcnow(), delivered_by=current_user.id, updated_at=datetime.utcnow())
+            .returning(Order.id)
+            .execution_options(synchronize_session=False)
+        )
+        delivered_ids = set(update_result.scalars().all())
+        for order_id in deliverable_ids:
+            outcomes[order_id] = "delivered" if order_id in delivered_ids else "conflict"
+        
+        items_result = await db.execute(
+            select(OrderItem.order_id, OrderItem.product_id, OrderItem.quantity)
+            .where(OrderItem.order_id.in_(delivered_ids))
+        )
+        movement_ids = await create_delivery_stock_movements(db, [tuple(row) for row in items_result.all()], current_user.id)
+        await log_activities(db, [
+            {
+                "table_name": "orders",
+                "record_id": order_id,
+                "action": "delivered",
+                "user_id": current_user.id
+            }
+            for order_id in deliverable_ids if order_id in delivered_ids
+        ])
+        await apply_order_changes(db, [
+            (state, with_changes(state, is_delivered=True))
+            for state in (order_state(found[order_id]) for order_id in delivered_ids)
+        ])
+        await db.commit()
+        event_bus.publish_change("orders", "delivered", sorted(delivered_ids))
+        event_bus.publish_change("stock_movements", "created", movement_ids)
+    
+    return {
+        "delivered_count": sum(1 for outcome in outcomes.values() if outcome == "delivered"),
+        "outcomes": [{"order_id": order_id, "status": outcomes[order_id]} for order_id in order_ids]
+    }
 
 
 @router.post("/{order_id}/cancel", response_model=OrderResponse)
@@ -205,7 +380,7 @@ async def cancel_order(
     order_id: int,
     cancel_data: OrderCancelRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(
         select(Order).where(Order.id == order_id).options(
@@ -221,15 +396,26 @@ async def cancel_order(
     if order.is_cancelled:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Order already cancelled")
     
+    state_before = order_state(order)
+    if order.delivered_at is None:
+        released = quantities_by_product((item.product_id, item.quantity) for item in order.items)
+        await adjust_stock_balances(
+            db,
+            reserved_deltas={product_id: -quantity for product_id, quantity in released.items()}
+        )
+    
     order.is_cancelled = True
+    order.cancelled_at = datetime.utcnow()
     order.cancelled_by = current_user.id
     order.cancellation_reason = cancel_data.cancellation_reason
+    await apply_order_changes(db, [(state_before, order_state(order))])
     
     await db.commit()
     await db.refresh(order)
     await log_activity(db, "orders", order.id, "cancelled", current_user.id, cancel_data.cancellation_reason)
+    event_bus.publish_change("orders", "cancelled", [order.id])
     
-    return await enrich_order_response(order)
+    return TrustedJSONResponse(order_response(order))
 
 
 @router.post("/{order_id}/notes", status_code=status.HTTP_201_CREATED)
@@ -237,7 +423,7 @@ async def add_order_note(
     order_id: int,
     note_data: OrderNoteCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(Order).where(Order.id == order_id))
     order = result.scalar_one_or_none()
@@ -260,7 +446,7 @@ async def delete_order_note(
     order_id: int,
     note_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(
         select(OrderNote).where(
@@ -272,7 +458,7 @@ async def delete_order_note(
     if not note:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
     
-    await log_activity(db, "order_notes", note_id, "note_deleted", current_user.id)
+    await log_activity(db, "order_notes", note_id, "note_deleted", current_user.id, same_transaction=True)
     await db.delete(note)
     await db.commit()
 
@@ -282,7 +468,7 @@ async def add_payment(
     order_id: int,
     payment_data: PaymentCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(Order).where(Order.id == order_id))
     order = result.scalar_one_or_none()
@@ -299,6 +485,13 @@ async def add_payment(
         received_by=current_user.id
     )
     db.add(payment)
+    state_before = order_state(order)
+    order.paid_amount = Order.paid_amount + payment_data.amount
+    await apply_order_changes(
+        db,
+        [(state_before, with_changes(state_before, paid_amount=state_before.paid_amount + payment_data.amount))]
+    )
     await db.commit()
     await log_activity(db, "payments", payment.id, "payment_added", current_user.id, f"Amount: {payment_data.amount}")
+    event_bus.publish_change("orders", "payment_added", [order_id])
     return {"message": "Payment added successfully"}
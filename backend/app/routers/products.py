@@ -2,20 +2,22 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database.session import get_db
-from app.models.user import User
 from app.models.product import Product
 from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse
-from app.core.security import get_current_user
+from app.core.security import CurrentUser, get_current_user
+from app.core.etag import versioned_etag
 from app.services.activity_log import log_activity
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
+products_etag = versioned_etag("products")
+
 
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
 async def create_product(
     product_data: ProductCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     product = Product(**product_data.model_dump())
     db.add(product)
@@ -25,11 +27,10 @@ async def create_product(
     return product
 
 
-@router.get("/", response_model=list[ProductResponse])
+@router.get("/", response_model=list[ProductResponse], dependencies=[Depends(get_current_user), Depends(products_etag)])
 async def list_products(
     is_active: bool | None = None,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db)
 ):
     query = select(Product)
     if is_active is not None:
@@ -40,11 +41,10 @@ async def list_products(
     return products
 
 
-@router.get("/{product_id}", response_model=ProductResponse)
+@router.get("/{product_id}", response_model=ProductResponse, dependencies=[Depends(get_current_user), Depends(products_etag)])
 async def get_product(
     product_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(select(Product).where(Product.id == product_id))
     product = result.scalar_one_or_none()
@@ -58,7 +58,7 @@ async def update_product(
     product_id: int,
     product_data: ProductUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(Product).where(Product.id == product_id))
     product = result.scalar_one_or_none()
@@ -1,134 +1,89 @@
-from fastapi import APIRouter, Depends
+from datetime import date, datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from app.database.session import get_db
-from app.models.user import User
-from app.models.order import Order, OrderItem
-from app.models.payment import Payment
-from app.models.stock_movement import StockMovement, MovementType
+from app.models.customer_revenue import CustomerRevenueRollup
+from app.models.stock_balance import ProductStockBalance
 from app.models.product import Product
 from app.models.customer import Customer
-from app.schemas.reports import DashboardReport, CustomerRevenueReport, StockReport
-from app.core.security import get_current_user
+from app.schemas.reports import DashboardReport, CustomerRevenueReport, StockReport, SalesTimeseriesPoint
+from app.core.security import CurrentUser, get_current_user
+from app.services.dashboard_metrics import get_dashboard_metrics
+from app.services.daily_sales import get_sales_timeseries
+from app.services.report_cache import report_cache
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
+MAX_TIMESERIES_DAYS = 3660
+DASHBOARD_TABLES = ("dashboard_metrics",)
+CUSTOMER_REVENUE_TABLES = ("customers", "customer_revenue_rollup")
+STOCK_TABLES = ("products", "product_stock_balance")
+TIMESERIES_TABLES = ("daily_sales",)
+
 
 @router.get("/dashboard", response_model=DashboardReport)
 async def get_dashboard_report(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    pending_deliveries = await db.execute(
-        select(func.count(Order.id)).where(
-            Order.delivered_at.is_(None),
-            Order.is_cancelled == False
-        )
-    )
-    pending_deliveries_count = pending_deliveries.scalar() or 0
-    
-    subquery = (
+    return await report_cache.get(db, ("dashboard",), DASHBOARD_TABLES, get_dashboard_metrics)
+
+
+CUSTOMER_REVENUE_SORT_COLUMNS = {
+    "total_revenue": CustomerRevenueRollup.total_revenue,
+    "outstanding_balance": CustomerRevenueRollup.outstanding_balance,
+    "billed_total": CustomerRevenueRollup.billed_total,
+    "order_count": CustomerRevenueRollup.order_count,
+    "last_order_at": CustomerRevenueRollup.last_order_at,
+}
+
+
+async def compute_customer_revenue(db: AsyncSession, limit: int, offset: int, sort_by: str) -> list[dict]:
+    sort_column = CUSTOMER_REVENUE_SORT_COLUMNS[sort_by]
+    result = await db.execute(
         select(
-            Order.id,
-            func.sum(OrderItem.total_price).label("total"),
-            func.coalesce(
-                select(func.sum(Payment.amount))
-                .where(Payment.order_id == Order.id)
-                .scalar_subquery(),
-                0
-            ).label("paid")
+            Customer.id.label("customer_id"),
+            Customer.name.label("customer_name"),
+            func.coalesce(CustomerRevenueRollup.total_revenue, 0.0).label("total_revenue"),
+            func.coalesce(CustomerRevenueRollup.billed_total, 0.0).label("billed_total"),
+            func.coalesce(CustomerRevenueRollup.outstanding_balance, 0.0).label("outstanding_balance"),
+            func.coalesce(CustomerRevenueRollup.order_count, 0).label("order_count"),
+            CustomerRevenueRollup.last_order_at
         )
-        .join(OrderItem, OrderItem.order_id == Order.id)
-        .where(Order.is_cancelled == False)
-        .group_by(Order.id)
-        .subquery()
-    )
-    
-    pending_payments = await db.execute(
-        select(func.count()).where(subquery.c.total > subquery.c.paid)
-    )
-    pending_payments_count = pending_payments.scalar() or 0
-    
-    total_revenue_result = await db.execute(
-        select(func.sum(Payment.amount))
-        .join(Order, Order.id == Payment.order_id)
-        .where(Order.is_cancelled == False)
+        .outerjoin(CustomerRevenueRollup, CustomerRevenueRollup.customer_id == Customer.id)
+        .order_by(sort_column.desc().nulls_last(), Customer.id)
+        .limit(limit)
+        .offset(offset)
     )
-    total_revenue = total_revenue_result.scalar() or 0.0
-    
-    return {
-        "pending_deliveries_count": pending_deliveries_count,
-        "pending_payments_count": pending_payments_count,
-        "total_revenue": total_revenue
-    }
+    return [dict(row._mapping) for row in result.all()]
 
 
 @router.get("/customer-revenue", response_model=list[CustomerRevenueReport])
 async def get_customer_revenue_report(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    sort_by: str = Query("total_revenue", pattern=f"^({'|'.join(CUSTOMER_REVENUE_SORT_COLUMNS)})$"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    result = await db.execute(
-        select(
-            Customer.id,
-            Customer.name,
-            func.coalesce(func.sum(Payment.amount), 0).label("total_revenue")
-        )
-        .outerjoin(Order, Order.customer_id == Customer.id)
-        .outerjoin(Payment, Payment.order_id == Order.id)
-        .where(Order.is_cancelled == False)
-        .group_by(Customer.id, Customer.name)
-        .order_by(func.coalesce(func.sum(Payment.amount), 0).desc())
+    return await report_cache.get(
+        db,
+        ("customer-revenue", limit, offset, sort_by),
+        CUSTOMER_REVENUE_TABLES,
+        lambda session: compute_customer_revenue(session, limit, offset, sort_by)
     )
-    
-    rows = result.all()
-    return [
-        {
-            "customer_id": row[0],
-            "customer_name": row[1],
-            "total_revenue": row[2]
-        }
-        for row in rows
-    ]
 
 
-@router.get("/stock", response_model=list[StockReport])
-async def get_stock_report(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    total_stock_query = (
-        select(
-            StockMovement.product_id,
-            func.sum(StockMovement.quantity).label("total_stock")
-        )
-        .group_by(StockMovement.product_id)
-        .subquery()
-    )
-    
-    reserved_stock_query = (
-        select(
-            OrderItem.product_id,
-            func.sum(OrderItem.quantity).label("reserved_stock")
-        )
-        .join(Order, Order.id == OrderItem.order_id)
-        .where(
-            Order.delivered_at.is_(None),
-            Order.is_cancelled == False
-        )
-        .group_by(OrderItem.product_id)
-        .subquery()
-    )
-    
+async def compute_stock_report(db: AsyncSession) -> list[dict]:
     result = await db.execute(
         select(
             Product.id,
             Product.name,
-            func.coalesce(total_stock_query.c.total_stock, 0).label("total_stock"),
-            func.coalesce(reserved_stock_query.c.reserved_stock, 0).label("reserved_stock")
+            func.coalesce(ProductStockBalance.on_hand, 0).label("total_stock"),
+            func.coalesce(ProductStockBalance.reserved, 0).label("reserved_stock")
         )
-        .outerjoin(total_stock_query, total_stock_query.c.product_id == Product.id)
-        .outerjoin(reserved_stock_query, reserved_stock_query.c.product_id == Product.id)
+        .outerjoin(ProductStockBalance, ProductStockBalance.product_id == Product.id)
         .order_by(Product.name)
     )
     
@@ -143,3 +98,34 @@ async def get_stock_report(
         }
         for row in rows
     ]
+
+
+@router.get("/stock", response_model=list[StockReport])
+async def get_stock_report(
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    return await report_cache.get(db, ("stock",), STOCK_TABLES, compute_stock_report)
+
+
+@router.get("/timeseries", response_model=list[SalesTimeseriesPoint])
+async def get_sales_timeseries_report(
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    granularity: str = Query("day", pattern="^(day|week|month)$"),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    date_to = date_to or datetime.utcnow().date()
+    date_from = date_from or date_to - timedelta(days=29)
+    if date_from > date_to:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'from' must not be after 'to'")
+    if (date_to - date_from).days > MAX_TIMESERIES_DAYS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Date range cannot exceed {MAX_TIMESERIES_DAYS} days")
+    
+    return await report_cache.get(
+        db,
+        ("timeseries", date_from, date_to, granularity),
+        TIMESERIES_TABLES,
+        lambda session: get_sales_timeseries(session, date_from, date_to, granularity)
+    )
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.session import get_db
+from app.schemas.search import SearchResult
+from app.core.security import CurrentUser, get_current_user
+from app.services.search import search
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("/", response_model=list[SearchResult])
+async def search_records(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    return await search(db, q, limit)
@@ -2,20 +2,25 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.database.session import get_db
-from app.models.user import User
-from app.models.stock_movement import StockMovement
+from app.models.stock_movement import StockMovement, MovementType
 from app.schemas.stock_movement import StockMovementCreate, StockMovementResponse
-from app.core.security import get_current_user
+from app.core.security import CurrentUser, get_current_user
+from app.core.etag import versioned_etag
 from app.services.activity_log import log_activity
+from app.services.event_bus import event_bus
+from app.services.stock_service import adjust_stock_balances
+from app.services.daily_sales import record_items_sold
 
 router = APIRouter(prefix="/stock-movements", tags=["Stock Movements"])
 
+stock_movements_etag = versioned_etag("stock_movements")
+
 
 @router.post("/", response_model=StockMovementResponse, status_code=status.HTTP_201_CREATED)
 async def create_stock_movement(
     movement_data: StockMovementCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     average_unit_cost = None
     if movement_data.total_cost is not None and movement_data.quantity != 0:
@@ -33,17 +38,25 @@ async def create_stock_movement(
         created_by=current_user.id
     )
     db.add(movement)
+    await db.flush()
+    await adjust_stock_balances(
+        db,
+        on_hand_deltas={movement.product_id: movement.quantity},
+        last_movement_ids={movement.product_id: movement.id}
+    )
+    if movement.movement_type == MovementType.DELIVERY:
+        await record_items_sold(db, -movement.quantity, movement.created_at)
     await db.commit()
     await db.refresh(movement)
     await log_activity(db, "stock_movements", movement.id, f"stock_{movement_data.movement_type}", current_user.id)
+    event_bus.publish_change("stock_movements", "created", [movement.id])
     return movement
 
 
-@router.get("/", response_model=list[StockMovementResponse])
+@router.get("/", response_model=list[StockMovementResponse], dependencies=[Depends(get_current_user), Depends(stock_movements_etag)])
 async def list_stock_movements(
     product_id: int | None = None,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db)
 ):
     query = select(StockMovement)
     if product_id is not None:
@@ -54,11 +67,10 @@ async def list_stock_movements(
     return movements
 
 
-@router.get("/{movement_id}", response_model=StockMovementResponse)
+@router.get("/{movement_id}", response_model=StockMovementResponse, dependencies=[Depends(get_current_user), Depends(stock_movements_etag)])
 async def get_stock_movement(
     movement_id: int,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db)
 ):
     result = await db.execute(select(StockMovement).where(StockMovement.id == movement_id))
     movement = result.scalar_one_or_none()
@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.session import get_db
+from app.models.customer import Customer
+from app.schemas.customer import CustomerResponse, CustomerStatusResponse, CustomerNoteResponse
+from app.schemas.product import ProductResponse
+from app.schemas.stock_movement import StockMovementResponse
+from app.schemas.sync import SyncChanges, SyncTombstoneResponse
+from app.core.config import settings
+from app.core.security import CurrentUser, get_current_user
+from app.routers.orders import order_response
+from app.services.sync import get_sync_changes
+from app.utils.pagination import encode_positions, decode_positions
+from app.utils.serialization import TrustedJSONResponse, attribute_values, response_fields
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+CUSTOMER_FIELDS = response_fields(CustomerResponse)
+CUSTOMER_STATUS_FIELDS = response_fields(CustomerStatusResponse)
+CUSTOMER_NOTE_FIELDS = response_fields(CustomerNoteResponse)
+PRODUCT_FIELDS = response_fields(ProductResponse)
+STOCK_MOVEMENT_FIELDS = response_fields(StockMovementResponse)
+TOMBSTONE_FIELDS = response_fields(SyncTombstoneResponse)
+
+
+def customer_response(customer: Customer) -> dict:
+    return attribute_values(
+        customer,
+        CUSTOMER_FIELDS,
+        statuses=[attribute_values(customer_status, CUSTOMER_STATUS_FIELDS) for customer_status in customer.statuses],
+        notes=[attribute_values(note, CUSTOMER_NOTE_FIELDS) for note in customer.notes]
+    )
+
+
+@router.get("/", response_model=SyncChanges)
+async def get_changes(
+    since: str | None = None,
+    limit: int = Query(settings.SYNC_PAGE_SIZE, ge=1, le=2000),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    positions = {}
+    if since is not None:
+        try:
+            positions = decode_positions(since)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    
+    changes, next_positions, has_more = await get_sync_changes(db, positions, limit, settings.SYNC_SETTLE_SECONDS)
+    
+    return TrustedJSONResponse({
+        "orders": [order_response(order) for order in changes["orders"]],
+        "customers": [customer_response(customer) for customer in changes["customers"]],
+        "products": [attribute_values(product, PRODUCT_FIELDS) for product in changes["products"]],
+        "stock_movements": [attribute_values(movement, STOCK_MOVEMENT_FIELDS) for movement in changes["stock_movements"]],
+        "deleted": [attribute_values(tombstone, TOMBSTONE_FIELDS) for tombstone in changes["deleted"]],
+        "next_cursor": encode_positions(next_positions),
+        "has_more": has_more
+    })
@@ -4,7 +4,7 @@ from sqlalchemy import select
 from app.database.session import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
-from app.core.security import get_current_user, get_password_hash
+from app.core.security import CurrentUser, get_current_user, hash_password, invalidate_cached_user
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 async def create_user(
     user_data: UserCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(User).where(User.username == user_data.username))
     if result.scalar_one_or_none():
@@ -22,7 +22,7 @@ async def create_user(
     user = User(
         username=user_data.username,
         full_name=user_data.full_name,
-        hashed_password=get_password_hash(user_data.password)
+        hashed_password=await hash_password(user_data.password)
     )
     db.add(user)
     await db.commit()
@@ -33,7 +33,7 @@ async def create_user(
 @router.get("/", response_model=list[UserResponse])
 async def list_users(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(User))
     users = result.scalars().all()
@@ -44,7 +44,7 @@ async def list_users(
 async def get_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
@@ -58,7 +58,7 @@ async def update_user(
     user_id: int,
     user_data: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
@@ -68,17 +68,20 @@ async def update_user(
     if user_data.full_name is not None:
         user.full_name = user_data.full_name
     if user_data.password is not None:
-        user.hashed_password = get_password_hash(user_data.password)
+        user.hashed_password = await hash_password(user_data.password)
     if user_data.is_active is not None:
         user.is_active = user_data.is_active
     
     await db.commit()
+    invalidate_cached_user(user.id)
     await db.refresh(user)
     return user
 
 
 @router.get("/me/profile", response_model=UserResponse)
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
-    return current_user
+    result = await db.execute(select(User).where(User.id == current_user.id))
+    return result.scalar_one()
@@ -12,3 +12,8 @@ class ActivityLogResponse(BaseModel):
     details: str | None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ActivityLogPage(BaseModel):
+    items: list[ActivityLogResponse]
+    next_cursor: str | None = None
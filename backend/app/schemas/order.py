@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
@@ -54,6 +54,7 @@ class OrderResponse(BaseModel):
     updated_by: int | None = None
     cancelled_by: int | None = None
     cancellation_reason: str | None = None
+    cancelled_at: datetime | None = None
     delivered_at: datetime | None = None
     delivered_by: int | None = None
     is_cancelled: bool
@@ -64,6 +65,7 @@ class OrderResponse(BaseModel):
     notes: list[OrderNoteResponse] = []
     total_amount: float
     paid_amount: float
+    item_count: int
     remaining_amount: float
     is_fully_paid: bool
     is_delivered: bool
@@ -72,6 +74,11 @@ class OrderResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class OrderPage(BaseModel):
+    items: list[OrderResponse]
+    next_cursor: str | None = None
+
+
 class OrderNoteCreate(BaseModel):
     note: str
 
@@ -83,3 +90,31 @@ class PaymentCreate(BaseModel):
 
 class OrderCancelRequest(BaseModel):
     cancellation_reason: str
+
+
+class OrderImportError(BaseModel):
+    row: int
+    error: str
+
+
+class OrderImportReport(BaseModel):
+    processed_rows: int
+    imported_orders: int
+    imported_items: int
+    failed_orders: int
+    errors: list[OrderImportError] = []
+    errors_truncated: bool = False
+
+
+class OrderDeliverBatchRequest(BaseModel):
+    order_ids: list[int] = Field(min_length=1, max_length=1000)
+
+
+class OrderDeliveryOutcome(BaseModel):
+    order_id: int
+    status: str
+
+
+class OrderDeliverBatchResponse(BaseModel):
+    delivered_count: int
+    outcomes: list[OrderDeliveryOutcome]
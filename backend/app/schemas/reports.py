@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from datetime import date, datetime
 
 
 class DashboardReport(BaseModel):
@@ -11,6 +12,10 @@ class CustomerRevenueReport(BaseModel):
     customer_id: int
     customer_name: str
     total_revenue: float
+    billed_total: float
+    outstanding_balance: float
+    order_count: int
+    last_order_at: datetime | None
 
 
 class StockReport(BaseModel):
@@ -19,3 +24,13 @@ class StockReport(BaseModel):
     total_stock: int
     reserved_stock: int
     available_stock: int
+
+
+class SalesTimeseriesPoint(BaseModel):
+    period_start: date
+    billed_total: float
+    collected_total: float
+    items_sold: int
+    orders_created: int
+    orders_delivered: int
+    orders_cancelled: int
@@ -0,0 +1,11 @@
+from typing import Literal
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    type: Literal["customer", "product", "order_note", "customer_note"]
+    id: int
+    title: str
+    detail: str | None = None
+    order_id: int | None = None
+    customer_id: int | None = None
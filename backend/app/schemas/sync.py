@@ -0,0 +1,24 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from app.schemas.customer import CustomerResponse
+from app.schemas.order import OrderResponse
+from app.schemas.product import ProductResponse
+from app.schemas.stock_movement import StockMovementResponse
+
+
+class SyncTombstoneResponse(BaseModel):
+    table_name: str
+    record_id: int
+    deleted_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SyncChanges(BaseModel):
+    orders: list[OrderResponse]
+    customers: list[CustomerResponse]
+    products: list[ProductResponse]
+    stock_movements: list[StockMovementResponse]
+    deleted: list[SyncTombstoneResponse]
+    next_cursor: str
+    has_more: bool
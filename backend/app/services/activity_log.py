@@ -1,21 +1,108 @@
+import asyncio
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert
+from app.core.config import settings
+from app.core.logging import logger
+from app.database.session import AsyncSessionLocal
 from app.models.activity_log import ActivityLog
 
 
+class ActivityLogWriter:
+    # Entries are queued by request handlers and bulk-inserted by one background task,
+    # so a write endpoint pays for a single commit. A full queue blocks the producer.
+    def __init__(self, batch_size: int, flush_interval: float, max_queue_size: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.queue: asyncio.Queue | None = None
+        self.task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def start(self):
+        self.queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if not self.running:
+            return
+        await self.queue.put(None)
+        await self.task
+        self.task = None
+
+    async def enqueue(self, entry: dict):
+        await self.queue.put(entry)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await self.queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._write(batch)
+
+    async def _write(self, batch: list[dict]):
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(ActivityLog), batch)
+                await session.commit()
+        except Exception:
+            logger.exception(f"Failed to write {len(batch)} activity log entries")
+
+
+activity_log_writer = ActivityLogWriter(
+    settings.AUDIT_BATCH_SIZE,
+    settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    settings.AUDIT_QUEUE_MAX_SIZE
+)
+
+
 async def log_activity(
     db: AsyncSession,
     table_name: str,
     record_id: int,
     action: str,
     user_id: int,
-    details: str = None
+    details: str = None,
+    same_transaction: bool = False
 ):
-    log = ActivityLog(
-        table_name=table_name,
-        record_id=record_id,
-        action=action,
-        user_id=user_id,
-        details=details
-    )
-    db.add(log)
-    await db.commit()
+    entry = {
+        "table_name": table_name,
+        "record_id": record_id,
+        "action": action,
+        "user_id": user_id,
+        "details": details,
+        "created_at": datetime.utcnow()
+    }
+    if same_transaction:
+        # The entry is committed (or rolled back) together with the caller's change.
+        db.add(ActivityLog(**entry))
+    elif activity_log_writer.running:
+        await activity_log_writer.enqueue(entry)
+    else:
+        db.add(ActivityLog(**entry))
+        await db.commit()
+
+
+async def log_activities(db: AsyncSession, entries: list[dict]):
+    # Bulk variant for batch endpoints: rows are written in the caller's transaction.
+    if entries:
+        await db.execute(insert(ActivityLog), entries)
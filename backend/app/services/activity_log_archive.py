@@ -0,0 +1,150 @@
+import os
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncEngine, create_async_engine
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.core.config import settings
+from app.core.logging import logger
+from app.models.activity_log import ActivityLog
+from app.models.activity_log_archive import ActivityLogArchive
+
+ARCHIVE_BATCH_SIZE = 5000
+
+_archive_engines: dict[str, AsyncEngine] = {}
+
+
+def _month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def _next_month(value: datetime) -> datetime:
+    return datetime(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+def archive_path(file_name: str) -> str:
+    return os.path.join(settings.ACTIVITY_LOG_ARCHIVE_DIR, file_name)
+
+
+def get_archive_engine(file_name: str) -> AsyncEngine:
+    path = archive_path(file_name)
+    engine = _archive_engines.get(path)
+    if engine is None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        _archive_engines[path] = engine
+    return engine
+
+
+async def dispose_archive_engines():
+    for engine in _archive_engines.values():
+        await engine.dispose()
+    _archive_engines.clear()
+
+
+async def archive_activity_logs(db: AsyncSession, cutoff: datetime) -> dict[str, int]:
+    # Rows older than the cutoff move into one SQLite file per month, which keeps the
+    # activity_logs table (and its indexes) so the files can be queried directly.
+    os.makedirs(settings.ACTIVITY_LOG_ARCHIVE_DIR, exist_ok=True)
+    # activity_logs.id has no AUTOINCREMENT, so SQLite hands out max(id) + 1; the row
+    # holding the highest id stays behind so archived ids are never reused.
+    newest_id = await db.scalar(select(func.max(ActivityLog.id)))
+    oldest = await db.scalar(
+        select(func.min(ActivityLog.created_at)).where(ActivityLog.created_at < cutoff, ActivityLog.id != newest_id)
+    )
+    moved = {}
+    month_start = _month_start(oldest) if oldest is not None else None
+    while month_start is not None and month_start < cutoff:
+        count = await _archive_month(db, month_start, min(_next_month(month_start), cutoff), newest_id)
+        if count:
+            moved[month_start.strftime("%Y-%m")] = count
+        month_start = _next_month(month_start)
+    return moved
+
+
+async def _archive_month(db: AsyncSession, start: datetime, end: datetime, newest_id: int) -> int:
+    month = start.strftime("%Y-%m")
+    file_name = f"activity_logs_{start:%Y_%m}.sqlite"
+    engine = get_archive_engine(file_name)
+    async with engine.begin() as conn:
+        await conn.run_sync(ActivityLog.__table__.create, checkfirst=True)
+
+    columns = ActivityLog.__table__.c
+    moved = 0
+    while True:
+        result = await db.execute(
+            select(*columns)
+            .where(ActivityLog.created_at >= start, ActivityLog.created_at < end, ActivityLog.id != newest_id)
+            .order_by(ActivityLog.created_at, ActivityLog.id)
+            .limit(ARCHIVE_BATCH_SIZE)
+        )
+        rows = [dict(row._mapping) for row in result]
+        if not rows:
+            return moved
+
+        # The archive commits first and ignores ids it already holds, so a crash between
+        # the two commits only leaves rows to be copied again on the next run.
+        async with engine.begin() as conn:
+            await conn.execute(sqlite_insert(ActivityLog).on_conflict_do_nothing(index_elements=["id"]), rows)
+            row_count, first_created_at, last_created_at = (await conn.execute(
+                select(func.count(), func.min(columns.created_at), func.max(columns.created_at))
+            )).one()
+
+        await db.execute(delete(ActivityLog).where(ActivityLog.id.in_([row["id"] for row in rows])))
+        stmt = sqlite_insert(ActivityLogArchive).values(
+            month=month,
+            file_name=file_name,
+            row_count=row_count,
+            first_created_at=first_created_at,
+            last_created_at=last_created_at,
+            updated_at=datetime.utcnow()
+        )
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[ActivityLogArchive.month],
+            set_={
+                "row_count": stmt.excluded.row_count,
+                "first_created_at": stmt.excluded.first_created_at,
+                "last_created_at": stmt.excluded.last_created_at,
+                "updated_at": stmt.excluded.updated_at
+            }
+        ))
+        await db.commit()
+        moved += len(rows)
+
+
+async def merge_archived_activity_logs(
+    db: AsyncSession,
+    conditions: list,
+    logs: list,
+    limit: int,
+    created_from: datetime | None,
+    created_to: datetime | None
+) -> list:
+    # Archives are visited newest month first and only while they could still
+    # contribute to the requested page.
+    query = select(ActivityLogArchive).order_by(ActivityLogArchive.month.desc())
+    if created_from is not None:
+        query = query.where(ActivityLogArchive.last_created_at >= created_from)
+    if created_to is not None:
+        query = query.where(ActivityLogArchive.first_created_at < created_to)
+    archives = (await db.execute(query)).scalars().all()
+
+    for archive in archives:
+        if len(logs) >= limit and logs[limit - 1].created_at > archive.last_created_at:
+            break
+        if not os.path.exists(archive_path(archive.file_name)):
+            logger.warning(f"Activity log archive {archive.file_name} is missing")
+            continue
+        async with get_archive_engine(archive.file_name).connect() as conn:
+            result = await conn.execute(
+                select(*ActivityLog.__table__.c)
+                .where(*conditions)
+                .order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc())
+                .limit(limit)
+            )
+            archived = result.all()
+        seen_ids = {log.id for log in logs}
+        logs = sorted(
+            [*logs, *(row for row in archived if row.id not in seen_ids)],
+            key=lambda log: (log.created_at, log.id),
+            reverse=True
+        )[:limit]
+    return logs
@@ -0,0 +1,147 @@
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, insert, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.customer_revenue import CustomerRevenueRollup
+from app.models.order import Order
+
+AMOUNT_TOLERANCE = 0.005
+
+
+def _contribution(state) -> tuple[int, float, float]:
+    if state is None or state.is_cancelled:
+        return 0, 0.0, 0.0
+    return 1, state.total_amount, state.paid_amount
+
+
+def _last_order_subquery(customer_id):
+    return (
+        select(func.max(Order.created_at))
+        .where(Order.customer_id == customer_id, Order.is_cancelled == False)
+        .scalar_subquery()
+    )
+
+
+async def apply_customer_revenue_deltas(db: AsyncSession, changes: list[tuple]):
+    deltas: dict[int, dict] = {}
+    lost_orders: set[int] = set()
+    for before, after in changes:
+        state = after or before
+        old = _contribution(before)
+        new = _contribution(after)
+        delta = deltas.setdefault(
+            state.customer_id,
+            {"order_count": 0, "billed_total": 0.0, "total_revenue": 0.0, "last_order_at": None}
+        )
+        delta["order_count"] += new[0] - old[0]
+        delta["billed_total"] += new[1] - old[1]
+        delta["total_revenue"] += new[2] - old[2]
+        if new[0] and not old[0]:
+            if delta["last_order_at"] is None or state.created_at > delta["last_order_at"]:
+                delta["last_order_at"] = state.created_at
+        elif old[0] and not new[0]:
+            lost_orders.add(state.customer_id)
+    
+    rows = [
+        {
+            "customer_id": customer_id,
+            "order_count": delta["order_count"],
+            "billed_total": delta["billed_total"],
+            "total_revenue": delta["total_revenue"],
+            "outstanding_balance": delta["billed_total"] - delta["total_revenue"],
+            "last_order_at": delta["last_order_at"],
+            "updated_at": datetime.utcnow()
+        }
+        for customer_id, delta in deltas.items()
+        if delta["order_count"] or delta["billed_total"] or delta["total_revenue"] or delta["last_order_at"]
+    ]
+    if rows:
+        stmt = sqlite_insert(CustomerRevenueRollup)
+        rollup = CustomerRevenueRollup.__table__.c
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[rollup.customer_id],
+                set_={
+                    "order_count": rollup.order_count + stmt.excluded.order_count,
+                    "billed_total": rollup.billed_total + stmt.excluded.billed_total,
+                    "total_revenue": rollup.total_revenue + stmt.excluded.total_revenue,
+                    "outstanding_balance": rollup.outstanding_balance + stmt.excluded.outstanding_balance,
+                    "last_order_at": func.coalesce(
+                        func.max(rollup.last_order_at, stmt.excluded.last_order_at),
+                        rollup.last_order_at,
+                        stmt.excluded.last_order_at
+                    ),
+                    "updated_at": stmt.excluded.updated_at
+                }
+            ),
+            rows
+        )
+    
+    # A cancelled order may have been the customer's latest one.
+    for customer_id in lost_orders:
+        await db.execute(
+            update(CustomerRevenueRollup)
+            .where(CustomerRevenueRollup.customer_id == customer_id)
+            .values(last_order_at=_last_order_subquery(customer_id))
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def compute_customer_revenue(db: AsyncSession) -> dict[int, dict]:
+    result = await db.execute(
+        select(
+            Order.customer_id,
+            func.count(Order.id),
+            func.sum(Order.total_amount),
+            func.sum(Order.paid_amount),
+            func.max(Order.created_at)
+        )
+        .where(Order.is_cancelled == False)
+        .group_by(Order.customer_id)
+    )
+    return {
+        customer_id: {
+            "order_count": order_count,
+            "billed_total": billed_total or 0.0,
+            "total_revenue": total_revenue or 0.0,
+            "outstanding_balance": (billed_total or 0.0) - (total_revenue or 0.0),
+            "last_order_at": last_order_at
+        }
+        for customer_id, order_count, billed_total, total_revenue, last_order_at in result.all()
+    }
+
+
+async def find_customer_revenue_mismatches(db: AsyncSession) -> list[int]:
+    expected = await compute_customer_revenue(db)
+    result = await db.execute(select(CustomerRevenueRollup))
+    stored = {rollup.customer_id: rollup for rollup in result.scalars().all()}
+    
+    mismatched = []
+    for customer_id in sorted(set(expected) | set(stored)):
+        want = expected.get(customer_id)
+        have = stored.get(customer_id)
+        if want is None:
+            if have.order_count or abs(have.billed_total) > AMOUNT_TOLERANCE or abs(have.total_revenue) > AMOUNT_TOLERANCE:
+                mismatched.append(customer_id)
+        elif (
+            have is None
+            or have.order_count != want["order_count"]
+            or abs(have.billed_total - want["billed_total"]) > AMOUNT_TOLERANCE
+            or abs(have.total_revenue - want["total_revenue"]) > AMOUNT_TOLERANCE
+            or abs(have.outstanding_balance - want["outstanding_balance"]) > AMOUNT_TOLERANCE
+            or have.last_order_at != want["last_order_at"]
+        ):
+            mismatched.append(customer_id)
+    return mismatched
+
+
+async def rebuild_customer_revenue_rollup(db: AsyncSession) -> int:
+    rollups = await compute_customer_revenue(db)
+    await db.execute(delete(CustomerRevenueRollup))
+    rows = [
+        {"customer_id": customer_id, "updated_at": datetime.utcnow(), **values}
+        for customer_id, values in rollups.items()
+    ]
+    if rows:
+        await db.execute(insert(CustomerRevenueRollup), rows)
+    return len(rows)
@@ -0,0 +1,170 @@
+from datetime import date, datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.models.daily_sales import DailySales
+from app.models.order import Order
+from app.models.payment import Payment
+from app.models.stock_movement import StockMovement, MovementType
+
+METRICS = ("billed_total", "collected_total", "items_sold", "orders_created", "orders_delivered", "orders_cancelled")
+AMOUNT_TOLERANCE = 0.005
+
+
+def _empty() -> dict:
+    return {"billed_total": 0.0, "collected_total": 0.0, "items_sold": 0, "orders_created": 0, "orders_delivered": 0, "orders_cancelled": 0}
+
+
+async def apply_daily_sales_deltas(db: AsyncSession, deltas: dict[date, dict]):
+    rows = [
+        {"day": day, "updated_at": datetime.utcnow(), **{metric: delta.get(metric, 0) for metric in METRICS}}
+        for day, delta in deltas.items()
+        if any(delta.get(metric) for metric in METRICS)
+    ]
+    if not rows:
+        return
+    stmt = sqlite_insert(DailySales)
+    columns = DailySales.__table__.c
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[columns.day],
+            set_={
+                **{metric: columns[metric] + stmt.excluded[metric] for metric in METRICS},
+                "updated_at": stmt.excluded.updated_at
+            }
+        ),
+        rows
+    )
+
+
+def order_changes_to_daily_deltas(changes: list[tuple], at: datetime) -> dict[date, dict]:
+    # Billed totals belong to the day the order was placed; payments, deliveries
+    # and cancellations to the day they happen.
+    deltas: dict[date, dict] = {}
+    today = at.date()
+    for before, after in changes:
+        state = after or before
+        created = deltas.setdefault(state.created_at.date(), _empty())
+        changed = deltas.setdefault(today, _empty())
+        
+        if before is None:
+            created["orders_created"] += 1
+        old_billed = 0.0 if before is None or before.is_cancelled else before.total_amount
+        new_billed = 0.0 if after is None or after.is_cancelled else after.total_amount
+        created["billed_total"] += new_billed - old_billed
+        
+        changed["collected_total"] += (after.paid_amount if after else 0.0) - (before.paid_amount if before else 0.0)
+        if after is not None and after.is_delivered and (before is None or not before.is_delivered):
+            changed["orders_delivered"] += 1
+        if after is not None and after.is_cancelled and (before is None or not before.is_cancelled):
+            changed["orders_cancelled"] += 1
+    return deltas
+
+
+async def record_items_sold(db: AsyncSession, units: int, at: datetime | None = None):
+    if units:
+        await apply_daily_sales_deltas(db, {(at or datetime.utcnow()).date(): {"items_sold": units}})
+
+
+async def compute_daily_sales(db: AsyncSession) -> dict[date, dict]:
+    days: dict[date, dict] = {}
+    
+    def add(rows, metric):
+        for day, value in rows:
+            if day is not None:
+                days.setdefault(date.fromisoformat(day), _empty())[metric] += value or 0
+    
+    order_day = func.date(Order.created_at)
+    result = await db.execute(select(order_day, func.count(Order.id)).group_by(order_day))
+    add(result.all(), "orders_created")
+    result = await db.execute(
+        select(order_day, func.sum(Order.total_amount)).where(Order.is_cancelled == False).group_by(order_day)
+    )
+    add(result.all(), "billed_total")
+    
+    payment_day = func.date(Payment.created_at)
+    result = await db.execute(select(payment_day, func.sum(Payment.amount)).group_by(payment_day))
+    add(result.all(), "collected_total")
+    
+    delivery_day = func.date(Order.delivered_at)
+    result = await db.execute(
+        select(delivery_day, func.count(Order.id)).where(Order.delivered_at.is_not(None)).group_by(delivery_day)
+    )
+    add(result.all(), "orders_delivered")
+    
+    cancel_day = func.date(Order.cancelled_at)
+    result = await db.execute(
+        select(cancel_day, func.count(Order.id)).where(Order.is_cancelled == True).group_by(cancel_day)
+    )
+    add(result.all(), "orders_cancelled")
+    
+    movement_day = func.date(StockMovement.created_at)
+    result = await db.execute(
+        select(movement_day, func.sum(-StockMovement.quantity))
+        .where(StockMovement.movement_type == MovementType.DELIVERY)
+        .group_by(movement_day)
+    )
+    add(result.all(), "items_sold")
+    return days
+
+
+async def find_daily_sales_mismatches(db: AsyncSession) -> list[str]:
+    expected = await compute_daily_sales(db)
+    result = await db.execute(select(DailySales))
+    stored = {row.day: row for row in result.scalars().all()}
+    
+    mismatched = []
+    for day in sorted(set(expected) | set(stored)):
+        want = expected.get(day, _empty())
+        have = stored.get(day)
+        for metric in METRICS:
+            value = getattr(have, metric) if have is not None else 0
+            if abs(value - want[metric]) > AMOUNT_TOLERANCE:
+                mismatched.append(day.isoformat())
+                break
+    return mismatched
+
+
+async def rebuild_daily_sales(db: AsyncSession) -> int:
+    days = await compute_daily_sales(db)
+    await db.execute(delete(DailySales))
+    rows = [{"day": day, "updated_at": datetime.utcnow(), **values} for day, values in days.items()]
+    if rows:
+        await db.execute(insert(DailySales), rows)
+    return len(rows)
+
+
+def period_start(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_period(start: date, granularity: str) -> date:
+    if granularity == "week":
+        return start + timedelta(days=7)
+    if granularity == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+async def get_sales_timeseries(db: AsyncSession, date_from: date, date_to: date, granularity: str) -> list[dict]:
+    result = await db.execute(
+        select(DailySales)
+        .where(DailySales.day >= date_from, DailySales.day <= date_to)
+        .order_by(DailySales.day)
+    )
+    buckets: dict[date, dict] = {}
+    start = period_start(date_from, granularity)
+    while start <= date_to:
+        buckets[start] = _empty()
+        start = next_period(start, granularity)
+    
+    for row in result.scalars().all():
+        bucket = buckets[period_start(row.day, granularity)]
+        for metric in METRICS:
+            bucket[metric] += getattr(row, metric)
+    
+    return [{"period_start": start, **values} for start, values in buckets.items()]
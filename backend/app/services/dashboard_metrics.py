@@ -0,0 +1,127 @@
+import asyncio
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.core.logging import logger
+from app.database.session import AsyncSessionLocal
+from app.models.dashboard_metrics import DashboardMetrics
+from app.models.order import Order
+
+METRICS_ROW_ID = 1
+REVENUE_TOLERANCE = 0.005
+
+
+def _contribution(state) -> tuple[int, int, float]:
+    if state is None or state.is_cancelled:
+        return 0, 0, 0.0
+    return (
+        0 if state.is_delivered else 1,
+        1 if state.total_amount > state.paid_amount else 0,
+        state.paid_amount
+    )
+
+
+async def apply_dashboard_deltas(db: AsyncSession, changes: list[tuple]):
+    pending_deliveries = pending_payments = 0
+    revenue = 0.0
+    for before, after in changes:
+        old = _contribution(before)
+        new = _contribution(after)
+        pending_deliveries += new[0] - old[0]
+        pending_payments += new[1] - old[1]
+        revenue += new[2] - old[2]
+    
+    if pending_deliveries == 0 and pending_payments == 0 and revenue == 0:
+        return
+    # A missing row is left alone: the next read recomputes it from scratch.
+    await db.execute(
+        update(DashboardMetrics)
+        .where(DashboardMetrics.id == METRICS_ROW_ID)
+        .values(
+            pending_deliveries_count=DashboardMetrics.pending_deliveries_count + pending_deliveries,
+            pending_payments_count=DashboardMetrics.pending_payments_count + pending_payments,
+            total_revenue=DashboardMetrics.total_revenue + revenue,
+            updated_at=datetime.utcnow()
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def compute_dashboard_metrics(db: AsyncSession) -> dict:
+    result = await db.execute(
+        select(
+            func.count(Order.id).filter(Order.delivered_at.is_(None)),
+            func.count(Order.id).filter(Order.total_amount > Order.paid_amount),
+            func.coalesce(func.sum(Order.paid_amount), 0.0)
+        ).where(Order.is_cancelled == False)
+    )
+    pending_deliveries_count, pending_payments_count, total_revenue = result.one()
+    return {
+        "pending_deliveries_count": pending_deliveries_count,
+        "pending_payments_count": pending_payments_count,
+        "total_revenue": total_revenue
+    }
+
+
+def _as_dict(metrics: DashboardMetrics) -> dict:
+    return {
+        "pending_deliveries_count": metrics.pending_deliveries_count,
+        "pending_payments_count": metrics.pending_payments_count,
+        "total_revenue": metrics.total_revenue
+    }
+
+
+def _differs(stored: dict, expected: dict) -> bool:
+    return (
+        stored["pending_deliveries_count"] != expected["pending_deliveries_count"]
+        or stored["pending_payments_count"] != expected["pending_payments_count"]
+        or abs(stored["total_revenue"] - expected["total_revenue"]) > REVENUE_TOLERANCE
+    )
+
+
+async def recompute_dashboard_metrics(db: AsyncSession) -> tuple[dict, dict | None]:
+    # Returns the fresh metrics and the previously stored ones when they had drifted.
+    expected = await compute_dashboard_metrics(db)
+    metrics = await db.get(DashboardMetrics, METRICS_ROW_ID, populate_existing=True)
+    drifted = None
+    if metrics is None:
+        # Concurrent first reads may all get here; the upsert keeps the last writer's values.
+        stmt = sqlite_insert(DashboardMetrics).values(id=METRICS_ROW_ID, recomputed_at=datetime.utcnow(), **expected)
+        await db.execute(stmt.on_conflict_do_update(index_elements=[DashboardMetrics.id], set_=expected))
+    else:
+        stored = _as_dict(metrics)
+        if _differs(stored, expected):
+            drifted = stored
+        for field, value in expected.items():
+            setattr(metrics, field, value)
+        metrics.recomputed_at = datetime.utcnow()
+    await db.commit()
+    return expected, drifted
+
+
+async def get_dashboard_metrics(db: AsyncSession) -> dict:
+    result = await db.execute(
+        select(
+            DashboardMetrics.pending_deliveries_count,
+            DashboardMetrics.pending_payments_count,
+            DashboardMetrics.total_revenue
+        ).where(DashboardMetrics.id == METRICS_ROW_ID)
+    )
+    row = result.one_or_none()
+    if row is None:
+        metrics, _ = await recompute_dashboard_metrics(db)
+        return metrics
+    return dict(row._mapping)
+
+
+async def run_dashboard_recompute_loop(interval_seconds: int):
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with AsyncSessionLocal() as session:
+                _, drifted = await recompute_dashboard_metrics(session)
+            if drifted is not None:
+                logger.warning(f"Dashboard metrics drifted and were recomputed (stored: {drifted})")
+        except Exception:
+            logger.exception("Dashboard metrics recompute failed")
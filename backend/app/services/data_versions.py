@@ -0,0 +1,56 @@
+from itertools import chain
+from sqlalchemy import event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.models.data_version import DataVersion
+
+UNVERSIONED_TABLES = {"data_versions", "activity_logs", "activity_log_archives", "schema_migrations"}
+
+
+def _written_tables(session: Session) -> set[str]:
+    return session.info.setdefault("written_tables", set())
+
+
+def track_data_versions(session_class: type[Session]):
+    # Tables written through ORM flushes or insert/update/delete statements are collected
+    # per session and their counters bumped just before the commit, so a version only
+    # moves together with the data it covers.
+    @event.listens_for(session_class, "before_flush")
+    def collect_flushed_tables(session, flush_context, instances):
+        written = _written_tables(session)
+        for obj in chain(session.new, session.deleted):
+            written.add(obj.__table__.name)
+        for obj in session.dirty:
+            if session.is_modified(obj):
+                written.add(obj.__table__.name)
+
+    @event.listens_for(session_class, "do_orm_execute")
+    def collect_statement_tables(orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            _written_tables(orm_execute_state.session).add(orm_execute_state.statement.table.name)
+
+    @event.listens_for(session_class, "before_commit")
+    def bump_data_versions(session):
+        session.flush()
+        tables = session.info.pop("written_tables", set()) - UNVERSIONED_TABLES
+        if not tables:
+            return
+        stmt = sqlite_insert(DataVersion).values([{"table_name": name, "version": 1} for name in sorted(tables)])
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=[DataVersion.table_name],
+            set_={"version": DataVersion.version + 1}
+        ))
+        session.info.pop("written_tables", None)
+
+    @event.listens_for(session_class, "after_rollback")
+    def discard_written_tables(session):
+        session.info.pop("written_tables", None)
+
+
+async def get_data_versions(db: AsyncSession, tables: tuple[str, ...]) -> tuple[int, ...]:
+    result = await db.execute(
+        select(DataVersion.table_name, DataVersion.version).where(DataVersion.table_name.in_(tables))
+    )
+    versions = dict(result.all())
+    return tuple(versions.get(name, 0) for name in tables)
@@ -0,0 +1,117 @@
+import asyncio
+from typing import Any
+from pydantic_core import to_json
+from app.core.config import settings
+from app.core.logging import logger
+from app.database.session import AsyncSessionLocal
+from app.services.dashboard_metrics import get_dashboard_metrics
+
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+HEARTBEAT_FRAME = b": keep-alive\n\n"
+DASHBOARD_TOPICS = {"orders"}
+
+
+def sse_frame(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + to_json(data) + b"\n\n"
+
+
+class Subscription:
+    def __init__(self, max_pending: int):
+        self.frames: asyncio.Queue[bytes] = asyncio.Queue(max_pending)
+        self.dropped = 0
+
+    def offer(self, frame: bytes):
+        try:
+            self.frames.put_nowait(frame)
+        except asyncio.QueueFull:
+            # A client this far behind would only replay changes it can no longer act on:
+            # its backlog is replaced by one resync event, after which it refetches.
+            while not self.frames.empty():
+                self.frames.get_nowait()
+                self.dropped += 1
+            self.frames.put_nowait(RESYNC_FRAME)
+
+    async def next_frame(self, timeout: float) -> bytes | None:
+        try:
+            return await asyncio.wait_for(self.frames.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+    def __init__(self, max_pending: int, dashboard_debounce_seconds: float, session_factory=AsyncSessionLocal):
+        self.max_pending = max_pending
+        self.dashboard_debounce_seconds = dashboard_debounce_seconds
+        self.session_factory = session_factory
+        self.subscribers: set[Subscription] = set()
+        self.dashboard_frame: bytes | None = None
+        self.dashboard_generation = 0
+        self.dashboard_refresh: asyncio.Task | None = None
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.max_pending)
+        self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self.subscribers.discard(subscription)
+        if subscription.dropped:
+            logger.info(f"Event stream subscriber dropped {subscription.dropped} events")
+
+    def broadcast(self, frame: bytes):
+        # Frames are encoded once and shared by every subscriber.
+        for subscription in self.subscribers:
+            subscription.offer(frame)
+
+    def publish(self, event: str, data: Any):
+        self.broadcast(sse_frame(event, data))
+
+    def publish_change(self, topic: str, action: str, ids: list[int]):
+        if not ids:
+            return
+        if topic in DASHBOARD_TOPICS:
+            self.dashboard_generation += 1
+            self.dashboard_frame = None
+        if not self.subscribers:
+            return
+        self.publish("change", {"topic": topic, "action": action, "ids": ids})
+        if topic in DASHBOARD_TOPICS:
+            self.schedule_dashboard_refresh()
+
+    def schedule_dashboard_refresh(self):
+        # Bursts of writes share one read of the counters; a write landing during the
+        # read triggers another one.
+        if self.dashboard_refresh is None or self.dashboard_refresh.done():
+            self.dashboard_refresh = asyncio.create_task(self._refresh_dashboard())
+
+    async def _refresh_dashboard(self):
+        published_generation = None
+        while published_generation != self.dashboard_generation:
+            await asyncio.sleep(self.dashboard_debounce_seconds)
+            published_generation = self.dashboard_generation
+            try:
+                frame = sse_frame("dashboard", await self.read_dashboard())
+            except Exception:
+                logger.exception("Dashboard event refresh failed")
+                return
+            self.broadcast(frame)
+            self.keep_dashboard_frame(frame, published_generation)
+
+    async def current_dashboard_frame(self) -> bytes:
+        if self.dashboard_frame is None:
+            generation = self.dashboard_generation
+            frame = sse_frame("dashboard", await self.read_dashboard())
+            self.keep_dashboard_frame(frame, generation)
+            return frame
+        return self.dashboard_frame
+
+    def keep_dashboard_frame(self, frame: bytes, generation: int):
+        # A frame read before the latest write is sent but not kept for new subscribers.
+        if generation == self.dashboard_generation:
+            self.dashboard_frame = frame
+
+    async def read_dashboard(self) -> dict:
+        async with self.session_factory() as session:
+            return await get_dashboard_metrics(session)
+
+event_bus = EventBus(settings.EVENT_STREAM_MAX_PENDING, settings.EVENT_STREAM_DASHBOARD_DEBOUNCE_SECONDS)
@@ -0,0 +1,310 @@
+import codecs
+import csv
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from app.models.customer import Customer
+from app.models.order import Order
+from app.schemas.order import OrderCreate, OrderItemCreate
+from app.services.activity_log import log_activities
+from app.services.event_bus import event_bus
+from app.services.order_service import resolve_products, build_order_item_row, insert_order_items
+from app.services.stock_service import adjust_stock_balances, quantities_by_product
+from app.services.order_rollups import apply_order_changes, order_state
+
+MAX_LINE_LENGTH = 1024 * 1024
+CSV_REQUIRED_COLUMNS = {"order_ref", "customer_id", "product_id", "quantity", "unit_price"}
+
+
+class ImportFormatError(Exception):
+    pass
+
+
+@dataclass
+class _PendingOrder:
+    row: int
+    customer_id: int
+    items: list[OrderItemCreate]
+
+
+@dataclass
+class _CsvGroup:
+    row: int
+    order_ref: str
+    customer_id: int | None = None
+    items: list[OrderItemCreate] = field(default_factory=list)
+    failed: bool = False
+
+
+def _decode(decoder: codecs.IncrementalDecoder, chunk: bytes, line_number: int, final: bool = False) -> str:
+    try:
+        return decoder.decode(chunk, final=final)
+    except UnicodeDecodeError as exc:
+        bad_line = line_number + 1 + exc.object[:exc.start].count(b"\n")
+        raise ImportFormatError(f"Line {bad_line} is not valid UTF-8") from exc
+
+
+async def iter_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_number = 0
+    async for chunk in stream:
+        buffer += _decode(decoder, chunk, line_number)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip("\r")
+        if len(buffer) > MAX_LINE_LENGTH:
+            raise ImportFormatError(f"Line {line_number + 1} exceeds {MAX_LINE_LENGTH} characters")
+    buffer += _decode(decoder, b"", line_number, final=True)
+    if buffer:
+        yield line_number + 1, buffer.rstrip("\r")
+
+
+class _LineFeed:
+    def __init__(self):
+        self.lines = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+def _ends_in_quoted_field(line: str, in_quotes: bool) -> bool:
+    # Follows the default csv dialect: a quote opens a field only at its start, "" inside a
+    # quoted field is an escaped quote, and any other quote is part of the text.
+    if not in_quotes and '"' not in line:
+        return False
+    at_field_start = not in_quotes
+    position = 0
+    while position < len(line):
+        char = line[position]
+        if in_quotes:
+            if char == '"':
+                if line.startswith('"', position + 1):
+                    position += 1
+                else:
+                    in_quotes = False
+        elif char == '"' and at_field_start:
+            in_quotes = True
+        at_field_start = not in_quotes and char == ","
+        position += 1
+    return in_quotes
+
+
+async def iter_csv_rows(lines: AsyncIterator[tuple[int, str]]) -> AsyncIterator[tuple[int, list[str]]]:
+    # A single reader parses the whole stream. It is only advanced once the buffered lines close every
+    # quote, so quoted fields may contain newlines without the reader running dry mid-record.
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    row_number = None
+    row_length = 0
+    in_quotes = False
+    async for line_number, line in lines:
+        if row_number is None:
+            if not line.strip():
+                continue
+            row_number, row_length = line_number, 0
+        feed.lines.append(line + "\n")
+        row_length += len(line)
+        in_quotes = _ends_in_quoted_field(line, in_quotes)
+        if in_quotes:
+            if row_length > MAX_LINE_LENGTH:
+                raise ImportFormatError(f"Row {row_number} exceeds {MAX_LINE_LENGTH} characters")
+            continue
+        try:
+            values = next(reader)
+        except csv.Error as exc:
+            raise ImportFormatError(f"Row {row_number}: {exc}") from exc
+        yield row_number, values
+        row_number = None
+    if in_quotes:
+        raise ImportFormatError(f"Row {row_number} has an unterminated quoted field")
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'row'}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+class OrderImporter:
+    def __init__(self, db: AsyncSession, user_id: int, chunk_size: int, max_reported_errors: int):
+        self.db = db
+        self.user_id = user_id
+        self.chunk_size = chunk_size
+        self.max_reported_errors = max_reported_errors
+        self.pending: list[_PendingOrder] = []
+        self.product_names: dict[int, str] = {}
+        self.processed_rows = 0
+        self.imported_orders = 0
+        self.imported_items = 0
+        self.failed_orders = 0
+        self.errors: list[dict] = []
+        self.errors_truncated = False
+
+    def add_error(self, row: int, error: str):
+        if len(self.errors) < self.max_reported_errors:
+            self.errors.append({"row": row, "error": error})
+        else:
+            self.errors_truncated = True
+
+    def reject(self, row: int, error: str):
+        self.failed_orders += 1
+        self.add_error(row, error)
+
+    async def add(self, order: _PendingOrder):
+        self.pending.append(order)
+        if len(self.pending) >= self.chunk_size:
+            await self.flush()
+
+    async def flush(self):
+        chunk, self.pending = self.pending, []
+        if not chunk:
+            return
+
+        product_ids = {item.product_id for order in chunk for item in order.items}
+        unknown_ids = [product_id for product_id in product_ids if product_id not in self.product_names]
+        products = await resolve_products(self.db, unknown_ids)
+        self.product_names.update((product_id, product.name) for product_id, product in products.items())
+
+        customer_ids = {order.customer_id for order in chunk}
+        result = await self.db.execute(select(Customer.id).where(Customer.id.in_(customer_ids)))
+        existing_customers = set(result.scalars().all())
+
+        accepted = []
+        for pending in chunk:
+            if pending.customer_id not in existing_customers:
+                self.reject(pending.row, f"Customer {pending.customer_id} not found")
+                continue
+            missing = next((item.product_id for item in pending.items if item.product_id not in self.product_names), None)
+            if missing is not None:
+                self.reject(pending.row, f"Product {missing} not found")
+                continue
+            accepted.append(pending)
+
+        if not accepted:
+            return
+
+        orders = [
+            Order(
+                customer_id=pending.customer_id,
+                created_by=self.user_id,
+                total_amount=sum(item.quantity * item.unit_price for item in pending.items),
+                item_count=len(pending.items)
+            )
+            for pending in accepted
+        ]
+        try:
+            self.db.add_all(orders)
+            await self.db.flush()
+            item_rows = [
+                build_order_item_row(order.id, item, self.product_names[item.product_id])
+                for order, pending in zip(orders, accepted)
+                for item in pending.items
+            ]
+            await insert_order_items(self.db, item_rows)
+            await adjust_stock_balances(
+                self.db,
+                reserved_deltas=quantities_by_product((row["product_id"], row["quantity"]) for row in item_rows)
+            )
+            await apply_order_changes(self.db, [(None, order_state(order)) for order in orders])
+            await log_activities(self.db, [
+                {
+                    "table_name": "orders",
+                    "record_id": order.id,
+                    "action": "created",
+                    "user_id": self.user_id,
+                    "details": f"Imported from row {pending.row}"
+                }
+                for order, pending in zip(orders, accepted)
+            ])
+            await self.db.commit()
+        except SQLAlchemyError as exc:
+            await self.db.rollback()
+            for pending in accepted:
+                self.reject(pending.row, f"Database error: {exc.__class__.__name__}")
+            return
+        finally:
+            self.db.expunge_all()
+
+        self.imported_orders += len(orders)
+        self.imported_items += len(item_rows)
+        event_bus.publish_change("orders", "created", [order.id for order in orders])
+
+    async def import_ndjson(self, lines: AsyncIterator[tuple[int, str]]):
+        async for line_number, line in lines:
+            if not line.strip():
+                continue
+            self.processed_rows += 1
+            try:
+                order_data = OrderCreate.model_validate_json(line)
+            except ValidationError as exc:
+                self.reject(line_number, _format_validation_error(exc))
+                continue
+            await self.add(_PendingOrder(row=line_number, customer_id=order_data.customer_id, items=order_data.items))
+        await self.flush()
+
+    async def import_csv(self, lines: AsyncIterator[tuple[int, str]]):
+        # Consecutive rows sharing an order_ref form one order; an invalid row rejects its whole order.
+        header = None
+        group = None
+        async for line_number, values in iter_csv_rows(lines):
+            if header is None:
+                header = [column.strip() for column in values]
+                missing_columns = CSV_REQUIRED_COLUMNS - set(header)
+                if missing_columns:
+                    raise ImportFormatError(f"Missing CSV columns: {', '.join(sorted(missing_columns))}")
+                continue
+
+            self.processed_rows += 1
+            row = dict(zip(header, values))
+            order_ref = row.get("order_ref", "")
+            if group is None or group.order_ref != order_ref:
+                await self._finish_csv_group(group)
+                group = _CsvGroup(row=line_number, order_ref=order_ref)
+            if group.failed:
+                continue
+
+            try:
+                customer_id = int(row.get("customer_id", ""))
+                item = OrderItemCreate.model_validate(row)
+            except ValueError as exc:
+                message = _format_validation_error(exc) if isinstance(exc, ValidationError) else "customer_id: invalid integer"
+                group.failed = True
+                self.reject(line_number, message)
+                continue
+
+            if group.customer_id is None:
+                group.customer_id = customer_id
+            elif group.customer_id != customer_id:
+                group.failed = True
+                self.reject(line_number, f"Order {order_ref} has rows for different customers")
+                continue
+            group.items.append(item)
+
+        await self._finish_csv_group(group)
+        await self.flush()
+
+    async def _finish_csv_group(self, group: _CsvGroup | None):
+        if group is not None and not group.failed:
+            await self.add(_PendingOrder(row=group.row, customer_id=group.customer_id, items=group.items))
+
+    def report(self) -> dict:
+        return {
+            "processed_rows": self.processed_rows,
+            "imported_orders": self.imported_orders,
+            "imported_items": self.imported_items,
+            "failed_orders": self.failed_orders,
+            "errors": self.errors,
+            "errors_truncated": self.errors_truncated
+        }
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, replace
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.dashboard_metrics import apply_dashboard_deltas
+from app.services.customer_revenue import apply_customer_revenue_deltas
+from app.services.daily_sales import apply_daily_sales_deltas, order_changes_to_daily_deltas
+
+
+@dataclass(frozen=True)
+class OrderState:
+    order_id: int
+    customer_id: int
+    created_at: datetime
+    total_amount: float
+    paid_amount: float
+    is_delivered: bool
+    is_cancelled: bool
+
+
+def order_state(order) -> OrderState:
+    # Accepts an Order or any row exposing the same column names.
+    return OrderState(
+        order_id=order.id,
+        customer_id=order.customer_id,
+        created_at=order.created_at,
+        total_amount=order.total_amount,
+        paid_amount=order.paid_amount,
+        is_delivered=order.delivered_at is not None,
+        is_cancelled=order.is_cancelled
+    )
+
+
+def with_changes(state: OrderState, **changes) -> OrderState:
+    return replace(state, **changes)
+
+
+async def apply_order_changes(
+    db: AsyncSession,
+    changes: list[tuple[OrderState | None, OrderState | None]],
+    at: datetime | None = None
+):
+    # Every write path that changes an order's totals or lifecycle reports the
+    # order state before and after; rollups apply the difference in the same transaction.
+    changes = [(before, after) for before, after in changes if before != after]
+    if not changes:
+        return
+    await apply_dashboard_deltas(db, changes)
+    await apply_customer_revenue_deltas(db, changes)
+    await apply_daily_sales_deltas(db, order_changes_to_daily_deltas(changes, at or datetime.utcnow()))
@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert
+from app.models.order import Order, OrderItem
+from app.models.product import Product
+from app.schemas.order import OrderItemCreate
+
+
+@dataclass
+class OrderItemDiff:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    total_amount: float = 0.0
+    item_count: int = 0
+
+
+@dataclass
+class _LineMatch:
+    requested: OrderItemCreate
+    existing: OrderItem | None = None
+
+
+async def resolve_products(db: AsyncSession, product_ids: list[int]) -> dict[int, Product]:
+    unique_ids = set(product_ids)
+    if not unique_ids:
+        return {}
+    result = await db.execute(select(Product).where(Product.id.in_(unique_ids)))
+    return {product.id: product for product in result.scalars().all()}
+
+
+def find_missing_product_id(items: list[OrderItemCreate], products: dict[int, Product]) -> int | None:
+    for item in items:
+        if item.product_id not in products:
+            return item.product_id
+    return None
+
+
+def build_order_item_row(order_id: int, item: OrderItemCreate, product_name: str) -> dict:
+    return {
+        "order_id": order_id,
+        "product_id": item.product_id,
+        "product_name_snapshot": product_name,
+        "quantity": item.quantity,
+        "unit_price": item.unit_price,
+        "total_price": item.quantity * item.unit_price
+    }
+
+
+async def insert_order_items(db: AsyncSession, rows: list[dict]):
+    if rows:
+        await db.execute(insert(OrderItem), rows)
+
+
+async def create_order_items(
+    db: AsyncSession,
+    order: Order,
+    items: list[OrderItemCreate],
+    products: dict[int, Product]
+) -> OrderItemDiff:
+    rows = [build_order_item_row(order.id, item, products[item.product_id].name) for item in items]
+    await insert_order_items(db, rows)
+    return OrderItemDiff(
+        inserted=len(rows),
+        total_amount=sum(row["total_price"] for row in rows),
+        item_count=len(rows)
+    )
+
+
+def _match_lines(existing_items: list[OrderItem], items: list[OrderItemCreate]) -> tuple[list[_LineMatch], list[OrderItem]]:
+    available: dict[int, list[OrderItem]] = {}
+    for existing in existing_items:
+        available.setdefault(existing.product_id, []).append(existing)
+
+    matches = []
+    for item in items:
+        candidates = available.get(item.product_id)
+        matches.append(_LineMatch(requested=item, existing=candidates.pop(0) if candidates else None))
+
+    leftovers = [existing for candidates in available.values() for existing in candidates]
+    return matches, leftovers
+
+
+async def apply_order_item_diff(
+    db: AsyncSession,
+    order: Order,
+    items: list[OrderItemCreate],
+    products: dict[int, Product]
+) -> OrderItemDiff:
+    # Requested lines are paired with loaded lines of the same product in request
+    # order; only changed pairs are updated, leftovers deleted and the rest bulk-inserted.
+    matches, leftovers = _match_lines(order.items, items)
+    diff = OrderItemDiff(item_count=len(items))
+    new_rows = []
+
+    for match in matches:
+        item = match.requested
+        total_price = item.quantity * item.unit_price
+        diff.total_amount += total_price
+
+        if match.existing is None:
+            new_rows.append(build_order_item_row(order.id, item, products[item.product_id].name))
+        elif match.existing.quantity != item.quantity or match.existing.unit_price != item.unit_price:
+            match.existing.quantity = item.quantity
+            match.existing.unit_price = item.unit_price
+            match.existing.total_price = total_price
+            diff.updated += 1
+        else:
+            diff.unchanged += 1
+
+    for existing in leftovers:
+        order.items.remove(existing)
+    diff.deleted = len(leftovers)
+
+    await db.flush()
+    await insert_order_items(db, new_rows)
+    diff.inserted = len(new_rows)
+    return diff
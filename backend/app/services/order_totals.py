@@ -0,0 +1,57 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func
+from app.models.order import Order, OrderItem
+from app.models.payment import Payment
+
+TOTALS_TOLERANCE = 0.005
+
+
+def _computed_totals():
+    total_amount = (
+        select(func.coalesce(func.sum(OrderItem.total_price), 0.0))
+        .where(OrderItem.order_id == Order.id)
+        .scalar_subquery()
+    )
+    paid_amount = (
+        select(func.coalesce(func.sum(Payment.amount), 0.0))
+        .where(Payment.order_id == Order.id)
+        .scalar_subquery()
+    )
+    item_count = (
+        select(func.count(OrderItem.id))
+        .where(OrderItem.order_id == Order.id)
+        .scalar_subquery()
+    )
+    return total_amount, paid_amount, item_count
+
+
+async def find_order_total_mismatches(db: AsyncSession) -> list[int]:
+    total_amount, paid_amount, item_count = _computed_totals()
+    result = await db.execute(
+        select(Order.id)
+        .where(
+            (func.abs(Order.total_amount - total_amount) > TOTALS_TOLERANCE)
+            | (func.abs(Order.paid_amount - paid_amount) > TOTALS_TOLERANCE)
+            | (Order.item_count != item_count)
+        )
+        .order_by(Order.id)
+    )
+    return list(result.scalars().all())
+
+
+async def reconcile_order_totals(db: AsyncSession) -> list[int]:
+    mismatched_ids = await find_order_total_mismatches(db)
+    if mismatched_ids:
+        total_amount, paid_amount, item_count = _computed_totals()
+        await db.execute(
+            update(Order)
+            .where(Order.id.in_(mismatched_ids))
+            .values(
+                total_amount=total_amount,
+                paid_amount=paid_amount,
+                item_count=item_count,
+                updated_at=Order.updated_at
+            )
+            .execution_options(synchronize_session=False)
+        )
+    return mismatched_ids
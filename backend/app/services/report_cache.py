@@ -0,0 +1,84 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.logging import logger
+from app.database.session import AsyncSessionLocal
+from app.services.data_versions import get_data_versions
+
+ReportComputation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+@dataclass
+class _Report:
+    versions: tuple[int, ...]
+    value: Any
+    stale_since: float | None = None
+
+
+class ReportCache:
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        max_stale_seconds: float,
+        session_factory: Callable = AsyncSessionLocal,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.reports = TTLCache("reports", max_entries, ttl_seconds, clock)
+        self.max_stale_seconds = max_stale_seconds
+        self.session_factory = session_factory
+        self.clock = clock
+        self.in_flight: dict[Hashable, asyncio.Task] = {}
+
+    async def get(self, db: AsyncSession, key: Hashable, tables: tuple[str, ...], compute: ReportComputation) -> Any:
+        return await self.lookup(key, await get_data_versions(db, tables), compute)
+
+    async def lookup(self, key: Hashable, versions: tuple[int, ...], compute: ReportComputation) -> Any:
+        report = self.reports.get(key)
+        if report is not None:
+            if report.versions == versions:
+                return report.value
+            # Written to since it was computed: keep serving it while one refresh runs,
+            # until it has been stale for longer than the bound.
+            now = self.clock()
+            if report.stale_since is None:
+                report.stale_since = now
+            if now - report.stale_since <= self.max_stale_seconds:
+                self.refresh(key, versions, compute)
+                return report.value
+        # Shielded so a client disconnecting does not cancel the computation other
+        # requests are waiting on.
+        return await asyncio.shield(self.refresh(key, versions, compute))
+
+    def refresh(self, key: Hashable, versions: tuple[int, ...], compute: ReportComputation) -> asyncio.Task:
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._compute(key, versions, compute))
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.in_flight[key] = task
+        return task
+
+    async def _compute(self, key: Hashable, versions: tuple[int, ...], compute: ReportComputation) -> Any:
+        # The versions were read before the computation started, so a write that lands
+        # while it runs leaves the entry stale rather than hiding the write.
+        async with self.session_factory() as session:
+            value = await compute(session)
+        self.reports.set(key, _Report(versions, value))
+        return value
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Report {key} failed to compute: {task.exception()!r}")
+
+
+report_cache = ReportCache(
+    settings.REPORT_CACHE_MAX_ENTRIES,
+    settings.REPORT_CACHE_TTL_SECONDS,
+    settings.REPORT_CACHE_MAX_STALE_SECONDS
+)
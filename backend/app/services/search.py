@@ -0,0 +1,108 @@
+import re
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+MAX_SEARCH_TERMS = 8
+MIN_PHONE_DIGITS = 3
+RANK_CANDIDATES = 500
+
+
+def _newest_ranked(fts_table: str, query: str) -> str:
+    return (
+        f"SELECT rowid, rank FROM {fts_table} WHERE {fts_table} MATCH {query} AND rowid >= coalesce(("
+        f"SELECT min(rowid) FROM (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH {query} "
+        f"ORDER BY rowid DESC LIMIT {RANK_CANDIDATES})), 0) ORDER BY rank LIMIT :limit"
+    )
+
+
+def ranked_hits(fts_table: str) -> str:
+    # bm25 is computed for every row it orders, which is too slow for a short prefix that
+    # matches tens of thousands of names; only the newest RANK_CANDIDATES matches (highest
+    # rowids, read straight off the index) are ranked. Rows matching every word exactly are
+    # ranked among their own newest candidates as well, so an older exact match is not cut
+    # off by newer rows that only share the prefix.
+    return (
+        f"(SELECT rowid, min(rank) AS rank FROM ("
+        f"SELECT * FROM ({_newest_ranked(fts_table, ':query')}) UNION ALL "
+        f"SELECT * FROM ({_newest_ranked(fts_table, ':exact_query')})"
+        f") GROUP BY rowid ORDER BY rank LIMIT :limit) AS hits"
+    )
+
+
+def newest_hits(fts_table: str) -> str:
+    # Notes are long and match common words, for which bm25 has to count every matching
+    # row; they are returned newest first instead.
+    return f"(SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :query ORDER BY rowid DESC LIMIT :limit) AS hits"
+
+
+# Every query yields (id, title, detail, order_id, customer_id, score); results are ordered
+# by tier, then by score within it: phone matches, then names by bm25, then notes by age.
+PHONE_QUERY = text(
+    "SELECT customers.id, customers.name AS title, customers.primary_phone AS detail, "
+    "NULL AS order_id, customers.id AS customer_id, hits.rank AS score "
+    f"FROM {ranked_hits('customer_phones_fts')} JOIN customers ON customers.id = hits.rowid"
+)
+
+SEARCH_QUERIES = {
+    "customer": (1, text(
+        "SELECT customers.id, customers.name AS title, customers.primary_phone AS detail, "
+        "NULL AS order_id, customers.id AS customer_id, hits.rank AS score "
+        f"FROM {ranked_hits('customers_fts')} JOIN customers ON customers.id = hits.rowid"
+    )),
+    "product": (1, text(
+        "SELECT products.id, products.name AS title, products.category AS detail, "
+        "NULL AS order_id, NULL AS customer_id, hits.rank AS score "
+        f"FROM {ranked_hits('products_fts')} JOIN products ON products.id = hits.rowid"
+    )),
+    "order_note": (2, text(
+        "SELECT order_notes.id, 'Order #' || order_notes.order_id AS title, order_notes.note AS detail, "
+        "order_notes.order_id, NULL AS customer_id, -julianday(order_notes.created_at) AS score "
+        f"FROM {newest_hits('order_notes_fts')} JOIN order_notes ON order_notes.id = hits.rowid"
+    )),
+    "customer_note": (2, text(
+        "SELECT customer_notes.id, customers.name AS title, customer_notes.note AS detail, "
+        "NULL AS order_id, customers.id AS customer_id, -julianday(customer_notes.created_at) AS score "
+        f"FROM {newest_hits('customer_notes_fts')} JOIN customer_notes ON customer_notes.id = hits.rowid "
+        "JOIN customers ON customers.id = customer_notes.customer_id"
+    )),
+}
+
+
+def match_query(q: str, prefix: bool = True) -> str | None:
+    # Search as you type: the last word is a prefix, the ones before it are complete
+    # words, which FTS5 reads without merging the doclists of every term they start.
+    # Words are quoted so FTS5 operators in the input are searched for literally.
+    terms = re.findall(r"\w+", q.replace("ı", "i"))[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"' for term in terms) + ("*" if prefix else "")
+
+
+def phone_query(q: str) -> str | None:
+    # Input without letters is also looked up as a digit substring of a phone number.
+    if re.search(r"[^\W\d_]", q):
+        return None
+    digits = re.sub(r"\D", "", q)
+    if len(digits) < MIN_PHONE_DIGITS:
+        return None
+    return f'"{digits}"'
+
+
+async def search(db: AsyncSession, q: str, limit: int) -> list[dict]:
+    results = {}
+    phone = phone_query(q)
+    if phone is not None:
+        rows = await db.execute(PHONE_QUERY, {"query": phone, "exact_query": phone, "limit": limit})
+        for row in rows.mappings():
+            results[("customer", row["id"])] = (0, row["score"], {**row, "type": "customer"})
+    
+    query = match_query(q)
+    if query is not None:
+        parameters = {"query": query, "exact_query": match_query(q, prefix=False), "limit": limit}
+        for result_type, (tier, statement) in SEARCH_QUERIES.items():
+            rows = await db.execute(statement, parameters)
+            for row in rows.mappings():
+                results.setdefault((result_type, row["id"]), (tier, row["score"], {**row, "type": result_type}))
+    
+    ranked = sorted(results.values(), key=lambda result: result[:2])[:limit]
+    return [result for _, _, result in ranked]
@@ -1,20 +1,170 @@
+from datetime import datetime
+from typing import Iterable
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.models.stock_movement import StockMovement, MovementType
+from app.models.stock_balance import ProductStockBalance
+from app.models.order import Order, OrderItem
+from app.models.product import Product
+from app.services.daily_sales import record_items_sold
 
 
-async def create_delivery_stock_movement(
+async def create_delivery_stock_movements(
     db: AsyncSession,
-    product_id: int,
-    quantity: int,
-    order_id: int,
+    items: list[tuple[int, int, int]],
     user_id: int
+) -> list[int]:
+    # items are (order_id, product_id, quantity); written with a single executemany
+    # and the product balances are moved from reserved to shipped in the same transaction.
+    if not items:
+        return []
+    result = await db.execute(
+        insert(StockMovement).returning(StockMovement.id, StockMovement.product_id),
+        [
+            {
+                "product_id": product_id,
+                "movement_type": MovementType.DELIVERY,
+                "quantity": -quantity,
+                "order_id": order_id,
+                "created_by": user_id,
+                "description": f"Delivery for order #{order_id}"
+            }
+            for order_id, product_id, quantity in items
+        ]
+    )
+    movements = result.all()
+    last_movement_ids = {}
+    for movement_id, product_id in movements:
+        last_movement_ids[product_id] = max(movement_id, last_movement_ids.get(product_id, 0))
+    
+    shipped = quantities_by_product((product_id, quantity) for _, product_id, quantity in items)
+    await adjust_stock_balances(
+        db,
+        on_hand_deltas={product_id: -quantity for product_id, quantity in shipped.items()},
+        reserved_deltas={product_id: -quantity for product_id, quantity in shipped.items()},
+        last_movement_ids=last_movement_ids
+    )
+    await record_items_sold(db, sum(shipped.values()))
+    return [movement_id for movement_id, _ in movements]
+
+
+def quantities_by_product(pairs: Iterable[tuple[int, int]]) -> dict[int, int]:
+    totals: dict[int, int] = {}
+    for product_id, quantity in pairs:
+        totals[product_id] = totals.get(product_id, 0) + quantity
+    return totals
+
+
+async def adjust_stock_balances(
+    db: AsyncSession,
+    on_hand_deltas: dict[int, int] | None = None,
+    reserved_deltas: dict[int, int] | None = None,
+    last_movement_ids: dict[int, int] | None = None
 ):
-    movement = StockMovement(
-        product_id=product_id,
-        movement_type=MovementType.DELIVERY,
-        quantity=-quantity,
-        order_id=order_id,
-        created_by=user_id,
-        description=f"Delivery for order #{order_id}"
+    on_hand_deltas = on_hand_deltas or {}
+    reserved_deltas = reserved_deltas or {}
+    last_movement_ids = last_movement_ids or {}
+    
+    rows = []
+    for product_id in set(on_hand_deltas) | set(reserved_deltas) | set(last_movement_ids):
+        on_hand = on_hand_deltas.get(product_id, 0)
+        reserved = reserved_deltas.get(product_id, 0)
+        if on_hand == 0 and reserved == 0 and product_id not in last_movement_ids:
+            continue
+        rows.append({
+            "product_id": product_id,
+            "on_hand": on_hand,
+            "reserved": reserved,
+            "available": on_hand - reserved,
+            "last_movement_id": last_movement_ids.get(product_id),
+            "updated_at": datetime.utcnow()
+        })
+    if not rows:
+        return
+    
+    stmt = sqlite_insert(ProductStockBalance)
+    balance = ProductStockBalance.__table__.c
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[balance.product_id],
+            set_={
+                "on_hand": balance.on_hand + stmt.excluded.on_hand,
+                "reserved": balance.reserved + stmt.excluded.reserved,
+                "available": balance.available + stmt.excluded.available,
+                "last_movement_id": func.max(
+                    func.coalesce(balance.last_movement_id, 0),
+                    func.coalesce(stmt.excluded.last_movement_id, 0)
+                ),
+                "updated_at": stmt.excluded.updated_at
+            }
+        ),
+        rows
+    )
+
+
+async def compute_stock_balances(db: AsyncSession) -> dict[int, tuple[int, int, int | None]]:
+    ledger = await db.execute(
+        select(
+            StockMovement.product_id,
+            func.sum(StockMovement.quantity),
+            func.max(StockMovement.id)
+        ).group_by(StockMovement.product_id)
+    )
+    reserved = await db.execute(
+        select(OrderItem.product_id, func.sum(OrderItem.quantity))
+        .join(Order, Order.id == OrderItem.order_id)
+        .where(
+            Order.delivered_at.is_(None),
+            Order.is_cancelled == False
+        )
+        .group_by(OrderItem.product_id)
+    )
+    product_ids = await db.execute(select(Product.id))
+    
+    balances = {product_id: (0, 0, None) for product_id in product_ids.scalars().all()}
+    for product_id, on_hand, last_movement_id in ledger.all():
+        balances[product_id] = (on_hand or 0, 0, last_movement_id)
+    for product_id, reserved_quantity in reserved.all():
+        on_hand, _, last_movement_id = balances.get(product_id, (0, 0, None))
+        balances[product_id] = (on_hand, reserved_quantity or 0, last_movement_id)
+    return balances
+
+
+async def find_stock_balance_mismatches(db: AsyncSession) -> list[int]:
+    expected = await compute_stock_balances(db)
+    result = await db.execute(
+        select(
+            ProductStockBalance.product_id,
+            ProductStockBalance.on_hand,
+            ProductStockBalance.reserved,
+            ProductStockBalance.available
+        )
     )
-    db.add(movement)
+    stored = {row[0]: tuple(row[1:]) for row in result.all()}
+    
+    mismatched = []
+    for product_id in sorted(set(expected) | set(stored)):
+        on_hand, reserved, _ = expected.get(product_id, (0, 0, None))
+        if stored.get(product_id, (0, 0, 0)) != (on_hand, reserved, on_hand - reserved):
+            mismatched.append(product_id)
+    return mismatched
+
+
+async def rebuild_stock_balances(db: AsyncSession) -> int:
+    balances = await compute_stock_balances(db)
+    await db.execute(delete(ProductStockBalance))
+    rows = [
+        {
+            "product_id": product_id,
+            "on_hand": on_hand,
+            "reserved": reserved,
+            "available": on_hand - reserved,
+            "last_movement_id": last_movement_id,
+            "updated_at": datetime.utcnow()
+        }
+        for product_id, (on_hand, reserved, last_movement_id) in balances.items()
+    ]
+    if rows:
+        await db.execute(insert(ProductStockBalance), rows)
+    return len(rows)
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+from itertools import chain
+from sqlalchemy import event, select, update, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from app.models.customer import Customer
+from app.models.order import Order
+from app.models.product import Product
+from app.models.stock_movement import StockMovement
+from app.models.sync_tombstone import SyncTombstone
+
+SYNCED_MODELS = {"orders": Order, "customers": Customer, "products": Product, "stock_movements": StockMovement}
+
+# Child rows are part of their parent's sync payload, so writing one touches the parent.
+SYNC_PARENTS = {
+    "order_items": ("orders", "order_id"),
+    "payments": ("orders", "order_id"),
+    "order_notes": ("orders", "order_id"),
+    "customer_statuses": ("customers", "customer_id"),
+    "customer_notes": ("customers", "customer_id"),
+}
+
+SYNC_FEEDS = {
+    "orders": (Order, Order.updated_at, ("items", "payments", "notes")),
+    "customers": (Customer, Customer.updated_at, ("statuses", "notes")),
+    "products": (Product, Product.updated_at, ()),
+    "stock_movements": (StockMovement, StockMovement.created_at, ()),
+    "deleted": (SyncTombstone, SyncTombstone.deleted_at, ()),
+}
+
+START_POSITION = (datetime.min, 0)
+
+
+def track_sync_changes(session_class: type[Session]):
+    @event.listens_for(session_class, "before_flush")
+    def collect_sync_changes(session, flush_context, instances):
+        touched = session.info.setdefault("touched_parents", {})
+        for obj in chain(session.new, session.dirty, session.deleted):
+            parent = SYNC_PARENTS.get(obj.__table__.name)
+            if parent is not None:
+                parent_table, foreign_key = parent
+                parent_id = getattr(obj, foreign_key)
+                if parent_id is not None:
+                    touched.setdefault(parent_table, set()).add(parent_id)
+        for obj in list(session.deleted):
+            if obj.__table__.name in SYNCED_MODELS:
+                session.add(SyncTombstone(table_name=obj.__table__.name, record_id=obj.id))
+
+    @event.listens_for(session_class, "do_orm_execute")
+    def collect_bulk_inserts(orm_execute_state):
+        statement = orm_execute_state.statement
+        if not orm_execute_state.is_insert or statement.table.name not in SYNC_PARENTS:
+            return
+        parent_table, foreign_key = SYNC_PARENTS[statement.table.name]
+        parameters = orm_execute_state.parameters or []
+        if isinstance(parameters, dict):
+            parameters = [parameters]
+        parent_ids = {row[foreign_key] for row in parameters if row.get(foreign_key) is not None}
+        if parent_ids:
+            touched = orm_execute_state.session.info.setdefault("touched_parents", {})
+            touched.setdefault(parent_table, set()).update(parent_ids)
+
+    @event.listens_for(session_class, "before_commit")
+    def touch_parents(session):
+        session.flush()
+        touched = session.info.pop("touched_parents", None)
+        if not touched:
+            return
+        now = datetime.utcnow()
+        for table_name, record_ids in touched.items():
+            model = SYNCED_MODELS[table_name]
+            session.execute(update(model).where(model.id.in_(record_ids)).values(updated_at=now))
+
+    @event.listens_for(session_class, "after_rollback")
+    def discard_touched_parents(session):
+        session.info.pop("touched_parents", None)
+
+
+async def read_feed(db: AsyncSession, feed: str, position: tuple[datetime, int], limit: int) -> list:
+    model, changed_at, relationships = SYNC_FEEDS[feed]
+    timestamp, record_id = position
+    result = await db.execute(
+        select(model)
+        .where(or_(changed_at > timestamp, and_(changed_at == timestamp, model.id > record_id)))
+        .order_by(changed_at, model.id)
+        .limit(limit + 1)
+        .options(*(selectinload(getattr(model, name)) for name in relationships))
+    )
+    return result.scalars().all()
+
+
+def settle_page(
+    rows: list,
+    changed_at_name: str,
+    position: tuple[datetime, int],
+    has_more: bool,
+    settled_before: datetime
+) -> tuple[list, tuple[datetime, int], bool]:
+    # Timestamps are taken before SQLite hands out the write lock, so a transaction can
+    # commit a little after a newer one. The position never moves past the settle window:
+    # short of a full page, changes inside it are sent again on the next pull, and a full
+    # page reaching into it is cut back to its settled rows, the rest waiting for a later pull.
+    settled = (settled_before, 0)
+    last = (getattr(rows[-1], changed_at_name), rows[-1].id) if rows else None
+    if has_more and last <= settled:
+        return rows, last, True
+    if has_more:
+        rows = [row for row in rows if getattr(row, changed_at_name) < settled_before]
+        return rows, max(position, settled), False
+    return rows, max(position, min(last, settled) if last is not None else settled), False
+
+
+async def get_sync_changes(
+    db: AsyncSession,
+    positions: dict[str, tuple[datetime, int]],
+    limit: int,
+    settle_seconds: float
+) -> tuple[dict[str, list], dict[str, tuple[datetime, int]], bool]:
+    settled_before = datetime.utcnow() - timedelta(seconds=settle_seconds)
+    changes = {}
+    next_positions = {}
+    any_more = False
+    for feed, (_, changed_at, _) in SYNC_FEEDS.items():
+        position = positions.get(feed, START_POSITION)
+        rows = await read_feed(db, feed, position, limit)
+        has_more = len(rows) > limit
+        changes[feed], next_positions[feed], has_more = settle_page(
+            rows[:limit], changed_at.key, position, has_more, settled_before
+        )
+        any_more = any_more or has_more
+    return changes, next_positions, any_more
@@ -0,0 +1,37 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    payload = json.dumps([created_at.isoformat(), record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def encode_positions(positions: dict[str, tuple[datetime, int]]) -> str:
+    payload = json.dumps(
+        {name: [timestamp.isoformat(), record_id] for name, (timestamp, record_id) in positions.items()},
+        separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_positions(cursor: str) -> dict[str, tuple[datetime, int]]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        positions = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            str(name): (datetime.fromisoformat(timestamp), int(record_id))
+            for name, (timestamp, record_id) in positions.items()
+        }
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError("Invalid cursor")
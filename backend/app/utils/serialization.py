@@ -0,0 +1,28 @@
+from typing import Any
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.responses import Response
+
+
+def response_fields(model: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(model.model_fields)
+
+
+def attribute_values(obj: Any, fields: tuple[str, ...], **values) -> dict:
+    # Loaded column values are read straight from the instance dict, which skips the
+    # ORM attribute descriptors; anything not loaded falls back to a normal getattr.
+    state = obj.__dict__
+    return {
+        name: values[name] if name in values else state[name] if name in state else getattr(obj, name)
+        for name in fields
+    }
+
+
+class TrustedJSONResponse(Response):
+    # For content built from database rows that were validated on the way in: pydantic-core
+    # encodes it straight to bytes, and FastAPI skips response_model validation for
+    # Response instances, so the payload is walked only once.
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
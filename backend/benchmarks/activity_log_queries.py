@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Point the app at a throwaway database before anything imports the settings.
+_db_dir = tempfile.mkdtemp(prefix="activity-log-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/benchmark.sqlite"
+
+from httpx import AsyncClient
+from sqlalchemy import insert, text
+from app.database.init_db import init_database
+from app.database.session import AsyncSessionLocal
+from app.main import app
+from app.models.activity_log import ActivityLog
+
+TABLES = ["orders", "customers", "products", "stock_movements", "order_notes"]
+ACTIONS = ["created", "updated", "delivered", "cancelled", "note_added"]
+QUERIES = {
+    "record history": {"table_name": "orders", "record_id": 1234},
+    "user": {"user_id": 1},
+    "action + range": {"action": "cancelled", "created_from": "2024-06-01T00:00:00"},
+    "latest": {},
+}
+
+
+async def seed(rows: int, chunk_size: int = 50000):
+    started_at = datetime(2024, 1, 1)
+    async with AsyncSessionLocal() as session:
+        for offset in range(0, rows, chunk_size):
+            await session.execute(insert(ActivityLog), [
+                {
+                    "table_name": random.choice(TABLES),
+                    "record_id": random.randint(1, 50000),
+                    "action": random.choice(ACTIONS),
+                    "user_id": 1,
+                    "created_at": started_at + timedelta(seconds=number * 15),
+                }
+                for number in range(offset, min(offset + chunk_size, rows))
+            ])
+            await session.commit()
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+
+
+async def print_plans():
+    async with AsyncSessionLocal() as session:
+        plan = await session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM activity_logs WHERE table_name = 'orders' AND record_id = 1234 "
+            "ORDER BY created_at DESC, id DESC LIMIT 51"
+        ))
+        for row in plan:
+            print(f"  plan: {row[-1]}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Time /activity-logs queries against a large log table.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    await init_database()
+    seed_started = time.perf_counter()
+    await seed(args.rows)
+    print(f"Seeded {args.rows} activity log rows in {time.perf_counter() - seed_started:.1f}s")
+    await print_plans()
+
+    async with AsyncClient(app=app, base_url="http://benchmark") as client:
+        response = await client.post("/auth/login", auth=("admin", "admin123"))
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        for label, params in QUERIES.items():
+            latencies = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                response = await client.get("/activity-logs/", params=params, headers=headers)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - started) * 1000)
+            print(f"{label:<16} p50={statistics.median(latencies):6.2f}ms max={max(latencies):6.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+# Point the app at a throwaway database before anything imports the settings.
+_db_dir = tempfile.mkdtemp(prefix="login-storm-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/benchmark.sqlite"
+
+from httpx import AsyncClient
+from app.database.init_db import init_database
+from app.main import app
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def probe_latencies(client: AsyncClient, token: str, stop: asyncio.Event) -> list[float]:
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get("/products/", headers=headers)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.005)
+    return latencies
+
+
+async def measure(client: AsyncClient, token: str, logins: int) -> tuple[list[float], float]:
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_latencies(client, token, stop))
+    started = time.perf_counter()
+    if logins:
+        responses = await asyncio.gather(*(
+            client.post("/auth/login", auth=("admin", "admin123")) for _ in range(logins)
+        ))
+        assert all(response.status_code == 200 for response in responses)
+    else:
+        await asyncio.sleep(1)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    return await probe, elapsed
+
+
+def summarize(label: str, latencies: list[float], elapsed: float):
+    print(
+        f"{label:<12} requests={len(latencies):<5} p50={statistics.median(latencies):7.1f}ms "
+        f"p95={percentile(latencies, 0.95):7.1f}ms max={max(latencies):7.1f}ms wall={elapsed:5.2f}s"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure API latency while a burst of logins is hashing passwords.")
+    parser.add_argument("--logins", type=int, default=50)
+    args = parser.parse_args()
+
+    await init_database()
+    async with AsyncClient(app=app, base_url="http://benchmark") as client:
+        response = await client.post("/auth/login", auth=("admin", "admin123"))
+        token = response.json()["access_token"]
+
+        summarize("idle", *await measure(client, token, 0))
+        summarize(f"{args.logins} logins", *await measure(client, token, args.logins))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.models.order import Order, OrderItem, OrderNote
+from app.models.payment import Payment, PaymentType
+from app.routers.orders import order_response
+from app.schemas.order import OrderPage
+from app.utils.serialization import TrustedJSONResponse
+
+
+def build_orders(count: int, items_per_order: int) -> list[Order]:
+    created_at = datetime(2026, 1, 1)
+    orders = []
+    for order_id in range(1, count + 1):
+        items = [
+            OrderItem(
+                id=order_id * items_per_order + line,
+                product_id=line + 1,
+                product_name_snapshot=f"Product {line + 1}",
+                quantity=line + 1,
+                unit_price=9.5,
+                total_price=9.5 * (line + 1)
+            )
+            for line in range(items_per_order)
+        ]
+        total_amount = sum(item.total_price for item in items)
+        orders.append(Order(
+            id=order_id,
+            customer_id=order_id % 100 + 1,
+            created_by=1,
+            is_cancelled=False,
+            created_at=created_at + timedelta(minutes=order_id),
+            updated_at=created_at + timedelta(minutes=order_id),
+            total_amount=total_amount,
+            paid_amount=total_amount / 2,
+            item_count=len(items),
+            items=items,
+            payments=[Payment(id=order_id, amount=total_amount / 2, payment_type=PaymentType.CASH, received_by=1, created_at=created_at)],
+            notes=[OrderNote(id=order_id, note="Leave at the door", created_by=1, created_at=created_at)]
+        ))
+    return orders
+
+
+def legacy_order_dict(order: Order) -> dict:
+    # The response builder the orders router used before, kept here for comparison.
+    remaining_amount = order.total_amount - order.paid_amount
+    return {
+        **{k: v for k, v in order.__dict__.items() if not k.startswith('_')},
+        "items": order.items,
+        "payments": order.payments,
+        "notes": order.notes,
+        "remaining_amount": remaining_amount,
+        "is_fully_paid": remaining_amount <= 0,
+        "is_delivered": order.delivered_at is not None,
+        "is_fully_completed": order.delivered_at is not None and remaining_amount <= 0
+    }
+
+
+async def legacy_body(orders: list[Order]) -> bytes:
+    # What FastAPI does with a dict returned from a route: validate against the
+    # response model, dump it to JSON-compatible data and encode it with json.
+    field = create_response_field(name="Response_list_orders", type_=OrderPage)
+    content = await serialize_response(
+        field=field,
+        response_content={"items": [legacy_order_dict(order) for order in orders], "next_cursor": None}
+    )
+    return JSONResponse(content).body
+
+
+async def fast_body(orders: list[Order]) -> bytes:
+    return TrustedJSONResponse({"items": [order_response(order) for order in orders], "next_cursor": None}).body
+
+
+async def measure(label: str, render, orders: list[Order], rounds: int) -> bytes:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        body = await render(orders)
+        timings.append((time.perf_counter() - started) * 1000)
+    print(f"{label:<8} median={statistics.median(timings):8.1f}ms min={min(timings):8.1f}ms size={len(body) / 1024:8.0f}KiB")
+    return body
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare the legacy and direct OrderResponse serialization paths.")
+    parser.add_argument("--orders", type=int, default=10000)
+    parser.add_argument("--items", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    orders = build_orders(args.orders, args.items)
+    legacy = await measure("legacy", legacy_body, orders, args.rounds)
+    fast = await measure("direct", fast_body, orders, args.rounds)
+    assert json.loads(legacy) == json.loads(fast), "serialization paths disagree"
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,98 @@
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+# Point the app at a throwaway database before anything imports the settings.
+_db_dir = tempfile.mkdtemp(prefix="search-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/benchmark.sqlite"
+
+from httpx import AsyncClient
+from sqlalchemy import insert, text
+from app.database.init_db import init_database
+from app.database.session import AsyncSessionLocal
+from app.main import app
+from app.models.customer import Customer, CustomerNote
+from app.models.order import OrderNote
+from app.models.product import Product
+
+FIRST_NAMES = ["Ayşe", "Fatma", "Emine", "Hatice", "Zeynep", "Elif", "Mehmet", "Mustafa", "Ahmet", "Ali", "Hüseyin", "Hasan", "İbrahim", "Murat", "Ömer", "Yusuf"]
+LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir", "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara"]
+PRODUCT_WORDS = ["nitrile", "latex", "vinyl", "powder-free", "examination", "surgical", "cleaning", "heavy", "duty", "disposable", "glove", "apron", "mask", "sleeve"]
+CATEGORIES = ["Gloves", "Protective", "Cleaning", "Medical", "Food Service"]
+NOTE_WORDS = ["deliver", "before", "noon", "call", "customer", "door", "payment", "invoice", "cash", "tomorrow", "urgent", "box", "size", "large", "small", "return", "warehouse", "driver"]
+SYLLABLES = ["ka", "le", "mi", "to", "ru", "sa", "ne", "po", "di", "ve"]
+# Note words follow a Zipf-like distribution: a few are in most notes, most are rare.
+VOCABULARY = NOTE_WORDS + [a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES]
+WORD_WEIGHTS = [1 / rank for rank in range(1, len(VOCABULARY) + 1)]
+QUERIES = {
+    "short prefix": "ay",
+    "name": "yilmaz",
+    "two words": "mehmet kaya",
+    "phone digits": "532 41",
+    "note words": "deliver door",
+    "product": "nitrile glo",
+}
+
+
+def phone() -> str:
+    return f"+90 5{random.randint(10, 59)} {random.randint(100, 999)} {random.randint(10, 99)} {random.randint(10, 99)}"
+
+
+def sentence(words: int) -> str:
+    return " ".join(random.choices(VOCABULARY, WORD_WEIGHTS, k=words))
+
+
+async def seed(rows: int, chunk_size: int = 20000):
+    # Each source table gets `rows` rows; the triggers fill the FTS tables as they go.
+    async with AsyncSessionLocal() as session:
+        for offset in range(0, rows, chunk_size):
+            count = min(chunk_size, rows - offset)
+            await session.execute(insert(Customer), [
+                {"name": f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}", "primary_phone": phone()}
+                for _ in range(count)
+            ])
+            await session.execute(insert(Product), [
+                {"name": " ".join(random.sample(PRODUCT_WORDS, 3)), "category": random.choice(CATEGORIES)}
+                for _ in range(count)
+            ])
+            await session.execute(insert(OrderNote), [
+                {"order_id": 1, "note": sentence(8), "created_by": 1} for _ in range(count)
+            ])
+            await session.execute(insert(CustomerNote), [
+                {"customer_id": 1, "note": sentence(8), "created_by": 1} for _ in range(count)
+            ])
+            await session.commit()
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Time /search over seeded customers, products and notes.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    await init_database()
+    seed_started = time.perf_counter()
+    await seed(args.rows)
+    print(f"Seeded {args.rows} rows per table in {time.perf_counter() - seed_started:.1f}s")
+
+    async with AsyncClient(app=app, base_url="http://benchmark") as client:
+        response = await client.post("/auth/login", auth=("admin", "admin123"))
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        for label, q in QUERIES.items():
+            latencies = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                response = await client.get("/search/", params={"q": q}, headers=headers)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - started) * 1000)
+            print(f"{label:<14} p50={statistics.median(latencies):6.2f}ms max={max(latencies):6.2f}ms results={len(response.json())}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
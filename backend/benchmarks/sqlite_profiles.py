@@ -0,0 +1,89 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+async def run_workload(duration: float, writers: int, readers: int) -> dict:
+    from httpx import AsyncClient, ASGITransport
+    from app.database.init_db import init_database
+    from app.database.session import engine
+    from app.main import app
+
+    await init_database()
+    counts = {"writes": 0, "reads": 0, "errors": 0}
+    deadline = time.perf_counter() + duration
+
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        response = await client.post("/auth/login", auth=("admin", "admin123"))
+        client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+        async def writer():
+            while time.perf_counter() < deadline:
+                response = await client.post("/orders/", json={
+                    "customer_id": 1,
+                    "items": [{"product_id": 1, "quantity": 1, "unit_price": 10.0}]
+                })
+                counts["writes" if response.status_code == 201 else "errors"] += 1
+
+        async def reader():
+            while time.perf_counter() < deadline:
+                for path in ("/orders/?limit=50", "/reports/dashboard"):
+                    response = await client.get(path)
+                    counts["reads" if response.status_code == 200 else "errors"] += 1
+
+        await asyncio.gather(*[writer() for _ in range(writers)], *[reader() for _ in range(readers)])
+
+    await engine.dispose()
+    return {name: count / duration for name, count in counts.items()}
+
+
+def run_profile(profile: str, args) -> dict:
+    with tempfile.TemporaryDirectory(prefix="sqlite-profile-") as db_dir:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite+aiosqlite:///{db_dir}/benchmark.sqlite",
+            "SQLITE_PROFILE": profile,
+        }
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.sqlite_profiles", "--run-profile",
+             "--duration", str(args.duration), "--writers", str(args.writers), "--readers", str(args.readers)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare mixed read/write API throughput across SQLite profiles.")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--profiles", nargs="*")
+    parser.add_argument("--run-profile", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_profile:
+        import logging
+        logging.disable(logging.WARNING)
+        print(json.dumps(asyncio.run(run_workload(args.duration, args.writers, args.readers))))
+        return
+
+    from app.database.sqlite_profile import SQLITE_PROFILES
+    for profile in args.profiles or SQLITE_PROFILES:
+        rates = run_profile(profile, args)
+        print(
+            f"{profile:<12} writes/s={rates['writes']:8.1f} reads/s={rates['reads']:8.1f} "
+            f"errors/s={rates['errors']:6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -17,10 +17,24 @@ from app.models.product import Product
 from app.models.order import Order, OrderItem, OrderNote
 from app.models.payment import Payment, PaymentType
 from app.models.stock_movement import StockMovement, MovementType
+from app.models.stock_balance import ProductStockBalance
 from app.models.activity_log import ActivityLog
+from app.models.activity_log_archive import ActivityLogArchive
+from app.models.dashboard_metrics import DashboardMetrics
+from app.models.customer_revenue import CustomerRevenueRollup
+from app.models.daily_sales import DailySales
+from app.models.schema_migration import SchemaMigration
+from app.models.data_version import DataVersion
+from app.models.sync_tombstone import SyncTombstone
+import app.models.search_index
 from app.core.config import settings
 from app.core.security import get_password_hash
 from app.database.session import AsyncSessionLocal
+from app.database.migrate import stamp_migrations
+from app.services.order_totals import reconcile_order_totals
+from app.services.stock_service import rebuild_stock_balances
+from app.services.customer_revenue import rebuild_customer_revenue_rollup
+from app.services.daily_sales import rebuild_daily_sales
 
 
 # Realistic Turkish names and businesses
@@ -160,6 +174,7 @@ async def populate_realistic_data():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+        await stamp_migrations(conn)
     
     async with AsyncSessionLocal() as session:
         print("Creating users...")
@@ -473,6 +488,7 @@ async def populate_realistic_data():
                     elif dice < 0.85:  # 10% cancelled
                         cancel_date = order_date + timedelta(days=random.randint(1, 3))
                         order.is_cancelled = True
+                        order.cancelled_at = cancel_date
                         order.cancelled_by = random.choice(active_users).id
                         order.cancellation_reason = random.choice([
                             "Müşteri vazgeçti",
@@ -635,6 +651,12 @@ async def populate_realistic_data():
             )
             session.add(adjustment_movement)
         
+        await session.flush()
+        await reconcile_order_totals(session)
+        await rebuild_stock_balances(session)
+        await rebuild_customer_revenue_rollup(session)
+        await rebuild_daily_sales(session)
+        
         await session.commit()
         
         print("\n" + "="*60)
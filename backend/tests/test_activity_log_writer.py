@@ -0,0 +1,23 @@
+import pytest
+from app.services.activity_log import ActivityLogWriter
+
+
+class RecordingWriter(ActivityLogWriter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    async def _write(self, batch):
+        self.batches.append(batch)
+
+
+@pytest.mark.asyncio
+async def test_entries_are_batched_and_flushed_on_stop():
+    writer = RecordingWriter(batch_size=3, flush_interval=60, max_queue_size=10)
+    writer.start()
+    for record_id in range(5):
+        await writer.enqueue({"record_id": record_id})
+    await writer.stop()
+
+    assert [len(batch) for batch in writer.batches] == [3, 2]
+    assert not writer.running
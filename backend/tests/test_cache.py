@@ -0,0 +1,31 @@
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_and_count_misses():
+    clock = FakeClock()
+    cache = TTLCache("test_expiry", max_entries=10, ttl_seconds=30, clock=clock)
+    cache.set("token", "alice")
+    assert cache.get("token") == "alice"
+    clock.now = 31
+    assert cache.get("token") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache("test_lru", max_entries=2, ttl_seconds=30, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.discard_where(lambda value: value == 3) == 1
@@ -0,0 +1,13 @@
+from datetime import date
+from app.services.daily_sales import period_start, next_period
+
+
+def test_week_periods_start_on_monday():
+    assert period_start(date(2024, 5, 17), "week") == date(2024, 5, 13)
+    assert next_period(date(2024, 5, 13), "week") == date(2024, 5, 20)
+
+
+def test_month_periods_roll_over_year():
+    assert period_start(date(2024, 12, 31), "month") == date(2024, 12, 1)
+    assert next_period(date(2024, 12, 1), "month") == date(2025, 1, 1)
+    assert next_period(date(2024, 1, 1), "month") == date(2024, 2, 1)
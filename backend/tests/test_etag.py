@@ -0,0 +1,11 @@
+from app.core.etag import etag_for, etag_matches
+
+
+def test_etag_matches_any_listed_or_weak_tag():
+    etag = etag_for((3, 1, 7))
+    assert etag == '"3-1-7"'
+    assert etag_matches('"1-1-1", "3-1-7"', etag)
+    assert etag_matches('W/"3-1-7"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"3-1-8"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,41 @@
+import pytest
+from app.services.event_bus import EventBus, RESYNC_FRAME, sse_frame
+
+
+class DashboardBus(EventBus):
+    def __init__(self):
+        super().__init__(max_pending=3, dashboard_debounce_seconds=0)
+        self.reads = 0
+
+    async def read_dashboard(self) -> dict:
+        self.reads += 1
+        return {"pending_deliveries_count": self.reads}
+
+
+def drain(subscription) -> list[bytes]:
+    return [subscription.frames.get_nowait() for _ in range(subscription.frames.qsize())]
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_backlog_collapses_to_resync():
+    bus = DashboardBus()
+    subscription = bus.subscribe()
+    for movement_id in range(5):
+        bus.publish_change("stock_movements", "created", [movement_id])
+    assert drain(subscription) == [
+        RESYNC_FRAME,
+        sse_frame("change", {"topic": "stock_movements", "action": "created", "ids": [4]})
+    ]
+    assert subscription.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_order_changes_share_one_dashboard_refresh():
+    bus = DashboardBus()
+    subscription = bus.subscribe()
+    bus.publish_change("orders", "created", [1])
+    bus.publish_change("orders", "delivered", [1])
+    await bus.dashboard_refresh
+    assert bus.reads == 1
+    assert drain(subscription)[-1] == sse_frame("dashboard", {"pending_deliveries_count": 1})
+    assert await bus.current_dashboard_frame() == sse_frame("dashboard", {"pending_deliveries_count": 1})
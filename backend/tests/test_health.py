@@ -9,3 +9,11 @@ async def test_health_check():
         response = await client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_monitoring_endpoints_require_credentials():
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        for path in ("/metrics", "/health/caches"):
+            response = await client.get(path)
+            assert response.status_code == 403
@@ -0,0 +1,27 @@
+import json
+import logging
+from app.core.logging import JsonFormatter, SamplingFilter
+
+
+def _record(level: int, message: str, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app", level, __file__, 1, message, None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampling_filter_keeps_configured_fraction_per_level():
+    sampler = SamplingFilter({"info": 0.25})
+    kept = [sampler.filter(_record(logging.INFO, "request")) for _ in range(8)]
+    warnings = [sampler.filter(_record(logging.WARNING, "slow")) for _ in range(3)]
+
+    assert kept == [True, False, False, False, True, False, False, False]
+    assert all(warnings)
+
+
+def test_json_formatter_includes_extra_fields():
+    entry = json.loads(JsonFormatter().format(_record(logging.INFO, "GET /orders 200", status=200, queries=3)))
+
+    assert entry["level"] == "INFO"
+    assert entry["message"] == "GET /orders 200"
+    assert entry["status"] == 200
+    assert entry["queries"] == 3
@@ -0,0 +1,28 @@
+from app.core.metrics import Counter, Histogram, MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0), metrics=registry)
+    child = latency.labels("/orders/{order_id}")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        child.observe(value)
+
+    assert registry.render().splitlines() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/orders/{order_id}",le="0.1"} 2',
+        'latency_seconds_bucket{route="/orders/{order_id}",le="1.0"} 3',
+        'latency_seconds_bucket{route="/orders/{order_id}",le="+Inf"} 4',
+        'latency_seconds_sum{route="/orders/{order_id}"} 3.65',
+        'latency_seconds_count{route="/orders/{order_id}"} 4',
+    ]
+
+
+def test_labels_returns_the_same_child_and_escapes_values():
+    registry = MetricsRegistry()
+    requests = Counter("requests_total", "Requests.", ("path",), metrics=registry)
+    assert requests.labels('a"b') is requests.labels('a"b')
+    requests.labels('a"b').inc()
+
+    assert 'requests_total{path="a\\"b"} 1' in registry.render()
@@ -0,0 +1,126 @@
+import sqlite3
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database.migrate import create_migration_engine, load_migrations, upgrade
+from app.services.customer_revenue import find_customer_revenue_mismatches
+from app.services.daily_sales import find_daily_sales_mismatches
+from app.services.order_totals import find_order_total_mismatches
+from app.services.stock_service import find_stock_balance_mismatches
+
+# The tables init_db created before migrations were introduced.
+BASELINE_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER NOT NULL PRIMARY KEY, username VARCHAR(100) NOT NULL, hashed_password VARCHAR(255) NOT NULL,
+    full_name VARCHAR(255) NOT NULL, is_active BOOLEAN NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL
+);
+CREATE UNIQUE INDEX ix_users_username ON users (username);
+CREATE TABLE customers (
+    id INTEGER NOT NULL PRIMARY KEY, name VARCHAR(255) NOT NULL, primary_phone VARCHAR(50) NOT NULL,
+    additional_phones TEXT, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL
+);
+CREATE TABLE products (
+    id INTEGER NOT NULL PRIMARY KEY, name VARCHAR(255) NOT NULL, category VARCHAR(100) NOT NULL,
+    is_active BOOLEAN NOT NULL, cost_metadata TEXT, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL
+);
+CREATE TABLE customer_statuses (
+    id INTEGER NOT NULL PRIMARY KEY, customer_id INTEGER NOT NULL REFERENCES customers (id), status VARCHAR(50) NOT NULL,
+    assigned_at DATETIME NOT NULL, assigned_by INTEGER NOT NULL REFERENCES users (id)
+);
+CREATE TABLE customer_notes (
+    id INTEGER NOT NULL PRIMARY KEY, customer_id INTEGER NOT NULL REFERENCES customers (id), note TEXT NOT NULL,
+    created_by INTEGER NOT NULL REFERENCES users (id), created_at DATETIME NOT NULL
+);
+CREATE TABLE orders (
+    id INTEGER NOT NULL PRIMARY KEY, customer_id INTEGER NOT NULL REFERENCES customers (id),
+    created_by INTEGER NOT NULL REFERENCES users (id), updated_by INTEGER REFERENCES users (id),
+    cancelled_by INTEGER REFERENCES users (id), cancellation_reason TEXT, delivered_at DATETIME,
+    delivered_by INTEGER REFERENCES users (id), is_cancelled BOOLEAN NOT NULL, created_at DATETIME NOT NULL,
+    updated_at DATETIME NOT NULL
+);
+CREATE TABLE activity_logs (
+    id INTEGER NOT NULL PRIMARY KEY, table_name VARCHAR(100) NOT NULL, record_id INTEGER NOT NULL,
+    action VARCHAR(255) NOT NULL, user_id INTEGER NOT NULL REFERENCES users (id), created_at DATETIME NOT NULL, details TEXT
+);
+CREATE TABLE order_items (
+    id INTEGER NOT NULL PRIMARY KEY, order_id INTEGER NOT NULL REFERENCES orders (id),
+    product_id INTEGER NOT NULL REFERENCES products (id), product_name_snapshot VARCHAR(255) NOT NULL,
+    quantity INTEGER NOT NULL, unit_price FLOAT NOT NULL, total_price FLOAT NOT NULL
+);
+CREATE TABLE order_notes (
+    id INTEGER NOT NULL PRIMARY KEY, order_id INTEGER NOT NULL REFERENCES orders (id), note TEXT NOT NULL,
+    created_by INTEGER NOT NULL REFERENCES users (id), created_at DATETIME NOT NULL
+);
+CREATE TABLE payments (
+    id INTEGER NOT NULL PRIMARY KEY, order_id INTEGER NOT NULL REFERENCES orders (id), amount FLOAT NOT NULL,
+    payment_type VARCHAR(8) NOT NULL, received_by INTEGER NOT NULL REFERENCES users (id), created_at DATETIME NOT NULL
+);
+CREATE TABLE stock_movements (
+    id INTEGER NOT NULL PRIMARY KEY, product_id INTEGER NOT NULL REFERENCES products (id),
+    movement_type VARCHAR(17) NOT NULL, quantity INTEGER NOT NULL, total_cost FLOAT, average_unit_cost FLOAT,
+    order_id INTEGER REFERENCES orders (id), customer_id INTEGER REFERENCES customers (id), description TEXT,
+    created_by INTEGER NOT NULL REFERENCES users (id), created_at DATETIME NOT NULL
+);
+"""
+
+BASELINE_ROWS = """
+INSERT INTO users VALUES (1, 'admin', 'x', 'Admin', 1, '2024-01-01 08:00:00', '2024-01-01 08:00:00');
+INSERT INTO customers VALUES (1, 'Ayşe Yılmaz', '+90 532 000 00 00', NULL, '2024-01-01 08:00:00', '2024-01-01 08:00:00');
+INSERT INTO products VALUES (1, 'Nitrile glove', 'Gloves', 1, NULL, '2024-01-01 08:00:00', '2024-01-01 08:00:00');
+INSERT INTO stock_movements VALUES (1, 1, 'PURCHASE', 100, 500.0, 5.0, NULL, NULL, NULL, 1, '2024-01-01 09:00:00');
+INSERT INTO orders VALUES (1, 1, 1, NULL, NULL, NULL, '2024-01-02 12:00:00', 1, 0, '2024-01-02 10:00:00', '2024-01-02 12:00:00');
+INSERT INTO order_items VALUES (1, 1, 1, 'Nitrile glove', 3, 10.0, 30.0);
+INSERT INTO payments VALUES (1, 1, 20.0, 'CASH', 1, '2024-01-02 11:00:00');
+INSERT INTO stock_movements VALUES (2, 1, 'DELIVERY', -3, NULL, NULL, 1, 1, NULL, 1, '2024-01-02 12:00:00');
+INSERT INTO orders VALUES (2, 1, 1, 1, 1, 'Duplicate', NULL, NULL, 1, '2024-01-02 10:30:00', '2024-01-05 09:00:00');
+INSERT INTO order_items VALUES (2, 2, 1, 'Nitrile glove', 1, 10.0, 10.0);
+INSERT INTO activity_logs VALUES (1, 'orders', 2, 'cancelled', 1, '2024-01-03 15:00:00', NULL);
+"""
+
+
+def test_migrations_are_ordered_and_unique():
+    versions = [migration.version for migration in load_migrations()]
+    assert versions == sorted(versions)
+    assert len(versions) == len(set(versions))
+    assert versions[0] == "0001"
+
+
+@pytest.mark.asyncio
+async def test_upgrade_brings_a_baseline_database_to_head(tmp_path):
+    database_path = tmp_path / "baseline.sqlite"
+    with sqlite3.connect(database_path) as conn:
+        conn.executescript(BASELINE_SCHEMA + BASELINE_ROWS)
+
+    engine = create_migration_engine(f"sqlite+aiosqlite:///{database_path}")
+    try:
+        applied = await upgrade(engine)
+        assert [migration.version for migration in applied] == [migration.version for migration in load_migrations()]
+        assert await upgrade(engine) == []
+
+        async with engine.connect() as conn:
+            order_columns = await conn.run_sync(
+                lambda sync_conn: {column["name"] for column in inspect(sync_conn).get_columns("orders")}
+            )
+            assert {"total_amount", "paid_amount", "item_count", "cancelled_at"} <= order_columns
+            orders = (await conn.execute(text(
+                "SELECT id, total_amount, paid_amount, item_count, cancelled_at FROM orders ORDER BY id"
+            ))).all()
+            assert [tuple(row) for row in orders] == [
+                (1, 30.0, 20.0, 1, None),
+                (2, 10.0, 0.0, 1, "2024-01-03 15:00:00")
+            ]
+            cancellations = (await conn.execute(text(
+                "SELECT day, orders_cancelled FROM daily_sales WHERE orders_cancelled > 0"
+            ))).all()
+            assert [tuple(row) for row in cancellations] == [("2024-01-03", 1)]
+
+        async with AsyncSession(bind=engine) as session:
+            for find_mismatches in (
+                find_order_total_mismatches,
+                find_stock_balance_mismatches,
+                find_customer_revenue_mismatches,
+                find_daily_sales_mismatches
+            ):
+                assert await find_mismatches(session) == []
+    finally:
+        await engine.dispose()
@@ -0,0 +1,57 @@
+import pytest
+from app.services.order_import import ImportFormatError, iter_csv_rows, iter_lines
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def collect(stream) -> list[tuple[int, str]]:
+    return [line async for line in iter_lines(stream)]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_splits_across_chunks():
+    assert await collect(chunks(b"\xef\xbb\xbfa,b\r\nc", b"\xc3", b"\xa7\n\nd")) == [(1, "a,b"), (2, "cç"), (3, ""), (4, "d")]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_reports_invalid_utf8_line():
+    with pytest.raises(ImportFormatError, match="Line 1 is not valid UTF-8"):
+        await collect(chunks(b"\xff\xfe\x00bad"))
+    with pytest.raises(ImportFormatError, match="Line 3 is not valid UTF-8"):
+        await collect(chunks(b"ok\nok\n\xc3", b"x\n"))
+    with pytest.raises(ImportFormatError, match="Line 2 is not valid UTF-8"):
+        await collect(chunks(b"ok\n\xc3"))
+
+
+async def csv_rows(text: str) -> list[tuple[int, list[str]]]:
+    return [row async for row in iter_csv_rows(iter_lines(chunks(text.encode())))]
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_keep_quoted_newlines_and_start_line():
+    text = 'order_ref,note\n\nA,"first\n\nsecond ""quoted"""\nB,plain\n'
+    assert await csv_rows(text) == [
+        (1, ["order_ref", "note"]),
+        (3, ["A", 'first\n\nsecond "quoted"']),
+        (6, ["B", "plain"])
+    ]
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_reject_unterminated_quote():
+    with pytest.raises(ImportFormatError, match="Row 2 has an unterminated quoted field"):
+        await csv_rows('order_ref,note\nA,"open\nB,x\n')
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_treat_quotes_inside_unquoted_fields_as_text():
+    text = 'order_ref,note\nA,5" pipe\nB,"a ""b"" c" x"\nC,"x,y"\n'
+    assert await csv_rows(text) == [
+        (1, ["order_ref", "note"]),
+        (2, ["A", '5" pipe']),
+        (3, ["B", 'a "b" c x"']),
+        (4, ["C", "x,y"])
+    ]
@@ -0,0 +1,20 @@
+from app.models.order import OrderItem
+from app.schemas.order import OrderItemCreate
+from app.services.order_service import _match_lines
+
+
+def test_match_lines_pairs_by_product_in_order():
+    existing = [
+        OrderItem(id=1, product_id=10, quantity=1, unit_price=2.0),
+        OrderItem(id=2, product_id=20, quantity=3, unit_price=1.0),
+        OrderItem(id=3, product_id=10, quantity=4, unit_price=2.0),
+    ]
+    requested = [
+        OrderItemCreate(product_id=10, quantity=1, unit_price=2.0),
+        OrderItemCreate(product_id=30, quantity=1, unit_price=5.0),
+    ]
+
+    matches, leftovers = _match_lines(existing, requested)
+
+    assert [match.existing.id if match.existing else None for match in matches] == [1, None]
+    assert sorted(item.id for item in leftovers) == [2, 3]
@@ -0,0 +1,21 @@
+import pytest
+from datetime import datetime
+from app.utils.pagination import encode_cursor, decode_cursor, encode_positions, decode_positions
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 17, 9, 30, 12, 345678)
+    cursor = encode_cursor(created_at, 42)
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+def test_invalid_cursor():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_positions_round_trip():
+    positions = {"orders": (datetime(2024, 5, 17, 9, 30), 7), "deleted": (datetime.min, 0)}
+    assert decode_positions(encode_positions(positions)) == positions
+    with pytest.raises(ValueError):
+        decode_positions(encode_cursor(datetime(2024, 5, 17), 1))
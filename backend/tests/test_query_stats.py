@@ -0,0 +1,19 @@
+from app.core.query_stats import QueryStats, fingerprint
+
+
+def test_fingerprint_folds_in_lists_and_whitespace():
+    assert fingerprint("SELECT *\n  FROM payments WHERE order_id IN (?, ?, ?)") == (
+        "SELECT * FROM payments WHERE order_id IN (?...)"
+    )
+    assert fingerprint("SELECT * FROM t WHERE id IN (?,?)") == fingerprint("SELECT * FROM t WHERE id IN (?, ?, ?, ?)")
+
+
+def test_repeated_statements_flag_n_plus_one():
+    stats = QueryStats()
+    for _ in range(5):
+        stats.record("SELECT * FROM order_items WHERE order_id = ?", 0.001)
+    stats.record("SELECT * FROM orders", 0.002)
+
+    assert stats.count == 6
+    assert stats.repeated_statements(5) == [("SELECT * FROM order_items WHERE order_id = ?", 5)]
+    assert stats.server_timing() == 'db;dur=7.0;desc="queries=6"'
@@ -0,0 +1,60 @@
+import asyncio
+from contextlib import asynccontextmanager
+import pytest
+from app.services.report_cache import ReportCache
+
+
+@asynccontextmanager
+async def fake_session():
+    yield None
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation():
+    cache = ReportCache(max_entries=8, ttl_seconds=60, max_stale_seconds=5, session_factory=fake_session)
+    calls = []
+
+    async def compute(session):
+        calls.append(session)
+        await asyncio.sleep(0.01)
+        return {"total": 1}
+
+    results = await asyncio.gather(*(cache.lookup("dashboard", (1,), compute) for _ in range(10)))
+
+    assert results == [{"total": 1}] * 10
+    assert len(calls) == 1
+    assert await cache.lookup("dashboard", (1,), compute) == {"total": 1}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_report_is_served_within_bound_while_refreshing():
+    clock = Clock()
+    cache = ReportCache(max_entries=8, ttl_seconds=60, max_stale_seconds=5, session_factory=fake_session, clock=clock)
+    values = iter(["v1", "v2", "v3"])
+    gate = asyncio.Event()
+
+    async def compute(session):
+        value = next(values)
+        if value != "v1":
+            await gate.wait()
+        return value
+
+    assert await cache.lookup("stock", (1,), compute) == "v1"
+    assert await cache.lookup("stock", (2,), compute) == "v1"
+
+    clock.now = 6
+    waiting = asyncio.ensure_future(cache.lookup("stock", (2,), compute))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    gate.set()
+    assert await waiting == "v2"
+    assert await cache.lookup("stock", (2,), compute) == "v2"
@@ -0,0 +1,56 @@
+import sqlite3
+from app.models.search_index import create_search_index
+from app.services.search import RANK_CANDIDATES, match_query, phone_query, ranked_hits
+
+
+def search_database() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT, primary_phone TEXT, additional_phones TEXT)")
+    conn.execute("CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, category TEXT)")
+    conn.execute("CREATE TABLE order_notes (id INTEGER PRIMARY KEY, note TEXT)")
+    conn.execute("CREATE TABLE customer_notes (id INTEGER PRIMARY KEY, note TEXT)")
+    for statement in create_search_index():
+        conn.execute(statement)
+    return conn
+
+
+def test_match_query_quotes_words_and_prefixes_the_last():
+    assert match_query("Ayşe yıl") == '"Ayşe" "yil"*'
+    assert match_query('name:"x* OR') == '"name" "x" "OR"*'
+    assert match_query("  -- ") is None
+    assert match_query("Ayşe yıl", prefix=False) == '"Ayşe" "yil"'
+
+
+def test_phone_query_only_for_digit_input():
+    assert phone_query("+90 (532) 12") == '"9053212"'
+    assert phone_query("53") is None
+    assert phone_query("ayse 532") is None
+
+
+def test_triggers_keep_index_in_sync():
+    conn = search_database()
+
+    def matches(table: str, query: str) -> list[int]:
+        return [row[0] for row in conn.execute(f"SELECT rowid FROM {table} WHERE {table} MATCH ?", (query,))]
+
+    conn.execute("INSERT INTO customers VALUES (7, 'Ayşe Yılmaz', '+90 532 123 45 67', NULL)")
+    assert matches("customers_fts", '"yilmaz"') == [7]
+    assert matches("customer_phones_fts", '"3212345"') == [7]
+    conn.execute("UPDATE customers SET name = 'Ayşe Kaya' WHERE id = 7")
+    assert matches("customers_fts", '"yilmaz"') == []
+    assert matches("customers_fts", '"kaya"') == [7]
+    conn.execute("DELETE FROM customers WHERE id = 7")
+    assert matches("customers_fts", '"kaya"') == []
+    assert matches("customer_phones_fts", '"3212345"') == []
+
+
+def test_ranked_hits_keep_older_exact_matches():
+    conn = search_database()
+    conn.execute("INSERT INTO customers (name) VALUES ('Ay Kaya')")
+    conn.executemany("INSERT INTO customers (name) VALUES (?)", [("Ayşe Demir",)] * (RANK_CANDIDATES + 10))
+
+    rows = conn.execute(
+        f"SELECT rowid FROM {ranked_hits('customers_fts')}",
+        {"query": match_query("ay"), "exact_query": match_query("ay", prefix=False), "limit": 5}
+    ).fetchall()
+    assert rows[0] == (1,)
@@ -0,0 +1,14 @@
+from datetime import datetime
+from app.models.payment import Payment, PaymentType
+from app.schemas.order import PaymentResponse
+from app.utils.serialization import TrustedJSONResponse, attribute_values, response_fields
+
+
+def test_attribute_values_follow_schema_field_order():
+    payment = Payment(id=7, amount=12.5, payment_type=PaymentType.CASH, received_by=1, created_at=datetime(2026, 1, 2, 3, 4, 5))
+    values = attribute_values(payment, response_fields(PaymentResponse), amount=10.0)
+
+    assert list(values) == ["id", "amount", "payment_type", "received_by", "created_at"]
+    assert TrustedJSONResponse(values).body == (
+        b'{"id":7,"amount":10.0,"payment_type":"cash","received_by":1,"created_at":"2026-01-02T03:04:05"}'
+    )
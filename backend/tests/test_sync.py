@@ -0,0 +1,36 @@
+from datetime import datetime
+from types import SimpleNamespace
+from app.services.sync import START_POSITION, settle_page
+
+SETTLED_BEFORE = datetime(2024, 1, 1, 12, 0, 5)
+
+
+def rows(*seconds: int) -> list:
+    return [
+        SimpleNamespace(id=index, updated_at=datetime(2024, 1, 1, 12, 0, second))
+        for index, second in enumerate(seconds, start=1)
+    ]
+
+
+def test_full_settled_page_continues_after_its_last_row():
+    page = rows(1, 2, 3)
+    assert settle_page(page, "updated_at", START_POSITION, True, SETTLED_BEFORE) == (
+        page, (datetime(2024, 1, 1, 12, 0, 3), 3), True
+    )
+
+
+def test_full_page_reaching_into_the_window_stops_at_it():
+    page = rows(3, 4, 6, 7)
+    assert settle_page(page, "updated_at", START_POSITION, True, SETTLED_BEFORE) == (
+        page[:2], (SETTLED_BEFORE, 0), False
+    )
+
+
+def test_partial_page_is_sent_whole_but_the_position_stays_settled():
+    page = rows(4, 6)
+    assert settle_page(page, "updated_at", START_POSITION, False, SETTLED_BEFORE) == (
+        page, (SETTLED_BEFORE, 0), False
+    )
+    assert settle_page([], "updated_at", (datetime(2024, 1, 1, 12, 0, 9), 4), False, SETTLED_BEFORE) == (
+        [], (datetime(2024, 1, 1, 12, 0, 9), 4), False
+    )
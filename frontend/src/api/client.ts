@@ -1,20 +1,41 @@
-import axios from 'axios'
+import axios, { AxiosResponse, InternalAxiosRequestConfig } from 'axios'
 
-const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000'
+export const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000'
+const RESPONSE_CACHE_MAX_ENTRIES = 50
+
+interface CachedResponse {
+  etag: string
+  data: unknown
+}
+
+// GET responses that carried an ETag, keyed by full URL and kept in least recently used order.
+// They are revalidated with If-None-Match, and a 304 is answered from here.
+const responseCache = new Map<string, CachedResponse>()
 
 const apiClient = axios.create({
   baseURL: API_BASE_URL,
   headers: {
     'Content-Type': 'application/json',
   },
+  validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
 })
 
+const cacheKey = (config: InternalAxiosRequestConfig) =>
+  config.method === 'get' ? apiClient.getUri(config) : null
+
+export const clearResponseCache = () => responseCache.clear()
+
 apiClient.interceptors.request.use(
   (config) => {
     const token = localStorage.getItem('access_token')
     if (token) {
       config.headers.Authorization = `Bearer ${token}`
     }
+    const key = cacheKey(config)
+    const cached = key ? responseCache.get(key) : undefined
+    if (cached) {
+      config.headers['If-None-Match'] = cached.etag
+    }
     return config
   },
   (error) => {
@@ -23,7 +44,27 @@ apiClient.interceptors.request.use(
 )
 
 apiClient.interceptors.response.use(
-  (response) => response,
+  (response: AxiosResponse) => {
+    const key = cacheKey(response.config)
+    if (!key) {
+      return response
+    }
+    const cached = responseCache.get(key)
+    if (response.status === 304 && cached) {
+      responseCache.delete(key)
+      responseCache.set(key, cached)
+      return { ...response, status: 200, data: cached.data }
+    }
+    const etag = response.headers['etag']
+    if (etag) {
+      responseCache.delete(key)
+      responseCache.set(key, { etag, data: response.data })
+      if (responseCache.size > RESPONSE_CACHE_MAX_ENTRIES) {
+        responseCache.delete(responseCache.keys().next().value)
+      }
+    }
+    return response
+  },
   async (error) => {
     const originalRequest = error.config
 
@@ -46,6 +87,7 @@ apiClient.interceptors.response.use(
         originalRequest.headers.Authorization = `Bearer ${access_token}`
         return apiClient(originalRequest)
       } catch (refreshError) {
+        clearResponseCache()
         localStorage.removeItem('access_token')
         localStorage.removeItem('refresh_token')
         window.location.href = '/login'
@@ -0,0 +1,76 @@
+import { API_BASE_URL } from './client'
+import { DashboardReport } from './reports'
+
+export interface ChangeEvent {
+  topic: 'orders' | 'stock_movements'
+  action: string
+  ids: number[]
+}
+
+export interface LiveEventHandlers {
+  dashboard?: (report: DashboardReport) => void
+  change?: (event: ChangeEvent) => void
+  // The server dropped events this client was too slow to read; refetch instead.
+  resync?: () => void
+}
+
+const RECONNECT_DELAY_MS = 5000
+
+// One stream per tab, shared by every subscribed component.
+const subscribers = new Set<LiveEventHandlers>()
+let source: EventSource | null = null
+let reconnectTimer: ReturnType<typeof setTimeout> | null = null
+let lastDashboard: DashboardReport | null = null
+
+const dispatch = (call: (handlers: LiveEventHandlers) => void) => subscribers.forEach(call)
+
+const connect = () => {
+  const token = localStorage.getItem('access_token')
+  if (!token) return
+  source = new EventSource(`${API_BASE_URL}/events/stream?token=${encodeURIComponent(token)}`)
+  source.addEventListener('dashboard', (event) => {
+    const report: DashboardReport = JSON.parse((event as MessageEvent).data)
+    lastDashboard = report
+    dispatch((handlers) => handlers.dashboard?.(report))
+  })
+  source.addEventListener('change', (event) => {
+    const change: ChangeEvent = JSON.parse((event as MessageEvent).data)
+    dispatch((handlers) => handlers.change?.(change))
+  })
+  source.addEventListener('resync', () => dispatch((handlers) => handlers.resync?.()))
+  source.onerror = () => {
+    // EventSource retries dropped connections itself but gives up on an error response,
+    // such as an expired token; reconnect later with whatever token is current then.
+    if (source?.readyState === EventSource.CLOSED && subscribers.size > 0 && !reconnectTimer) {
+      reconnectTimer = setTimeout(() => {
+        reconnectTimer = null
+        if (subscribers.size > 0) {
+          disconnect()
+          connect()
+          dispatch((handlers) => handlers.resync?.())
+        }
+      }, RECONNECT_DELAY_MS)
+    }
+  }
+}
+
+const disconnect = () => {
+  source?.close()
+  source = null
+}
+
+export const subscribeToLiveEvents = (handlers: LiveEventHandlers) => {
+  subscribers.add(handlers)
+  if (!source) {
+    connect()
+  } else if (lastDashboard) {
+    handlers.dashboard?.(lastDashboard)
+  }
+  return () => {
+    subscribers.delete(handlers)
+    if (subscribers.size === 0) {
+      disconnect()
+      lastDashboard = null
+    }
+  }
+}
@@ -31,6 +31,7 @@ export interface Order {
   updated_by: number | null
   cancelled_by: number | null
   cancellation_reason: string | null
+  cancelled_at: string | null
   delivered_at: string | null
   delivered_by: number | null
   is_cancelled: boolean
@@ -41,12 +42,29 @@ export interface Order {
   notes: OrderNote[]
   total_amount: number
   paid_amount: number
+  item_count: number
   remaining_amount: number
   is_fully_paid: boolean
   is_delivered: boolean
   is_fully_completed: boolean
 }
 
+export interface OrderPage {
+  items: Order[]
+  next_cursor: string | null
+}
+
+export interface OrderListParams {
+  limit?: number
+  cursor?: string
+  customer_id?: number
+  is_delivered?: boolean
+  is_paid?: boolean
+  is_cancelled?: boolean
+  created_from?: string
+  created_to?: string
+}
+
 export interface OrderItemCreate {
   product_id: number
   quantity: number
@@ -63,9 +81,19 @@ export interface PaymentCreate {
   payment_type: string
 }
 
+export interface OrderDeliveryOutcome {
+  order_id: number
+  status: 'delivered' | 'not_found' | 'cancelled' | 'already_delivered' | 'conflict'
+}
+
+export interface OrderDeliverBatchResponse {
+  delivered_count: number
+  outcomes: OrderDeliveryOutcome[]
+}
+
 export const ordersApi = {
-  getAll: async (): Promise<Order[]> => {
-    const response = await apiClient.get('/orders/')
+  list: async (params: OrderListParams = {}): Promise<OrderPage> => {
+    const response = await apiClient.get('/orders/', { params })
     return response.data
   },
 
@@ -84,6 +112,11 @@ export const ordersApi = {
     return response.data
   },
 
+  deliverBatch: async (orderIds: number[]): Promise<OrderDeliverBatchResponse> => {
+    const response = await apiClient.post('/orders/deliver-batch', { order_ids: orderIds })
+    return response.data
+  },
+
   cancel: async (id: number, reason: string): Promise<Order> => {
     const response = await apiClient.post(`/orders/${id}/cancel`, {
       cancellation_reason: reason,
@@ -10,6 +10,16 @@ export interface CustomerRevenueReport {
   customer_id: number
   customer_name: string
   total_revenue: number
+  billed_total: number
+  outstanding_balance: number
+  order_count: number
+  last_order_at: string | null
+}
+
+export interface CustomerRevenueParams {
+  limit?: number
+  offset?: number
+  sort_by?: 'total_revenue' | 'outstanding_balance' | 'billed_total' | 'order_count' | 'last_order_at'
 }
 
 export interface StockReport {
@@ -20,14 +30,30 @@ export interface StockReport {
   available_stock: number
 }
 
+export interface SalesTimeseriesPoint {
+  period_start: string
+  billed_total: number
+  collected_total: number
+  items_sold: number
+  orders_created: number
+  orders_delivered: number
+  orders_cancelled: number
+}
+
+export interface SalesTimeseriesParams {
+  from?: string
+  to?: string
+  granularity?: 'day' | 'week' | 'month'
+}
+
 export const reportsApi = {
   getDashboard: async (): Promise<DashboardReport> => {
     const response = await apiClient.get('/reports/dashboard')
     return response.data
   },
 
-  getCustomerRevenue: async (): Promise<CustomerRevenueReport[]> => {
-    const response = await apiClient.get('/reports/customer-revenue')
+  getCustomerRevenue: async (params: CustomerRevenueParams = {}): Promise<CustomerRevenueReport[]> => {
+    const response = await apiClient.get('/reports/customer-revenue', { params })
     return response.data
   },
 
@@ -35,4 +61,9 @@ export const reportsApi = {
     const response = await apiClient.get('/reports/stock')
     return response.data
   },
+
+  getTimeseries: async (params: SalesTimeseriesParams = {}): Promise<SalesTimeseriesPoint[]> => {
+    const response = await apiClient.get('/reports/timeseries', { params })
+    return response.data
+  },
 }
@@ -0,0 +1,136 @@
+import axios from 'axios'
+import apiClient from './client'
+import { Customer } from './customers'
+import { Order } from './orders'
+import { Product } from './products'
+import { StockMovement } from './stock'
+
+export interface SyncTombstone {
+  table_name: string
+  record_id: number
+  deleted_at: string
+}
+
+export interface SyncChanges {
+  orders: Order[]
+  customers: Customer[]
+  products: Product[]
+  stock_movements: StockMovement[]
+  deleted: SyncTombstone[]
+  next_cursor: string
+  has_more: boolean
+}
+
+export interface SyncState {
+  cursor?: string
+  orders: Map<number, Order>
+  customers: Map<number, Customer>
+  products: Map<number, Product>
+  stock_movements: Map<number, StockMovement>
+}
+
+type SyncedTable = 'orders' | 'customers' | 'products' | 'stock_movements'
+
+const SYNCED_TABLES: SyncedTable[] = ['orders', 'customers', 'products', 'stock_movements']
+
+const SYNC_STORAGE_KEY = 'sync_state'
+
+type StoredSyncState = { cursor?: string } & Record<SyncedTable, { id: number }[]>
+
+export const createSyncState = (): SyncState => ({
+  orders: new Map(),
+  customers: new Map(),
+  products: new Map(),
+  stock_movements: new Map(),
+})
+
+export const loadSyncState = (): SyncState => {
+  const state = createSyncState()
+  try {
+    const stored: StoredSyncState | null = JSON.parse(localStorage.getItem(SYNC_STORAGE_KEY) || 'null')
+    if (!stored) return state
+    state.cursor = stored.cursor
+    for (const table of SYNCED_TABLES) {
+      const rows = state[table] as Map<number, { id: number }>
+      for (const row of stored[table] ?? []) {
+        rows.set(row.id, row)
+      }
+    }
+  } catch {
+    return createSyncState()
+  }
+  return state
+}
+
+export const saveSyncState = (state: SyncState) => {
+  const stored = { cursor: state.cursor } as StoredSyncState
+  for (const table of SYNCED_TABLES) {
+    stored[table] = Array.from(state[table].values())
+  }
+  try {
+    localStorage.setItem(SYNC_STORAGE_KEY, JSON.stringify(stored))
+  } catch {
+    // Over the storage quota the state lives in memory only and the next visit starts with a full load.
+    localStorage.removeItem(SYNC_STORAGE_KEY)
+  }
+}
+
+let sharedState: SyncState | null = null
+let pendingPull: Promise<SyncState> | null = null
+
+export const clearSyncState = () => {
+  sharedState = null
+  localStorage.removeItem(SYNC_STORAGE_KEY)
+}
+
+export const syncApi = {
+  getChanges: async (since?: string, limit?: number): Promise<SyncChanges> => {
+    const response = await apiClient.get('/sync/', { params: { since, limit } })
+    return response.data
+  },
+
+  // Pulls every page since the state's cursor and merges it in place. Rows inside the
+  // server's settle window can arrive twice, which the id-keyed maps absorb.
+  pull: async (state: SyncState): Promise<SyncState> => {
+    let changes: SyncChanges
+    do {
+      changes = await syncApi.getChanges(state.cursor)
+      for (const table of SYNCED_TABLES) {
+        const rows = state[table] as Map<number, { id: number }>
+        for (const row of changes[table]) {
+          rows.set(row.id, row)
+        }
+      }
+      for (const tombstone of changes.deleted) {
+        if (SYNCED_TABLES.includes(tombstone.table_name as SyncedTable)) {
+          state[tombstone.table_name as SyncedTable].delete(tombstone.record_id)
+        }
+      }
+      state.cursor = changes.next_cursor
+    } while (changes.has_more)
+    return state
+  },
+}
+
+// Every page shares one persisted state; concurrent callers wait on the pull already running.
+export const pullSharedSyncState = (): Promise<SyncState> => {
+  if (!pendingPull) {
+    const state = (sharedState ??= loadSyncState())
+    pendingPull = syncApi
+      .pull(state)
+      .catch((error) => {
+        // A cursor from an older server version is rejected; start over with a full load.
+        if (!axios.isAxiosError(error) || error.response?.status !== 400) throw error
+        sharedState = createSyncState()
+        return syncApi.pull(sharedState)
+      })
+      .then((pulled) => {
+        saveSyncState(pulled)
+        return pulled
+      })
+      .finally(() => {
+        pendingPull = null
+      })
+  }
+  return pendingPull
+}
@@ -1,5 +1,7 @@
 import { createContext, useContext, useState, useEffect, ReactNode } from 'react'
 import { authApi, LoginCredentials } from '@/api/auth'
+import { clearResponseCache } from '@/api/client'
+import { clearSyncState } from '@/api/sync'
 import { usersApi } from '@/api/users'
 import type { User } from '@/api/users'
 
@@ -45,6 +47,8 @@ export function AuthProvider({ children }: { children: ReactNode }) {
   }
 
   const logout = () => {
+    clearResponseCache()
+    clearSyncState()
     localStorage.removeItem('access_token')
     localStorage.removeItem('refresh_token')
     setUser(null)
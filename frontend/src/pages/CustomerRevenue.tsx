@@ -4,17 +4,28 @@ import { reportsApi, CustomerRevenueReport } from '@/api/reports'
 import { Card, CardContent } from '@/components/ui/Card'
 import { formatCurrency } from '@/lib/utils'
 import { toast } from 'sonner'
+import { Button } from '@/components/ui/Button'
 import { ChevronRight } from 'lucide-react'
 
+const PAGE_SIZE = 50
+
 export default function CustomerRevenue() {
   const [report, setReport] = useState<CustomerRevenueReport[]>([])
+  const [totalRevenue, setTotalRevenue] = useState(0)
+  const [hasMore, setHasMore] = useState(false)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   useEffect(() => {
     const fetchReport = async () => {
       try {
-        const data = await reportsApi.getCustomerRevenue()
+        const [data, dashboard] = await Promise.all([
+          reportsApi.getCustomerRevenue({ limit: PAGE_SIZE }),
+          reportsApi.getDashboard(),
+        ])
         setReport(data)
+        setHasMore(data.length === PAGE_SIZE)
+        setTotalRevenue(dashboard.total_revenue)
       } catch (error) {
         toast.error('Failed to load customer revenue report')
       } finally {
@@ -25,12 +36,23 @@ export default function CustomerRevenue() {
     fetchReport()
   }, [])
 
+  const loadMore = async () => {
+    setLoadingMore(true)
+    try {
+      const data = await reportsApi.getCustomerRevenue({ limit: PAGE_SIZE, offset: report.length })
+      setReport((current) => [...current, ...data])
+      setHasMore(data.length === PAGE_SIZE)
+    } catch (error) {
+      toast.error('Failed to load customer revenue report')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   if (loading) {
     return <div className="text-center py-8">Loading...</div>
   }
 
-  const totalRevenue = report.reduce((sum, item) => sum + item.total_revenue, 0)
-
   return (
     <div className="space-y-4">
       <div className="flex items-center justify-between">
@@ -58,8 +80,13 @@ export default function CustomerRevenue() {
                       <h3 className="font-semibold">{item.customer_name}</h3>
                     </div>
                     <p className="text-sm text-muted-foreground">
-                      Customer ID: {item.customer_id}
+                      {item.order_count} orders
                     </p>
+                    {item.outstanding_balance > 0 && (
+                      <p className="text-sm text-destructive">
+                        Outstanding: {formatCurrency(item.outstanding_balance)}
+                      </p>
+                    )}
                   </div>
                   <div className="flex items-center gap-2">
                     <div className="text-right mr-2">
@@ -67,7 +94,7 @@ export default function CustomerRevenue() {
                         {formatCurrency(item.total_revenue)}
                       </p>
                       <p className="text-xs text-muted-foreground">
-                        {((item.total_revenue / totalRevenue) * 100).toFixed(1)}% of total
+                        {totalRevenue > 0 ? ((item.total_revenue / totalRevenue) * 100).toFixed(1) : '0.0'}% of total
                       </p>
                     </div>
                     <ChevronRight className="h-5 w-5 text-muted-foreground" />
@@ -83,6 +110,12 @@ export default function CustomerRevenue() {
             No revenue data available
           </div>
         )}
+
+        {hasMore && (
+          <Button variant="outline" onClick={loadMore} disabled={loadingMore}>
+            {loadingMore ? 'Loading...' : 'Load more'}
+          </Button>
+        )}
       </div>
     </div>
   )
@@ -1,5 +1,6 @@
 import { useEffect, useState } from 'react'
 import { reportsApi, DashboardReport } from '@/api/reports'
+import { subscribeToLiveEvents } from '@/api/events'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/Card'
 import { Package, DollarSign, Clock, CheckCircle } from 'lucide-react'
 import { formatCurrency } from '@/lib/utils'
@@ -22,6 +23,14 @@ export default function Dashboard() {
     }
 
     fetchReport()
+    // Counters are pushed after every order, payment and delivery, so the page never polls.
+    return subscribeToLiveEvents({
+      dashboard: (data) => {
+        setReport(data)
+        setLoading(false)
+      },
+      resync: fetchReport,
+    })
   }, [])
 
   if (loading) {
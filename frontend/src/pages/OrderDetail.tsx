@@ -2,6 +2,7 @@ import { useEffect, useState } from 'react'
 import { useParams, useNavigate } from 'react-router-dom'
 import { ordersApi, Order } from '@/api/orders'
 import { customersApi, Customer } from '@/api/customers'
+import { subscribeToLiveEvents } from '@/api/events'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/Card'
 import { Badge } from '@/components/ui/Badge'
 import { Button } from '@/components/ui/Button'
@@ -40,6 +41,12 @@ export default function OrderDetail() {
 
   useEffect(() => {
     fetchOrder()
+    return subscribeToLiveEvents({
+      change: (event) => {
+        if (event.topic === 'orders' && event.ids.includes(Number(id))) fetchOrder()
+      },
+      resync: fetchOrder,
+    })
   }, [id])
 
   const handleDeliver = async () => {
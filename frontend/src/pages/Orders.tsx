@@ -1,7 +1,9 @@
-import { useEffect, useState } from 'react'
+import { useEffect, useMemo, useState } from 'react'
 import { Link, useNavigate } from 'react-router-dom'
-import { ordersApi, Order } from '@/api/orders'
-import { customersApi, Customer } from '@/api/customers'
+import { Order } from '@/api/orders'
+import { Customer } from '@/api/customers'
+import { pullSharedSyncState } from '@/api/sync'
+import { subscribeToLiveEvents } from '@/api/events'
 import { Card, CardContent } from '@/components/ui/Card'
 import { Badge } from '@/components/ui/Badge'
 import { Button } from '@/components/ui/Button'
@@ -9,22 +11,35 @@ import { formatCurrency, formatDate } from '@/lib/utils'
 import { toast } from 'sonner'
 import { ChevronRight, Plus } from 'lucide-react'
 
+const PAGE_SIZE = 50
+
+type OrderFilter = 'all' | 'pending' | 'delivered'
+
+const matchesFilter = (order: Order, filter: OrderFilter) => {
+  if (filter === 'pending') return !order.is_delivered && !order.is_cancelled
+  if (filter === 'delivered') return order.is_delivered
+  return !order.is_cancelled
+}
+
+const newestFirst = (a: Order, b: Order) =>
+  b.created_at.localeCompare(a.created_at) || b.id - a.id
+
 export default function Orders() {
   const navigate = useNavigate()
-  const [orders, setOrders] = useState<Order[]>([])
-  const [customers, setCustomers] = useState<Customer[]>([])
+  const [allOrders, setAllOrders] = useState<Order[]>([])
+  const [customers, setCustomers] = useState<Map<number, Customer>>(new Map())
+  const [visibleCount, setVisibleCount] = useState(PAGE_SIZE)
   const [loading, setLoading] = useState(true)
-  const [filter, setFilter] = useState<'all' | 'pending' | 'delivered'>('all')
+  const [filter, setFilter] = useState<OrderFilter>('all')
 
   useEffect(() => {
-    const fetchData = async () => {
+    // Orders and customers come from the persisted sync state, so a visit only downloads
+    // what changed since the last one and live events pull just the new delta.
+    const syncOrders = async () => {
       try {
-        const [ordersData, customersData] = await Promise.all([
-          ordersApi.getAll(),
-          customersApi.getAll(),
-        ])
-        setOrders(ordersData)
-        setCustomers(customersData)
+        const state = await pullSharedSyncState()
+        setAllOrders(Array.from(state.orders.values()).sort(newestFirst))
+        setCustomers(new Map(state.customers))
       } catch (error) {
         toast.error('Failed to load orders')
       } finally {
@@ -32,19 +47,30 @@ export default function Orders() {
       }
     }
 
-    fetchData()
+    syncOrders()
+    return subscribeToLiveEvents({
+      change: (event) => {
+        if (event.topic === 'orders') syncOrders()
+      },
+      resync: syncOrders,
+    })
   }, [])
 
+  useEffect(() => {
+    setVisibleCount(PAGE_SIZE)
+  }, [filter])
+
+  const filteredOrders = useMemo(
+    () => allOrders.filter((order) => matchesFilter(order, filter)),
+    [allOrders, filter]
+  )
+  const orders = filteredOrders.slice(0, visibleCount)
+  const hasMore = filteredOrders.length > visibleCount
+
   const getCustomerName = (customerId: number) => {
-    return customers.find((c) => c.id === customerId)?.name || 'Unknown'
+    return customers.get(customerId)?.name || 'Unknown'
   }
 
-  const filteredOrders = orders.filter((order) => {
-    if (filter === 'pending') return !order.is_delivered && !order.is_cancelled
-    if (filter === 'delivered') return order.is_delivered
-    return !order.is_cancelled
-  })
-
   if (loading) {
     return <div className="text-center py-8">Loading...</div>
   }
@@ -95,7 +121,7 @@ export default function Orders() {
       </div>
 
       <div className="grid gap-4">
-        {filteredOrders.map((order) => (
+        {orders.map((order) => (
           <Link key={order.id} to={`/orders/${order.id}`}>
             <Card className="hover:bg-accent transition-colors cursor-pointer">
               <CardContent className="p-4">
@@ -135,11 +161,17 @@ export default function Orders() {
           </Link>
         ))}
 
-        {filteredOrders.length === 0 && (
+        {orders.length === 0 && (
           <div className="text-center py-8 text-muted-foreground">
             No orders found
           </div>
         )}
+
+        {hasMore && (
+          <Button variant="outline" onClick={() => setVisibleCount((count) => count + PAGE_SIZE)}>
+            Load more
+          </Button>
+        )}
       </div>
     </div>
   )
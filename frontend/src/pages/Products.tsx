@@ -11,7 +11,7 @@ import { Plus, Edit } from 'lucide-react'
 
 export default function Products() {
   const [products, setProducts] = useState<Product[]>([])
-  const [stockReport, setStockReport] = useState<StockReport[]>([])
+  const [stockByProduct, setStockByProduct] = useState<Map<number, StockReport>>(new Map())
   const [loading, setLoading] = useState(true)
   const [showCreateModal, setShowCreateModal] = useState(false)
   const [showEditModal, setShowEditModal] = useState(false)
@@ -30,7 +30,7 @@ export default function Products() {
         reportsApi.getStock(),
       ])
       setProducts(productsData)
-      setStockReport(stockData)
+      setStockByProduct(new Map(stockData.map((stock) => [stock.product_id, stock])))
     } catch (error) {
       toast.error('Failed to load products')
     } finally {
@@ -71,8 +71,9 @@ export default function Products() {
     }
   }
 
+  // Balances come from /reports/stock, which reads the maintained product_stock_balance rows.
   const getStockInfo = (productId: number) => {
-    return stockReport.find((s) => s.product_id === productId)
+    return stockByProduct.get(productId)
   }
 
   if (loading) {